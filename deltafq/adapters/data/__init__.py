@@ -1,3 +1,5 @@
 from .yfinance_gateway import YFinanceDataGateway
+from .shm_gateway import SharedMemoryDataGateway
+from .replay_gateway import ReplayDataGateway
 
-__all__ = ["YFinanceDataGateway"]
+__all__ = ["YFinanceDataGateway", "SharedMemoryDataGateway", "ReplayDataGateway"]
@@ -0,0 +1,155 @@
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+import numpy as np
+import pandas as pd
+
+from ...data.formats import format_for
+from ...live.gateways import DataGateway
+from ...live.models import TickData
+from ...live.recorder import read_tick_file
+from ...live.tick_format import TICK_DTYPE, from_ns
+
+_BLOCK = 65_536  # records decoded into Python objects at a time
+
+
+class ReplayDataGateway(DataGateway):
+    """
+    Replays recorded tick files (TickRecorder) or DataStorage price files through the
+    normal tick handler path, for offline load tests and exact incident reproduction.
+
+    Args:
+        path: Tick file (.ticks) or DataStorage price file (.csv / .parquet / .feather,
+            one bar -> one tick at Close).
+        speed: 1.0 = real time, N = N x faster, None or 0 = as fast as possible.
+        symbol: Symbol for price files (default: file name prefix before the first '_').
+    """
+
+    def __init__(self, path: Union[str, Path], speed: Optional[float] = None,
+                 symbol: Optional[str] = None, **kwargs) -> None:
+        """Initialize the gateway."""
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.speed = speed
+        self.symbol = symbol
+        self._symbols: Set[str] = set()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+        self._records: Optional[np.ndarray] = None
+        self.replayed = 0
+        self.logger.info(f"Initialized ReplayDataGateway: {self.path} speed={speed or 'max'}")
+
+    def connect(self) -> bool:
+        """Load the file (tick files are memory-mapped)."""
+        try:
+            self._records = self._load()
+            self.logger.info(f"Loaded {len(self._records)} ticks from {self.path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to load replay file: {e}")
+            return False
+
+    def subscribe(self, symbols: List[str]) -> bool:
+        """Replay only these symbols."""
+        self._symbols.update(symbols)
+        return True
+
+    def unsubscribe(self, symbols: List[str]) -> bool:
+        self._symbols.difference_update(symbols)
+        return True
+
+    def start(self) -> None:
+        """Start replay in a background thread."""
+        if self._running:
+            return
+        if self._records is None and not self.connect():
+            raise RuntimeError(f"Replay file not available: {self.path}")
+        self._running = True
+        self._done.clear()
+        self._thread = threading.Thread(target=self.replay, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop replay."""
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self.logger.info(f"Stopped replay after {self.replayed} ticks")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the replay has finished; returns False on timeout."""
+        return self._done.wait(timeout)
+
+    def replay(self) -> int:
+        """Replay synchronously in the calling thread; returns the number of ticks pushed."""
+        if self._records is None and not self.connect():
+            raise RuntimeError(f"Replay file not available: {self.path}")
+        self._running = True
+        records = self._records
+        speed = self.speed or 0.0
+        wall_start = time.perf_counter()
+        t0 = int(records["timestamp"][0]) if len(records) else 0
+        try:
+            # Decode one block at a time so a memory-mapped recording is never loaded whole
+            for start in range(0, len(records), _BLOCK):
+                if not self._replay_block(np.asarray(records[start:start + _BLOCK]), t0, speed, wall_start):
+                    break
+        finally:
+            self._running = False
+            self._done.set()
+        return self.replayed
+
+    def _replay_block(self, block: np.ndarray, t0: int, speed: float, wall_start: float) -> bool:
+        """Push the ticks of one block of records; False once the replay was stopped."""
+        ts_ns = block["timestamp"].tolist()
+        prices = block["price"].tolist()
+        volumes = block["volume"].tolist()
+        symbols = np.char.decode(block["symbol"], "ascii").tolist()
+        sources = np.char.decode(block["source"], "ascii").tolist()
+        for i in range(len(ts_ns)):
+            if not self._running:
+                return False
+            symbol = symbols[i]
+            if symbol not in self._symbols:
+                continue
+            if speed > 0:
+                delay = (ts_ns[i] - t0) / 1e9 / speed - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+            tick = TickData(
+                symbol=symbol,
+                price=prices[i],
+                timestamp=from_ns(ts_ns[i]),
+                volume=None if volumes[i] < 0 else volumes[i],
+                source=sources[i] or "replay",
+            )
+            if self._tick_handler:
+                self._tick_handler(tick)
+            self.replayed += 1
+        return True
+
+    def _load(self) -> np.ndarray:
+        """TICK_DTYPE records in time order (a read-only memory map for tick files)."""
+        if format_for(self.path) is not None:
+            return self._load_price_file()
+        return read_tick_file(self.path)
+
+    def _load_price_file(self) -> np.ndarray:
+        """One record per bar of a DataStorage price file, read through the shared format layer."""
+        df = format_for(self.path).read(self.path, index=True)
+        index = df.index if isinstance(df.index, pd.DatetimeIndex) else pd.to_datetime(df.index, utc=True)
+        if index.tz is not None:
+            index = index.tz_convert(None)  # naive UTC, like the live gateways
+        ts = index.values.astype("datetime64[ns]").astype(np.int64)
+        order = np.argsort(ts, kind="stable")
+        symbol = self.symbol or self.path.stem.split("_")[0]
+        rec = np.zeros(len(df), dtype=TICK_DTYPE)
+        rec["timestamp"] = ts[order]
+        rec["price"] = df["Close"].to_numpy(dtype=float)[order]
+        rec["volume"] = df["Volume"].fillna(0).to_numpy(dtype=np.int64)[order] if "Volume" in df else -1
+        rec["symbol"] = symbol.encode("ascii")
+        rec["source"] = b"replay"
+        return rec
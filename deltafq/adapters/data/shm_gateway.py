@@ -0,0 +1,85 @@
+import threading
+import time
+from typing import List, Optional, Set
+
+from ...live.gateways import DataGateway
+from ...live.shm_bus import SharedMemoryTickReader
+
+
+class SharedMemoryDataGateway(DataGateway):
+    """
+    Market data gateway reading ticks from a SharedMemoryTickPublisher ring.
+    Lets strategies run in separate processes while one process owns the real feed.
+    """
+
+    def __init__(self, bus_name: str = "deltafq_ticks", interval: float = 0.0005,
+                 from_start: bool = False, **kwargs) -> None:
+        """Initialize the gateway. interval: idle sleep in seconds between empty polls."""
+        super().__init__(**kwargs)
+        self.bus_name = bus_name
+        self.interval = interval
+        self.from_start = from_start
+        self._symbols: Set[str] = set()
+        self._reader: Optional[SharedMemoryTickReader] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.logger.info(f"Initialized SharedMemoryDataGateway on bus '{bus_name}'")
+
+    def connect(self) -> bool:
+        """Attach to the shared-memory ring."""
+        try:
+            if self._reader is None:
+                self._reader = SharedMemoryTickReader(self.bus_name, from_start=self.from_start)
+            self.logger.info(f"Connected to tick bus '{self.bus_name}' (capacity={self._reader.capacity})")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to connect: {e}")
+            return False
+
+    def subscribe(self, symbols: List[str]) -> bool:
+        """Deliver ticks for these symbols."""
+        self._symbols.update(symbols)
+        return True
+
+    def unsubscribe(self, symbols: List[str]) -> bool:
+        """Stop delivering ticks for these symbols."""
+        self._symbols.difference_update(symbols)
+        return True
+
+    def start(self) -> None:
+        """Start the reader thread."""
+        if self._running:
+            return
+        if self._reader is None and not self.connect():
+            raise RuntimeError(f"Tick bus '{self.bus_name}' not available")
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the reader thread and detach."""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self.logger.info("Stopped shared-memory tick reader")
+
+    def _run(self) -> None:
+        """Main loop: drain the ring, sleep only when it is empty."""
+        lost = 0
+        while self._running:
+            ticks = self._reader.poll()
+            if not ticks:
+                time.sleep(self.interval)
+                continue
+            if self._reader.lost != lost:
+                self.logger.warning(f"Tick bus overrun: {self._reader.lost - lost} ticks lost")
+                lost = self._reader.lost
+            for tick in ticks:
+                if tick.symbol in self._symbols and self._tick_handler:
+                    try:
+                        self._tick_handler(tick)
+                    except Exception as e:
+                        self.logger.error(f"Tick handler error for {tick.symbol}: {e}")
@@ -40,6 +40,11 @@ class YFinanceDataGateway(DataGateway):
             self._warm_up(symbol)
         return True
 
+    def unsubscribe(self, symbols: List[str]) -> bool:
+        """Stop polling the given symbols."""
+        self._symbols = [s for s in self._symbols if s not in symbols]
+        return True
+
     def _warm_up(self, symbol: str) -> None:
         """Fetch and push today's historical 1m data to fill charts."""
         self.logger.debug(f"Warming up {symbol} with intraday history...")
@@ -134,7 +139,8 @@ class YFinanceDataGateway(DataGateway):
                         price=float(price), 
                         timestamp=datetime.utcnow(), 
                         volume=int(volume), 
-                        source="yfinance"
+                        source="yfinance",
+                        recv_ns=time.perf_counter_ns(),
                     )
                     if self._tick_handler:
                         self._tick_handler(tick)
@@ -3,7 +3,7 @@ Backtesting module for DeltaFQ.
 """
 
 from .engine import BacktestEngine
-from .performance import PerformanceReporter
+from .performance import PerformanceReporter, StreamingPerformance
 from .metrics import (
     calculate_annualized_return,
     calculate_calmar_ratio,
@@ -19,6 +19,7 @@ from .metrics import (
 __all__ = [
     "BacktestEngine",
     "PerformanceReporter",
+    "StreamingPerformance",
     "calculate_returns",
     "compute_cumulative_returns",
     "compute_drawdown_series",
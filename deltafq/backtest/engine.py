@@ -3,12 +3,13 @@ Backtesting engine for DeltaFQ.
 """
 
 import pandas as pd
-from typing import Dict, Any, Optional, Tuple, List
+from collections import deque
+from typing import Dict, Any, Callable, Deque, Iterable, Optional, Tuple, List
 from ..core.base import BaseComponent
 from ..data import DataFetcher, DataStorage
 from ..strategy.base import BaseStrategy
 from ..trader.engine import ExecutionEngine
-from .performance import PerformanceReporter
+from .performance import PerformanceReporter, StreamingPerformance
 from ..charts.performance import PerformanceChart
 from abc import ABC
 
@@ -17,8 +18,11 @@ class BacktestEngine(BaseComponent, ABC):
     """Backtesting engine for DeltaFQ."""
     
     def __init__(self, initial_capital: float = 1000000, commission: float = 0.001, 
-                 slippage: float = 0.001, data_source: str = "yahoo", **kwargs):
-        """Initialize backtest engine."""
+                 slippage: float = 0.001, data_source: str = "yahoo", use_cache: bool = True, **kwargs):
+        """
+        Initialize backtest engine. use_cache: serve price history from the local gap-filling cache.
+        data_source: "yahoo" or "local" (read saved price files offline, no network).
+        """
         super().__init__(**kwargs)
         self.logger.info("Initializing backtest engine")
         # initialize parameters
@@ -26,9 +30,11 @@ class BacktestEngine(BaseComponent, ABC):
         self.commission = commission
         self.slippage = slippage
         self.data_source = data_source
+        self.use_cache = use_cache
         # initialize components
-        self.data_fetcher = DataFetcher(source=self.data_source)
         self.storage = DataStorage()
+        self.data_fetcher = DataFetcher(source=self.data_source, cache=self.storage if use_cache else False,
+                                        data_dir=self.storage.price_dir, memo=True)
         self.reporter = PerformanceReporter()
         self.chart = PerformanceChart()
         # initialize execution engine
@@ -48,6 +54,7 @@ class BacktestEngine(BaseComponent, ABC):
         self.price_series = None
         self.trades_df = pd.DataFrame()
         self.values_df = pd.DataFrame()
+        self.run_metrics: Dict[str, Any] = {}
         
     def set_parameters(self, symbol: str, start_date: str, end_date: Optional[str] = None, benchmark: Optional[str] = None, 
                       data_source: Optional[str] = "yahoo", initial_capital: Optional[float] = 1000000, 
@@ -75,7 +82,8 @@ class BacktestEngine(BaseComponent, ABC):
         # Only recreate DataFetcher if data_source changed
         if data_source is not None and data_source != self.data_source:
             self.data_source = data_source
-            self.data_fetcher = DataFetcher(source=self.data_source)
+            self.data_fetcher = DataFetcher(source=self.data_source, cache=self.storage if self.use_cache else False,
+                                            data_dir=self.storage.price_dir, memo=True)
     
     def load_data(self) -> pd.DataFrame:
         """Load data via data fetcher."""
@@ -83,9 +91,12 @@ class BacktestEngine(BaseComponent, ABC):
         return self.data
     
     def add_strategy(self, strategy: BaseStrategy) -> None:
-        """Add a strategy to the backtest engine."""
+        """Add a strategy to the backtest engine. Incremental strategies are driven bar by bar via on_bar."""
         self.strategy = strategy
-        self.strategy.run(self.data)
+        if self.strategy.supports_on_bar:
+            self.strategy.signals = self.strategy.replay_bars(self.data, symbol=self.symbol)
+        else:
+            self.strategy.run(self.data)
         self.signals = self.strategy.signals
         self.price_series = self.data['Close']
     
@@ -104,52 +115,10 @@ class BacktestEngine(BaseComponent, ABC):
             strategy_name = strategy_name if strategy_name is not None else self.strategy.name
             
             df_sig = pd.DataFrame({'Signal': signals, 'Close': price_series})
-            values_records: List[Dict[str, Any]] = []
-            
-            for i, (date, row) in enumerate(df_sig.iterrows()):
-                signal = row['Signal']
-                price = row['Close']
-                
-                if signal == 1:
-                    max_qty = int(self.execution.cash / (price * (1 + self.commission)))
-                    if max_qty > 0:
-                        self.execution.execute_order(
-                            symbol=symbol,
-                            quantity=max_qty,
-                            order_type="limit",
-                            price=price,
-                            timestamp=date
-                        )
-                        
-                elif signal == -1:
-                    current_qty = self.execution.position_manager.get_position(symbol)
-                    if current_qty > 0:
-                        self.execution.execute_order(
-                            symbol=symbol,
-                            quantity=-current_qty,
-                            order_type="limit",
-                            price=price,
-                            timestamp=date
-                        )
-                
-                position_qty = self.execution.position_manager.get_position(symbol)
-                position_value = position_qty * price
-                total_value = position_value + self.execution.cash
-                daily_pnl = 0.0 if i == 0 else total_value - values_records[-1]['total_value']
-                
-                values_records.append({
-                    'date': date,
-                    'signal': signal,
-                    'price': price,
-                    'cash': self.execution.cash,
-                    'position': position_qty,
-                    'position_value': position_value,
-                    'total_value': total_value,
-                    'daily_pnl': daily_pnl,
-                })
+            values_df, _ = self._replay(symbol, df_sig)
             
             self.trades_df = pd.DataFrame(self.execution.trades)
-            self.values_df = pd.DataFrame(values_records)
+            self.values_df = values_df
             
             if save_csv:
                 self.save_backtest_results()
@@ -160,6 +129,136 @@ class BacktestEngine(BaseComponent, ABC):
             self.logger.error(f"run_backtest error: {e}")
             raise RuntimeError(f"Backtest execution failed: {e}") from e
     
+    def run_backtest_chunked(self, strategy: Optional[BaseStrategy] = None,
+                             chunks: Optional[Iterable[pd.DataFrame]] = None, chunk_size: int = 100_000,
+                             interval: str = "1d", lookback: int = 0, save_csv: bool = False,
+                             strategy_name: Optional[str] = None,
+                             values_sink: Optional[Callable[[pd.DataFrame], Any]] = None,
+                             max_value_records: Optional[int] = 100_000) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Run the backtest over a stream of bar chunks, holding one chunk in memory at a time.
+
+        chunks: OHLCV frames in time order (e.g. storage.iter_price_chunks(...)); by default the
+            symbol/start/end set in set_parameters are streamed via data_fetcher.iter_data_chunks.
+        lookback: bars of history a generate_signals strategy needs (its longest window). The last
+            lookback bars seen, across as many earlier chunks as needed, are prepended to each chunk,
+            so signals match run_backtest when lookback covers the strategy's windows. Incremental
+            strategies (on_bar) keep their own state across chunks and ignore it.
+        values_sink: called with each chunk's values rows (same columns as values_df), e.g. to append
+            them to a file, so the full equity curve never has to be held in memory.
+        max_value_records: newest values rows kept in values_df (None keeps all, unbounded).
+            self.run_metrics holds streaming return / volatility / Sharpe / max drawdown over every bar.
+        Cash, positions and trades carry over in the execution engine.
+        """
+        if self.symbol is None:
+            raise ValueError("Symbol must be set. Call set_parameters() first.")
+        if lookback < 0:
+            raise ValueError(f"lookback must be >= 0, got {lookback}")
+        if strategy is not None:
+            self.strategy = strategy
+        if self.strategy is None:
+            raise ValueError("Strategy must be set. Pass strategy= or call add_strategy() first.")
+        if chunks is None:
+            chunks = self.data_fetcher.iter_data_chunks(self.symbol, self.start_date, self.end_date,
+                                                        interval=interval, chunk_size=chunk_size, clean=True)
+        strategy_name = strategy_name if strategy_name is not None else self.strategy.name
+        incremental = self.strategy.supports_on_bar
+        if incremental:
+            self.strategy.reset()
+
+        try:
+            tail: Deque[pd.DataFrame] = deque()
+            tail_rows = 0
+            perf = StreamingPerformance()
+            context: Optional[pd.DataFrame] = None
+            prev_total: Optional[float] = None
+            bars = n_chunks = 0
+            for chunk in chunks:
+                if chunk is None or chunk.empty:
+                    continue
+                if incremental:
+                    signals = self.strategy.replay_bars(chunk, symbol=self.symbol, reset=False)
+                else:
+                    frame = chunk if context is None else pd.concat([context, chunk])
+                    signals = self.strategy.generate_signals(frame).iloc[-len(chunk):]
+                    context = frame.iloc[-lookback:] if lookback > 0 else None
+                df_sig = pd.DataFrame({'Signal': signals, 'Close': chunk['Close']})
+                part, prev_total = self._replay(self.symbol, df_sig, prev_total)
+                for value in part['total_value'].to_numpy():
+                    perf.update(value)
+                if values_sink is not None:
+                    values_sink(part)
+                tail.append(part)
+                tail_rows += len(part)
+                # Keep just enough chunks to cover the newest max_value_records rows
+                while max_value_records is not None and len(tail) > 1 and tail_rows - len(tail[0]) >= max_value_records:
+                    tail_rows -= len(tail.popleft())
+                bars += len(chunk)
+                n_chunks += 1
+            self.logger.info(f"Chunked backtest replayed {bars} bars in {n_chunks} chunks")
+
+            self.trades_df = pd.DataFrame(self.execution.trades)
+            values_df = pd.concat(tail, ignore_index=True) if tail else pd.DataFrame()
+            if max_value_records is not None and len(values_df) > max_value_records:
+                values_df = values_df.iloc[-max_value_records:].reset_index(drop=True)
+            self.values_df = values_df
+            self.run_metrics = perf.metrics()
+            if save_csv:
+                self.save_backtest_results()
+            return self.trades_df, self.values_df
+
+        except Exception as e:
+            self.logger.error(f"run_backtest_chunked error: {e}")
+            raise RuntimeError(f"Backtest execution failed: {e}") from e
+
+    def _replay(self, symbol: str, df_sig: pd.DataFrame,
+                prev_total: Optional[float] = None) -> Tuple[pd.DataFrame, Optional[float]]:
+        """Execute signals bar by bar; returns the values records and the last total value
+        (pass it back as prev_total to continue daily_pnl across chunks)."""
+        values_records: List[Dict[str, Any]] = []
+        signals = df_sig['Signal'].to_numpy(dtype=float)
+        prices = df_sig['Close'].to_numpy(dtype=float)
+        for date, signal, price in zip(df_sig.index, signals, prices):
+            if signal == 1:
+                max_qty = int(self.execution.cash / (price * (1 + self.commission)))
+                if max_qty > 0:
+                    self.execution.execute_order(
+                        symbol=symbol,
+                        quantity=max_qty,
+                        order_type="limit",
+                        price=price,
+                        timestamp=date
+                    )
+                    
+            elif signal == -1:
+                current_qty = self.execution.position_manager.get_position(symbol)
+                if current_qty > 0:
+                    self.execution.execute_order(
+                        symbol=symbol,
+                        quantity=-current_qty,
+                        order_type="limit",
+                        price=price,
+                        timestamp=date
+                    )
+            
+            position_qty = self.execution.position_manager.get_position(symbol)
+            position_value = position_qty * price
+            total_value = position_value + self.execution.cash
+            daily_pnl = 0.0 if prev_total is None else total_value - prev_total
+            prev_total = total_value
+            
+            values_records.append({
+                'date': date,
+                'signal': signal,
+                'price': price,
+                'cash': self.execution.cash,
+                'position': position_qty,
+                'position_value': position_value,
+                'total_value': total_value,
+                'daily_pnl': daily_pnl,
+            })
+        return pd.DataFrame(values_records), prev_total
+    
     def calculate_metrics(self) -> Tuple[pd.DataFrame, Dict[str, float]]:
         """Calculate backtest metrics, such as return, max drawdown, sharpe ratio, etc."""
         self.values_metrics, self.metrics = self.reporter.compute(self.symbol, self.trades_df, self.values_df)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import math
 import sys
@@ -249,6 +249,72 @@ class PerformanceReporter(BaseComponent):
         return values, metrics
 
 
+class StreamingPerformance:
+    """
+    O(1) running return, volatility, Sharpe and max-drawdown accumulators over equity points
+    (Welford mean/variance of returns, running peak). Definitions follow `metrics`: simple
+    returns, first return 0, sample std, `periods` per year. Used by chunked backtests and
+    the live equity recorder.
+    """
+
+    def __init__(self, periods: int = 252) -> None:
+        self.periods = periods
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.start_value: Optional[float] = None
+        self.last_value: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.peak = -math.inf
+        self.max_drawdown = 0.0
+
+    @staticmethod
+    def _welford(count: int, mean: float, m2: float, x: float):
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        return count, mean, m2 + delta * (x - mean)
+
+    def _fold(self, state: tuple, value: float) -> tuple:
+        count, start, last, mean, m2, peak, mdd = state
+        ret = value / last - 1.0 if last else 0.0
+        count, mean, m2 = self._welford(count, mean, m2, ret)
+        if value > peak:
+            peak = value
+        if peak > 0:
+            mdd = min(mdd, value / peak - 1.0)
+        return count, value if start is None else start, value, mean, m2, peak, mdd
+
+    def _state(self) -> tuple:
+        return (self.count, self.start_value, self.last_value, self._mean, self._m2, self.peak, self.max_drawdown)
+
+    def update(self, value: float) -> None:
+        """Fold in the next finished equity point."""
+        (self.count, self.start_value, self.last_value,
+         self._mean, self._m2, self.peak, self.max_drawdown) = self._fold(self._state(), float(value))
+
+    def metrics(self, pending: Optional[float] = None) -> Dict[str, Any]:
+        """Current metrics; `pending` is a still-open point included without being folded in."""
+        state = self._state() if pending is None else self._fold(self._state(), float(pending))
+        count, start, last, mean, m2, _, mdd = state
+        std = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        has_equity = count > 1
+        return {
+            "points": count,
+            "start_capital": start or 0.0,
+            "end_capital": last or 0.0,
+            "total_return": last / start - 1.0 if has_equity and start else 0.0,
+            "annualized_return": (1.0 + mean) ** self.periods - 1.0 if has_equity else 0.0,
+            "avg_daily_return": mean,
+            "return_std": std,
+            "volatility": std * math.sqrt(self.periods) if has_equity else 0.0,
+            "sharpe_ratio": mean / std * math.sqrt(self.periods) if has_equity and std else 0.0,
+            "max_drawdown": mdd if has_equity else 0.0,
+        }
+
+
 def _calculate_trade_metrics(trades_df: pd.DataFrame) -> Dict[str, Any]:
     if trades_df.empty:
         return _EMPTY_TRADE_METRICS.copy()
@@ -380,7 +446,7 @@ _TEXTS_EN = {
 }
 
 
-__all__ = ["PerformanceReporter"]
+__all__ = ["PerformanceReporter", "StreamingPerformance"]
 
 
 def _ensure_utf8(language: str) -> None:
@@ -2,13 +2,26 @@
 Data management module for DeltaFQ.
 """
 
-from .fetcher import DataFetcher
+from .fetcher import DataFetcher, FetchResult
 from .cleaner import DataCleaner
 from .storage import DataStorage
+from .cache import PriceCache
+from .mmap_store import MmapPriceStore
+from .local_source import LocalDataSource
+from .memo import FrameMemo
+from .resampler import BarResampler
+from .compact import compact_frame
 
 __all__ = [
     "DataFetcher",
+    "FetchResult",
     "DataCleaner", 
-    "DataStorage"
+    "DataStorage",
+    "PriceCache",
+    "MmapPriceStore",
+    "LocalDataSource",
+    "FrameMemo",
+    "BarResampler",
+    "compact_frame",
 ]
 
@@ -0,0 +1,224 @@
+"""
+Persistent read-through OHLCV cache for DeltaFQ.
+
+`PriceCache` keeps one history per symbol/interval in `DataStorage` together with
+the date ranges already downloaded. A request only downloads the missing gaps,
+merges them into the stored history and returns the requested slice, so repeated
+backtests read from disk and work offline once their range is covered.
+
+Ranges are half-open calendar-date intervals [start, end). Today and later are never
+marked as covered because their bars may still be forming.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..core.base import BaseComponent
+from .storage import DataStorage
+
+Downloader = Callable[[str, str, Optional[str], str], pd.DataFrame]
+Range = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+def _day(value) -> pd.Timestamp:
+    """Normalize a date string / datetime to a naive midnight Timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    """Sort and merge overlapping or touching [start, end) ranges."""
+    merged: List[Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(covered: List[Range], start: pd.Timestamp, end: pd.Timestamp) -> List[Range]:
+    """Parts of [start, end) not inside any covered range."""
+    gaps: List[Range] = []
+    cursor = start
+    for c_start, c_end in covered:
+        if c_end <= cursor:
+            continue
+        if c_start >= end:
+            break
+        if c_start > cursor:
+            gaps.append((cursor, c_start))
+        cursor = max(cursor, c_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class PriceCache(BaseComponent):
+    """Gap-filling OHLCV cache keyed by symbol and interval, persisted through DataStorage."""
+
+    def __init__(self, storage: Optional[DataStorage] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.storage = storage if storage is not None else DataStorage()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def get(self, symbol: str, start_date: str, end_date: Optional[str], interval: str,
+            downloader: Downloader) -> pd.DataFrame:
+        """
+        Return bars for [start_date, end_date), downloading only ranges not cached yet.
+
+        downloader(symbol, start, end, interval) is called once per missing gap with
+        'YYYY-MM-DD' bounds (end exclusive, like yfinance). It must raise when the download
+        fails: exceptions propagate and nothing is recorded, while an empty result marks the
+        gap's closed days as covered (holidays, halts), so they are never downloaded twice.
+        """
+        start = _day(start_date)
+        end = _day(end_date) if end_date else _day(datetime.now()) + timedelta(days=1)
+        if end <= start:
+            return pd.DataFrame()
+
+        with self._key_lock(symbol, interval):
+            exists, covered, tz, rows = self._read_meta(symbol, interval)
+            gaps = missing_ranges(covered, start, end)
+            data = None
+            if exists and not gaps:
+                # Hit: read only the requested slice (a day wider, the file is stored in UTC)
+                data = self._read_data(symbol, interval, tz, start - timedelta(days=1), end + timedelta(days=1))
+                if data is None:  # history files lost: treat everything as missing
+                    covered, rows, gaps = [], 0, [(start, end)]
+            if gaps:
+                tz = self._fill(symbol, interval, gaps, covered, tz, rows, downloader)
+                data = self._read_data(symbol, interval, tz, start - timedelta(days=1), end + timedelta(days=1))
+            else:
+                self.logger.info(f"Cache hit {symbol} {interval}: {start.date()} -> {end.date()}")
+
+        if data is None or data.empty:
+            return pd.DataFrame()
+        local = data.index.tz_localize(None) if data.index.tz is not None else data.index
+        return data[(local >= start) & (local < end)]
+
+    def covered_ranges(self, symbol: str, interval: str) -> List[Tuple[str, str]]:
+        """Cached [start, end) date ranges of a symbol/interval as 'YYYY-MM-DD' strings."""
+        _, covered, _, _ = self._read_meta(symbol, interval)
+        return [(s.strftime("%Y-%m-%d"), e.strftime("%Y-%m-%d")) for s, e in covered]
+
+    def invalidate(self, symbol: str, interval: Optional[str] = None) -> None:
+        """Drop cached ranges (all intervals if interval is None); data is re-downloaded on next use."""
+        cache_dir = self.storage.price_cache_dir(symbol)
+        if not cache_dir.exists():
+            return
+        if interval is None:
+            # Intervals on disk plus any being filled right now (their files may not exist yet)
+            prefix = f"{symbol}_"
+            intervals = {p.stem[len(prefix):] for p in cache_dir.iterdir() if p.stem.startswith(prefix)}
+            with self._lock:
+                intervals.update(iv for sym, iv in self._key_locks if sym == symbol)
+            intervals = sorted(intervals)
+        else:
+            intervals = [interval]
+        for iv in intervals:
+            with self._key_lock(symbol, iv):
+                self.storage.delete_price_cache(symbol, iv)
+                self._meta_path(symbol, iv).unlink(missing_ok=True)
+
+    def _key_lock(self, symbol: str, interval: str) -> threading.Lock:
+        """One lock per symbol/interval, so different symbols are fetched concurrently."""
+        with self._lock:
+            return self._key_locks.setdefault((symbol, interval), threading.Lock())
+
+    def _fill(self, symbol: str, interval: str, gaps: List[Range], covered: List[Range], tz: Optional[str],
+              rows: int, downloader: Downloader) -> Optional[str]:
+        """Download gaps and merge them into the yearly files they fall into; returns the history's timezone."""
+        today = _day(datetime.now())
+        parts = []
+        for g_start, g_end in gaps:
+            self.logger.info(f"Cache miss {symbol} {interval}: {g_start.date()} -> {g_end.date()}")
+            part = downloader(symbol, g_start.strftime("%Y-%m-%d"), g_end.strftime("%Y-%m-%d"), interval)
+            # Only closed days count as covered; today's bars may still change
+            final_end = min(g_end, today)
+            if part is not None and not part.empty:
+                parts.append(part)
+                tz = tz or (str(part.index.tz) if getattr(part.index, "tz", None) else None)
+                if g_start < final_end:
+                    covered.append((g_start, final_end))
+            elif g_start < final_end:
+                # The download succeeded (failures raise) but the closed days hold no bars: holidays,
+                # weekends or no trading. Record them so they are never requested again.
+                self.logger.info(f"No data for {symbol} {interval}: {g_start.date()} -> {final_end.date()}")
+                covered.append((g_start, final_end))
+
+        if parts:
+            new = pd.concat([self._to_utc(p, tz) for p in parts])
+            years = new.index.year
+            # Merge with the stored rows of the touched years only; other years are neither read nor written
+            old = self.storage.load_price_cache(symbol, interval, from_date=f"{years.min()}-01-01",
+                                                to_date=f"{years.max() + 1}-01-01")
+            if old is not None and not old.empty:
+                old.index = pd.to_datetime(old.index, utc=True) if tz else pd.to_datetime(old.index)
+                old = old[np.isin(old.index.year, years.unique())]
+                merged = pd.concat([old, new])
+            else:
+                merged = new
+            merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+            rows += len(merged) - (0 if old is None else len(old))
+        else:
+            merged = None  # still create the (empty) history so covered weekends read as a hit
+        self.storage.save_price_cache(merged, symbol, interval)
+        self._write_meta(symbol, interval, merge_ranges(covered), tz, rows)
+        return tz
+
+    @staticmethod
+    def _to_utc(df: pd.DataFrame, tz: Optional[str]) -> pd.DataFrame:
+        """Storage form of downloaded bars: UTC when the history has a timezone (naive bars are taken as UTC)."""
+        if tz is None:
+            return df
+        df = df.copy()
+        index = pd.DatetimeIndex(df.index)
+        df.index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+        return df
+
+    def _meta_path(self, symbol: str, interval: str):
+        return self.storage.price_cache_dir(symbol) / f"{symbol}_{interval}.json"
+
+    def _read_meta(self, symbol: str, interval: str) -> Tuple[bool, List[Range], Optional[str], int]:
+        path = self._meta_path(symbol, interval)
+        if not path.exists():
+            return False, [], None, 0
+        meta = json.loads(path.read_text(encoding="utf-8"))
+        covered = [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in meta.get("ranges", [])]
+        return True, covered, meta.get("tz"), int(meta.get("rows", 0))
+
+    def _read_data(self, symbol: str, interval: str, tz: Optional[str],
+                   from_date=None, to_date=None) -> Optional[pd.DataFrame]:
+        data = self.storage.load_price_cache(symbol, interval, from_date=from_date, to_date=to_date)
+        if data is None or data.empty:
+            return data
+        # Stored in UTC so CSV round trips keep one offset; convert back to the exchange timezone
+        if tz:
+            data.index = pd.to_datetime(data.index, utc=True).tz_convert(tz)
+        else:
+            data.index = pd.to_datetime(data.index)
+        data.index.name = data.index.name or "Date"
+        return data
+
+    def _write_meta(self, symbol: str, interval: str, covered: List[Range], tz: Optional[str], rows: int) -> None:
+        self.storage.price_cache_dir(symbol).mkdir(parents=True, exist_ok=True)
+        meta = {
+            "symbol": symbol,
+            "interval": interval,
+            "tz": tz,
+            "ranges": [[s.strftime("%Y-%m-%d"), e.strftime("%Y-%m-%d")] for s, e in covered],
+            "rows": rows,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._meta_path(symbol, interval).write_text(json.dumps(meta, indent=2), encoding="utf-8")
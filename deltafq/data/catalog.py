@@ -0,0 +1,224 @@
+"""
+SQLite catalog of the files written by DataStorage.
+
+Every saved artifact gets one row: path (relative to the storage root), parent
+directory, file stem, category, kind (price / price_cache / trades / values /
+data), symbol, strategy, date range, interval, size, format and timestamps.
+Latest-file lookups, listings and size totals become indexed queries instead of
+glob + sort + stat over the whole tree. Name patterns use SQLite GLOB, which
+matches like pathlib glob within one directory.
+
+The catalog is derived data: `rebuild()` rescans the tree. Opening it only runs a
+rebuild when the catalog is empty or a top-level category directory (price/,
+backtest/, ...) changed after the catalog's last write, e.g. a symbol folder was
+copied in by hand; that check costs one stat per category, never a tree walk.
+Files added deeper by hand need an explicit rebuild (DataStorage.rebuild_catalog),
+and entries whose file disappeared are pruned when a lookup meets them.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .formats import SUFFIXES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    stem TEXT NOT NULL,
+    category TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    symbol TEXT,
+    strategy TEXT,
+    interval TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    created_at TEXT,
+    size INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_artifacts_parent ON artifacts (parent, stem);
+CREATE INDEX IF NOT EXISTS ix_artifacts_lookup ON artifacts (category, kind, symbol, created_at);
+CREATE TABLE IF NOT EXISTS catalog_state (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+_PRICE_RANGE = re.compile(r"^(?P<symbol>.+)_(?P<start>\d{4}-?\d{2}-?\d{2})_(?P<end>\d{4}-?\d{2}-?\d{2})$")
+_PRICE_DAY = re.compile(r"^(?P<symbol>.+)_(?P<day>\d{8})$")
+_BACKTEST = re.compile(r"^(?P<symbol>.+?)_(?P<kind>trades|values)(?:_(?P<strategy>.+))?_(?P<ts>\d{8}_\d{6})$")
+
+
+def parse_artifact(rel_path: Path) -> Dict[str, Optional[str]]:
+    """Catalog metadata encoded in a DataStorage path (category/kind/symbol/strategy/dates)."""
+    parts = rel_path.parts
+    category = parts[0] if len(parts) > 1 else ""
+    stem = rel_path.name[: -len(rel_path.suffix)] if rel_path.suffix else rel_path.name
+    meta: Dict[str, Optional[str]] = {"category": category, "kind": "data", "symbol": None, "strategy": None,
+                                      "interval": None, "start_date": None, "end_date": None, "created_at": None}
+    if category == "price" and len(parts) == 5 and parts[2] == "_cache" and "_" in parts[3]:
+        meta["symbol"], meta["interval"] = parts[3].rsplit("_", 1)  # yearly file: _cache/{symbol}_{interval}/{year}
+        meta["kind"] = "price_cache"
+    elif category == "price" and len(parts) == 4 and parts[2] == "_cache" and "_" in stem:
+        meta["symbol"], meta["interval"] = stem.rsplit("_", 1)
+        meta["kind"] = "price_cache"
+    elif category == "price" and len(parts) == 3:
+        meta["kind"] = "price"
+        m = _PRICE_RANGE.match(stem)
+        d = _PRICE_DAY.match(stem)
+        if m:
+            meta.update(symbol=m["symbol"], start_date=m["start"], end_date=m["end"])
+        elif d:
+            meta.update(symbol=d["symbol"], created_at=datetime.strptime(d["day"], "%Y%m%d").isoformat())
+        else:
+            meta["symbol"] = parts[1]
+    elif category == "backtest":
+        m = _BACKTEST.match(stem)
+        if m:
+            meta.update(kind=m["kind"], symbol=m["symbol"], strategy=m["strategy"],
+                        created_at=datetime.strptime(m["ts"], "%Y%m%d_%H%M%S").isoformat())
+    return meta
+
+
+class StorageCatalog:
+    """Indexed table of storage artifacts, kept in `{root}/catalog.sqlite3`."""
+
+    FILENAME = "catalog.sqlite3"
+
+    def __init__(self, root: Union[str, Path], db_path: Optional[Union[str, Path]] = None) -> None:
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path is not None else self.root / self.FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        if self.is_stale():
+            self.rebuild()
+
+    # ------------------------------------------------------------------ writes
+
+    def record(self, path: Path) -> None:
+        """Add or refresh the entry of a file that was just written."""
+        self.record_many([path])
+
+    def record_many(self, paths: Sequence[Path]) -> None:
+        rows = [self._row(Path(p)) for p in paths]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO artifacts (path, parent, stem, category, kind, symbol, strategy, interval, "
+                "start_date, end_date, created_at, size, format, mtime) "
+                "VALUES (:path, :parent, :stem, :category, :kind, :symbol, :strategy, :interval, "
+                ":start_date, :end_date, :created_at, :size, :format, :mtime)", rows)
+            self._mark_synced()
+
+    def remove(self, path: Path) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM artifacts WHERE path = ?", (self._rel(path),))
+            self._mark_synced()
+
+    def rebuild(self) -> int:
+        """Re-index every supported file under root; returns the number of entries."""
+        files = [p for suffix in SUFFIXES for p in self.root.rglob("*" + suffix) if p.is_file()]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM artifacts")
+        self.record_many(files)
+        return len(files)
+
+    def is_stale(self) -> bool:
+        """
+        True if the catalog is empty or a directory directly below root was modified after its
+        last write. Only the top level is checked, so opening stays O(categories); the root itself
+        is skipped because it holds the database files.
+        """
+        with self._lock:
+            synced = self._conn.execute("SELECT value FROM catalog_state WHERE key = 'synced_at'").fetchone()
+            empty = self._conn.execute("SELECT 1 FROM artifacts LIMIT 1").fetchone() is None
+        if synced is None or empty:
+            return True
+        with os.scandir(self.root) as entries:
+            return any(e.is_dir() and e.stat().st_mtime > synced[0] for e in entries)
+
+    # ------------------------------------------------------------------ queries
+
+    def find(self, directory: Path, pattern: str = "*", recursive: bool = False,
+             prefer_suffix: str = "", verify: bool = False) -> List[Path]:
+        """
+        Files in directory whose stem matches the glob pattern, sorted by stem (prefer_suffix last).
+        verify: check the files still exist and prune the entries of deleted ones.
+        """
+        rel = self._rel(directory)
+        if recursive:
+            where, args = "(parent = ? OR parent LIKE ? ESCAPE '\\')", [rel, self._like_prefix(rel)]
+        else:
+            where, args = "parent = ?", [rel]
+        rows = self._query(
+            f"SELECT path FROM artifacts WHERE {where} AND stem GLOB ? ORDER BY stem, format = ?",
+            args + [pattern, prefer_suffix.lstrip(".")])
+        paths = [self.root / r["path"] for r in rows]
+        return self._existing(paths) if verify else paths
+
+    def query(self, category: Optional[str] = None, kind: Optional[str] = None, symbol: Optional[str] = None,
+              strategy: Optional[str] = None, interval: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entries matching every given field, oldest first (created_at, then stem)."""
+        filters = {"category": category, "kind": kind, "symbol": symbol, "strategy": strategy, "interval": interval}
+        clauses = [f"{k} = :{k}" for k, v in filters.items() if v is not None]
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return self._query(f"SELECT * FROM artifacts{where} ORDER BY created_at, stem",
+                           {k: v for k, v in filters.items() if v is not None})
+
+    def stats(self) -> Dict[str, Any]:
+        """File count per category and total size in bytes of the indexed data files."""
+        rows = self._query("SELECT category, COUNT(*) AS files, COALESCE(SUM(size), 0) AS size "
+                           "FROM artifacts GROUP BY category")
+        return {"files": {r["category"]: r["files"] for r in rows},
+                "total_size": sum(r["size"] for r in rows)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------ internals
+
+    def _rel(self, path: Path) -> str:
+        rel = Path(path).relative_to(self.root).as_posix()
+        return "" if rel == "." else rel
+
+    @staticmethod
+    def _like_prefix(rel: str) -> str:
+        escaped = rel.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"{escaped}/%" if escaped else "%"
+
+    def _row(self, path: Path) -> Dict[str, Any]:
+        rel = Path(self._rel(path))
+        stat = path.stat()
+        row: Dict[str, Any] = parse_artifact(rel)
+        row.update(path=rel.as_posix(), parent=self._rel(path.parent), stem=rel.name[: -len(rel.suffix)],
+                   size=stat.st_size, format=rel.suffix.lstrip("."), mtime=stat.st_mtime)
+        row["created_at"] = row["created_at"] or datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds")
+        return row
+
+    def _mark_synced(self) -> None:
+        """Record the time of the latest catalog write (call inside the write transaction)."""
+        self._conn.execute("INSERT OR REPLACE INTO catalog_state (key, value) VALUES ('synced_at', ?)",
+                           (time.time(),))
+
+    def _query(self, sql: str, args: Any = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            cur = self._conn.execute(sql, args)
+            names = [d[0] for d in cur.description]
+            return [dict(zip(names, r)) for r in cur.fetchall()]
+
+    def _existing(self, paths: List[Path]) -> List[Path]:
+        """Drop entries whose file was deleted outside DataStorage."""
+        missing = [p for p in paths if not p.exists()]
+        for p in missing:
+            self.remove(p)
+        return [p for p in paths if p not in missing] if missing else paths
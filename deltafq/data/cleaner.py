@@ -1,39 +1,317 @@
 """
 Data cleaning utilities for DeltaFQ.
+
+`DataCleaner.clean` runs a configurable data-quality pipeline over one OHLCV
+frame or a long panel (a symbol column, or a (symbol, date) MultiIndex) in a
+single pass: every check works on flat NumPy arrays with symbol codes, so a
+500-symbol panel costs a few sorts and array operations, not a Python loop per
+symbol. Checks run in this order:
+
+    monotonic    count rows that were out of (symbol, time) order (rows are always sorted)
+    duplicates   repeated (symbol, time) rows, the last one is kept
+    missing      rows with NaN in Open/High/Low/Close
+    adjust       split / dividend adjustment from Adj Close, or Stock Splits / Dividends columns
+                 (the event columns are zeroed once applied)
+    ohlc         non-positive prices (dropped); High/Low inconsistent with Open/Close
+    zero_volume  bars with Volume == 0
+    stale        Close unchanged for stale_bars or more consecutive bars
+    spikes       one-bar jumps beyond spike_threshold robust sigmas that revert on the next bar
+
+The report has one row per check: flagged (kept, marked in `dq_flags` when
+add_flags=True), removed and modified row counts and the number of symbols hit.
 """
 
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
-from typing import Optional
 from ..core.base import BaseComponent
 
+CHECKS = ("monotonic", "duplicates", "missing", "adjust", "ohlc", "zero_volume", "stale", "spikes")
+FLAG_BITS = {name: 1 << i for i, name in enumerate(CHECKS)}
+_PRICES = ("Open", "High", "Low", "Close")
+
 
 class DataCleaner(BaseComponent):
     """Data cleaning utilities."""
-    
+
     def __init__(self, **kwargs):
         """Initialize the data cleaner."""
         super().__init__(**kwargs)
         self.logger.info("Initializing data cleaner")
-    
+
     def dropna(self, data: pd.DataFrame) -> pd.DataFrame:
         """Remove rows with NaN values."""
         cleaned_data = data.dropna()
         self.logger.info(f"Dropped NaN rows: {len(data)} -> {len(cleaned_data)} rows")
         return cleaned_data
-    
+
     def fillna(self, data: pd.DataFrame, method: str = "forward") -> pd.DataFrame:
         """Fill missing data using specified method."""
         na_count_before = data.isna().sum().sum()
-        
+
         if method == "forward":
-            filled_data = data.fillna(method='ffill')
+            filled_data = data.ffill()
         elif method == "backward":
-            filled_data = data.fillna(method='bfill')
+            filled_data = data.bfill()
         else:
             filled_data = data.fillna(0)
-        
+
         na_count_after = filled_data.isna().sum().sum()
         self.logger.info(f"Filled NaN: {na_count_before} -> {na_count_after} (method: {method})")
-        
+
         return filled_data
 
+    def clean(self, data: pd.DataFrame, checks: Optional[Iterable[str]] = None, symbol_column: str = "symbol",
+              ohlc: str = "fix", zero_volume: str = "flag", stale: str = "flag", spikes: str = "drop",
+              stale_bars: int = 5, spike_threshold: float = 10.0, min_spike: float = 0.05,
+              add_flags: bool = False, by_symbol: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Run the data-quality pipeline; returns (cleaned data, report).
+
+        Args:
+            data: OHLCV frame with a DatetimeIndex; a panel has a symbol_column or a (symbol, date) MultiIndex.
+            checks: Subset of CHECKS to run (default all).
+            ohlc: "fix" (clamp High/Low to the bar's extremes), "drop" or "flag".
+            zero_volume / stale / spikes: "drop" or "flag".
+            stale_bars: Minimum run of identical closes reported as stale (the repeats are flagged).
+            spike_threshold: Spike size in robust sigmas (1.4826 * median |log return| per symbol).
+            min_spike: Minimum absolute log move counted as a spike.
+            add_flags: Add a `dq_flags` bitmask column (FLAG_BITS) for flagged and fixed rows.
+            by_symbol: Report one row per (check, symbol) with non-zero counts instead of totals.
+        """
+        run = set(CHECKS if checks is None else checks)
+        unknown = run - set(CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown checks: {', '.join(sorted(unknown))}. Must be among {', '.join(CHECKS)}")
+        for name, action, allowed in (("ohlc", ohlc, ("fix", "drop", "flag")), ("zero_volume", zero_volume, ("drop", "flag")),
+                                      ("stale", stale, ("drop", "flag")), ("spikes", spikes, ("drop", "flag"))):
+            if action not in allowed:
+                raise ValueError(f"{name} must be one of {allowed}, got {action!r}")
+
+        frame = data
+        codes, symbols, ts = self._keys(frame, symbol_column)
+        flags = np.zeros(len(frame), dtype=np.int64)
+        report: Dict[str, Dict[str, np.ndarray]] = {}
+        n_sym = len(symbols)
+
+        def _count(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(codes[mask], minlength=n_sym)
+
+        def _record(name: str, flagged=None, removed=None, modified=None) -> None:
+            zero = np.zeros(n_sym, dtype=np.int64)
+            report[name] = {"flagged": zero if flagged is None else _count(flagged),
+                            "removed": zero if removed is None else _count(removed),
+                            "modified": zero if modified is None else _count(modified)}
+
+        def _drop(mask: np.ndarray) -> None:
+            nonlocal frame, codes, ts, flags
+            keep = ~mask
+            frame, codes, ts, flags = frame[keep], codes[keep], ts[keep], flags[keep]
+
+        # Every later check needs rows grouped by symbol in time order, so the sort always runs;
+        # "monotonic" only controls whether out-of-order rows are reported
+        if "monotonic" in run:
+            # Stable by symbol first to count time inversions in the original order
+            by_sym = np.argsort(codes, kind="stable")
+            inverted = np.zeros(len(frame), dtype=bool)
+            inverted[by_sym[1:]] = (codes[by_sym[1:]] == codes[by_sym[:-1]]) & (ts[by_sym[1:]] < ts[by_sym[:-1]])
+            _record("monotonic", modified=inverted)
+        order = np.lexsort((ts, codes))
+        frame, codes, ts = frame.iloc[order], codes[order], ts[order]
+
+        if "duplicates" in run:
+            dup = np.zeros(len(frame), dtype=bool)
+            dup[:-1] = (codes[1:] == codes[:-1]) & (ts[1:] == ts[:-1])  # keep the last of a run
+            _record("duplicates", removed=dup)
+            _drop(dup)
+
+        prices = [c for c in _PRICES if c in frame.columns]
+        if "missing" in run:
+            missing = frame[prices].isna().to_numpy().any(axis=1) if prices else np.zeros(len(frame), dtype=bool)
+            _record("missing", removed=missing)
+            _drop(missing)
+
+        if "adjust" in run:
+            frame, adjusted = self._adjust(frame, codes, prices)
+            flags[adjusted] |= FLAG_BITS["adjust"]
+            _record("adjust", modified=adjusted)
+
+        if "ohlc" in run and {"High", "Low"} <= set(prices):
+            p = frame[prices].to_numpy(dtype=np.float64)
+            nonpos = (p <= 0).any(axis=1)
+            hi, lo = p.max(axis=1), p.min(axis=1)
+            h, l = frame["High"].to_numpy(dtype=np.float64), frame["Low"].to_numpy(dtype=np.float64)
+            bad = ~nonpos & ((h < hi) | (l > lo))
+            if ohlc == "fix":
+                frame = frame.copy()
+                frame["High"], frame["Low"] = np.where(bad, hi, h), np.where(bad, lo, l)
+                flags[bad] |= FLAG_BITS["ohlc"]
+                _record("ohlc", removed=nonpos, modified=bad)
+                _drop(nonpos)
+            elif ohlc == "drop":
+                _record("ohlc", removed=nonpos | bad)
+                _drop(nonpos | bad)
+            else:
+                flags[bad] |= FLAG_BITS["ohlc"]
+                _record("ohlc", flagged=bad, removed=nonpos)
+                _drop(nonpos)
+        elif "ohlc" in run:
+            _record("ohlc")
+
+        if "zero_volume" in run:
+            zero = (frame["Volume"].to_numpy(dtype=np.float64, na_value=np.nan) == 0) if "Volume" in frame \
+                else np.zeros(len(frame), dtype=bool)
+            self._apply("zero_volume", zero, zero_volume, flags, _record, _drop)
+
+        close = frame["Close"].to_numpy(dtype=np.float64) if "Close" in frame else None
+        if "stale" in run:
+            mask = self._stale(close, codes, stale_bars) if close is not None else np.zeros(len(frame), dtype=bool)
+            self._apply("stale", mask, stale, flags, _record, _drop)
+
+        close = frame["Close"].to_numpy(dtype=np.float64) if "Close" in frame else None
+        if "spikes" in run:
+            mask = self._spikes(close, codes, n_sym, spike_threshold, min_spike) if close is not None \
+                else np.zeros(len(frame), dtype=bool)
+            self._apply("spikes", mask, spikes, flags, _record, _drop)
+
+        if add_flags:
+            frame = frame.copy() if frame is data else frame
+            frame["dq_flags"] = flags
+        report_df = self._report(report, symbols, by_symbol)
+        self.logger.info(f"Cleaned {len(data)} -> {len(frame)} rows ({n_sym} symbols): "
+                         + ", ".join(f"{k}={int(v['removed'].sum() + v['modified'].sum() + v['flagged'].sum())}"
+                                     for k, v in report.items()))
+        return frame, report_df
+
+    # ------------------------------------------------------------------ pipeline steps
+
+    @staticmethod
+    def _keys(data: pd.DataFrame, symbol_column: str) -> Tuple[np.ndarray, pd.Index, np.ndarray]:
+        """Symbol codes, symbol labels and int64 time keys of every row."""
+        if isinstance(data.index, pd.MultiIndex):
+            names = list(data.index.names)
+            level = names.index(symbol_column) if symbol_column in names else 0
+            symbols_raw = data.index.get_level_values(level)
+            times = data.index.get_level_values(1 - level if data.index.nlevels == 2 else -1)
+        else:
+            symbols_raw = data[symbol_column] if symbol_column in data.columns else None
+            times = data.index
+        if symbols_raw is None:
+            codes, symbols = np.zeros(len(data), dtype=np.int64), pd.Index([None])
+        else:
+            codes, symbols = pd.factorize(symbols_raw)
+            codes = codes.astype(np.int64)
+        times = pd.DatetimeIndex(times)
+        if times.tz is not None:
+            times = times.tz_convert("UTC").tz_localize(None)
+        return codes, pd.Index(symbols), times.values.astype("datetime64[ns]").astype(np.int64)
+
+    @staticmethod
+    def _apply(name, mask, action, flags, record, drop) -> None:
+        if action == "drop":
+            record(name, removed=mask)
+            drop(mask)
+        else:
+            flags[mask] |= FLAG_BITS[name]
+            record(name, flagged=mask)
+
+    @staticmethod
+    def _adjust(frame: pd.DataFrame, codes: np.ndarray, prices: List[str]) -> Tuple[pd.DataFrame, np.ndarray]:
+        """Back-adjust prices for splits and dividends; returns (frame, rows changed)."""
+        n = len(frame)
+        if "Adj Close" in frame and "Close" in frame:
+            close = frame["Close"].to_numpy(dtype=np.float64)
+            factor = frame["Adj Close"].to_numpy(dtype=np.float64) / close
+            factor = np.where(np.isfinite(factor) & (factor > 0), factor, 1.0)
+            split_factor = np.ones(n)
+        elif "Stock Splits" in frame or "Dividends" in frame:
+            close = frame["Close"].to_numpy(dtype=np.float64)
+            ratio = frame["Stock Splits"].to_numpy(dtype=np.float64) if "Stock Splits" in frame else np.zeros(n)
+            ratio = np.where(ratio > 0, ratio, 1.0)
+            div = frame["Dividends"].to_numpy(dtype=np.float64) if "Dividends" in frame else np.zeros(n)
+            prev_close = np.r_[np.nan, close[:-1]]
+            first = np.r_[True, codes[1:] != codes[:-1]]
+            div_step = np.where(~first & (div > 0) & (prev_close > 0), 1.0 - div / prev_close, 1.0)
+            # An event on bar t adjusts every earlier bar of the same symbol: reverse cumulative product
+            split_factor = _reverse_cumprod_excl(1.0 / ratio, codes)
+            factor = split_factor * _reverse_cumprod_excl(div_step, codes)
+        else:
+            return frame, np.zeros(n, dtype=bool)
+        changed = ~np.isclose(factor, 1.0)
+        if not changed.any():
+            return frame, changed
+        frame = frame.copy()
+        for col in prices:
+            frame[col] = frame[col].to_numpy(dtype=np.float64) * factor
+        if "Adj Close" in frame:
+            frame["Adj Close"] = frame["Close"]
+        # Events are now part of the prices: clear them so a second clean() does not adjust again
+        for col in ("Stock Splits", "Dividends"):
+            if col in frame:
+                frame[col] = 0.0
+        if "Volume" in frame and not np.allclose(split_factor, 1.0):
+            frame["Volume"] = frame["Volume"].to_numpy(dtype=np.float64) / split_factor
+        return frame, changed
+
+    @staticmethod
+    def _stale(close: np.ndarray, codes: np.ndarray, stale_bars: int) -> np.ndarray:
+        """Repeated closes in runs of at least stale_bars identical values (first bar of a run excluded)."""
+        n = len(close)
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+        same = np.r_[False, (close[1:] == close[:-1]) & (codes[1:] == codes[:-1])]
+        run_id = np.cumsum(~same)
+        run_len = np.bincount(run_id)[run_id]
+        return same & (run_len >= stale_bars)
+
+    @staticmethod
+    def _spikes(close: np.ndarray, codes: np.ndarray, n_sym: int, threshold: float,
+                min_spike: float) -> np.ndarray:
+        """Bars that jump away and straight back: |r_t|, |r_t+1| above threshold with opposite signs."""
+        n = len(close)
+        if n < 3:
+            return np.zeros(n, dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.r_[0.0, np.diff(np.log(close))]
+        r[np.r_[True, codes[1:] != codes[:-1]]] = 0.0
+        r[~np.isfinite(r)] = 0.0
+        # Robust scale per symbol: median |r| via one sort by (symbol, |r|)
+        absr = np.abs(r)
+        order = np.lexsort((absr, codes))
+        counts = np.bincount(codes, minlength=n_sym)
+        starts = np.r_[0, np.cumsum(counts)[:-1]]
+        mid = np.minimum(starts + counts // 2, n - 1)
+        scale = 1.4826 * absr[order][mid]
+        limit = np.maximum(threshold * scale[codes], min_spike)
+        nxt = np.r_[r[1:], 0.0]
+        nxt_limit = np.r_[limit[1:], np.inf]
+        same_next = np.r_[codes[1:] == codes[:-1], False]
+        return (same_next & (absr > limit) & (np.abs(nxt) > nxt_limit) & (np.sign(r) != np.sign(nxt))
+                & (np.abs(r + nxt) < 0.5 * absr))
+
+    @staticmethod
+    def _report(report: Dict[str, Dict[str, np.ndarray]], symbols: pd.Index, by_symbol: bool) -> pd.DataFrame:
+        columns = ["flagged", "removed", "modified"]
+        if by_symbol:
+            rows = []
+            for check, counts in report.items():
+                for i, sym in enumerate(symbols):
+                    values = [int(counts[c][i]) for c in columns]
+                    if any(values):
+                        rows.append([check, sym] + values)
+            return pd.DataFrame(rows, columns=["check", "symbol"] + columns).set_index(["check", "symbol"])
+        rows = []
+        for check, counts in report.items():
+            hit = counts["flagged"] + counts["removed"] + counts["modified"]
+            rows.append([check] + [int(counts[c].sum()) for c in columns] + [int((hit > 0).sum())])
+        return pd.DataFrame(rows, columns=["check"] + columns + ["symbols"]).set_index("check")
+
+
+def _reverse_cumprod_excl(step: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Per symbol (rows grouped by symbol, in time order): product of step over all LATER rows."""
+    logs = np.log(step)
+    total = np.cumsum(logs)
+    ends = np.r_[np.flatnonzero(codes[1:] != codes[:-1]), len(codes) - 1]
+    group_end = np.repeat(total[ends], np.diff(np.r_[-1, ends]))
+    return np.exp(group_end - total)
@@ -0,0 +1,82 @@
+"""
+Dtype-compact price frames.
+
+`compact_frame` downcasts a frame column by column: float columns to float32
+when every value round-trips within `rtol` (relative error), integer columns and
+whole-number Volume columns stored as float to the smallest integer type that
+holds their range, and low-cardinality string columns (e.g. symbol) to categoricals.
+A column is only converted when the check passes, so the loss is bounded by
+`rtol` by construction; `max_relative_error` measures it for verification.
+Typical OHLCV frames shrink to about half their size.
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_RTOL = 1e-6
+
+
+def _fits_float32(values: np.ndarray, rtol: float) -> bool:
+    with np.errstate(over="ignore", invalid="ignore"):
+        f32 = values.astype(np.float32).astype(np.float64)
+    finite = np.isfinite(values)
+    if not np.array_equal(finite, np.isfinite(f32)):
+        return False  # overflow
+    err = np.abs(f32[finite] - values[finite])
+    return bool(np.all(err <= rtol * np.abs(values[finite])))
+
+
+def _compact_series(s: pd.Series, rtol: float, category_ratio: float) -> pd.Series:
+    if pd.api.types.is_bool_dtype(s.dtype) or isinstance(s.dtype, pd.CategoricalDtype):
+        return s
+    if pd.api.types.is_integer_dtype(s.dtype) or pd.api.types.is_float_dtype(s.dtype):
+        values = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        finite = values[np.isfinite(values)]
+        # Counts (integer dtype, or a float Volume column holding whole numbers) -> smallest int type
+        is_count = pd.api.types.is_integer_dtype(s.dtype) or str(s.name).lower() == "volume"
+        if is_count and len(values) and len(finite) == len(values) and bool(np.all(finite == np.round(finite))):
+            kind = "unsigned" if finite.min() >= 0 else "integer"
+            return pd.to_numeric(s.astype(np.int64), downcast=kind)
+        if pd.api.types.is_float_dtype(s.dtype) and s.dtype.itemsize > 4 and _fits_float32(values, rtol):
+            return s.astype(np.float32)
+        return s
+    if pd.api.types.is_object_dtype(s.dtype) or pd.api.types.is_string_dtype(s.dtype):
+        if len(s) and s.nunique(dropna=False) <= category_ratio * len(s):
+            return s.astype("category")
+    return s
+
+
+def compact_frame(data: pd.DataFrame, rtol: float = DEFAULT_RTOL, category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Return a copy of data with compact dtypes.
+
+    rtol: maximum relative error allowed when casting float64 prices to float32; a column that
+        does not meet it stays float64.
+    category_ratio: string columns with at most this share of distinct values become categoricals.
+    """
+    if data is None or data.empty:
+        return data
+    out = pd.DataFrame({col: _compact_series(data[col], rtol, category_ratio) for col in data.columns},
+                       index=data.index)
+    out.columns = data.columns
+    return out
+
+
+def max_relative_error(original: pd.DataFrame, compact: pd.DataFrame) -> Dict[str, float]:
+    """Largest relative difference per numeric column between a frame and its compact copy."""
+    errors: Dict[str, float] = {}
+    for col in original.columns:
+        if not pd.api.types.is_numeric_dtype(original[col].dtype):
+            continue
+        a = original[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        b = compact[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = np.isfinite(a) & (a != 0)
+        errors[col] = float(np.max(np.abs(b[mask] - a[mask]) / np.abs(a[mask]))) if mask.any() else 0.0
+    return errors
+
+
+def memory_bytes(data: pd.DataFrame) -> int:
+    """Deep memory usage of a frame including its index."""
+    return int(data.memory_usage(index=True, deep=True).sum())
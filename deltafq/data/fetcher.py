@@ -2,25 +2,101 @@
 Data fetching interfaces for DeltaFQ.
 """
 
+import logging
 import pandas as pd
 import yfinance as yf
+import random
 import re
 import requests
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from io import StringIO
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Union
 from ..core.base import BaseComponent
+from .cache import PriceCache
 from .cleaner import DataCleaner
+from .compact import DEFAULT_RTOL, compact_frame
+from .local_source import LocalDataSource
+from .formats import rechunk
+from .memo import FrameMemo, is_intraday
+from .resampler import BarResampler
+from .singleflight import SingleFlight
+from .storage import DataStorage
 import warnings
 warnings.filterwarnings('ignore')
 
 
+class FetchResult(dict):
+    """{symbol: DataFrame} of the symbols fetched successfully; `failed` maps the others to their error."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.failed: Dict[str, str] = {}
+
+
+def _backoff_delay(backoff: float, attempt: int) -> float:
+    """Exponential backoff with up to 25% jitter, so concurrent retries do not fire in lockstep."""
+    return backoff * (2 ** attempt) * (1 + 0.25 * random.random())
+
+
+class _YahooErrors(logging.Handler):
+    """Collects the "['SYMBOL']: reason" errors yf.download logs for one symbol."""
+
+    def __init__(self, symbol: str) -> None:
+        super().__init__(level=logging.ERROR)
+        self._tag = repr(symbol.upper())
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if self._tag in message:
+            self.messages.append(message.strip())
+
+
 class DataFetcher(BaseComponent):
     """Data fetcher for various sources."""
+
+    FUND_API_URL = "https://fundf10.eastmoney.com/F10DataApi.aspx"
     
-    def __init__(self, source: str = "yahoo", **kwargs: Any) -> None:
-        """Initialize data fetcher."""
+    def __init__(self, source: str = "yahoo", cache: Union[bool, DataStorage, PriceCache] = False,
+                 data_dir: Optional[Union[str, Path]] = None, memo: Union[bool, FrameMemo] = False,
+                 compact: bool = False, compact_rtol: float = DEFAULT_RTOL, **kwargs: Any) -> None:
+        """
+        Initialize data fetcher.
+        source: "yahoo" (default) or "local" to serve fetch_data offline from price files in data_dir.
+        cache: True (default DataStorage), a DataStorage or a PriceCache to serve fetch_data from a
+            persistent read-through cache that only downloads missing date ranges.
+        data_dir: directory of CSV/Parquet/Feather price files for source="local"
+            (default: the DataStorage price directory).
+        memo: True (process-wide FrameMemo.shared()) or a FrameMemo to answer repeated fetch_data
+            calls with identical parameters from memory (LRU by bytes, TTL for intraday/open ranges).
+        compact: return dtype-compact frames (float32 prices, smallest int volume, categorical strings;
+            see compact_frame), roughly halving memory.
+        compact_rtol: maximum relative error allowed when compacting float prices to float32.
+        """
         super().__init__(**kwargs)
         self.source = source
         self.cleaner = None
+        self.resampler: Optional[BarResampler] = None
+        self.compact = compact
+        self.compact_rtol = compact_rtol
+        self.local: Optional[LocalDataSource] = LocalDataSource(data_dir) if source == "local" else None
+        if self.local is not None:
+            cache = False  # local files are the data; a cache would only copy them and hide new files
+        if isinstance(cache, PriceCache):
+            self.cache: Optional[PriceCache] = cache
+        elif isinstance(cache, DataStorage):
+            self.cache = PriceCache(cache)
+        else:
+            self.cache = PriceCache() if cache else None
+        self._flights = SingleFlight.shared()
+        self.memo: Optional[FrameMemo] = memo if isinstance(memo, FrameMemo) else (FrameMemo.shared() if memo else None)
+        self.fund_api_url = self.FUND_API_URL
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
         self.logger.info(f"Initializing data fetcher with source: {self.source}")
     
     def _ensure_cleaner(self) -> None:
@@ -30,61 +106,270 @@ class DataFetcher(BaseComponent):
     
     def fetch_data(self, symbol: str, start_date: str, end_date: Optional[str] = None, clean: bool = False,
                    interval: str = "1d") -> pd.DataFrame:
-        """Fetch stock data. interval: e.g. '1m', '1h', '1d' (default), '1wk', '1mo'."""
+        """
+        Fetch stock data. interval: e.g. '1m', '1h', '1d' (default), '1wk', '1mo'.
+        Concurrent identical requests (any DataFetcher in the process) share one download.
+        """
+        key = self._request_key(symbol, start_date, end_date, clean, interval)
+        if self.memo is not None:
+            data = self.memo.get(key)
+            if data is not None:
+                return data
+        data, shared = self._flights.do(key, lambda: self._fetch(key, symbol, start_date, end_date, clean, interval))
+        return data.copy() if shared else data
+
+    async def fetch_data_async(self, symbol: str, start_date: str, end_date: Optional[str] = None,
+                               clean: bool = False, interval: str = "1d") -> pd.DataFrame:
+        """fetch_data for asyncio: runs on the default executor and coalesces with in-flight identical
+        requests from other tasks and threads."""
+        key = self._request_key(symbol, start_date, end_date, clean, interval)
+        if self.memo is not None:
+            data = self.memo.get(key)
+            if data is not None:
+                return data
+        data, shared = await self._flights.do_async(
+            key, lambda: self._fetch(key, symbol, start_date, end_date, clean, interval))
+        return data.copy() if shared else data
+
+    def fetch_resampled(self, symbol: str, start_date: str, end_date: Optional[str] = None,
+                        interval: str = "5m", base_interval: str = "1m", clean: bool = False,
+                        partial: bool = True) -> pd.DataFrame:
+        """
+        Bars of interval derived locally from base_interval bars (e.g. 5m / 15m / 1h / 1d from 1m),
+        so one (cached) download serves every interval. partial=False drops an incomplete newest bar.
+        """
+        base = self.fetch_data(symbol, start_date, end_date, clean, base_interval)
+        if interval == base_interval:
+            return base
+        if self.resampler is None:
+            self.resampler = BarResampler()
+        return self.resampler.resample(base, interval, partial=partial)
+
+    def iter_data_chunks(self, symbol: str, start_date: str, end_date: Optional[str] = None,
+                         interval: str = "1d", chunk_size: int = 100_000, clean: bool = False,
+                         window_days: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield bars of [start_date, end_date) in chunks of chunk_size rows, fetching window_days calendar
+        days at a time (default 7 for intraday intervals, else 365) so only one window is held in memory.
+        Windows go through the cache / local source like fetch_data but bypass the in-memory memo.
+        """
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize() if end_date else pd.Timestamp(datetime.now().date()) + timedelta(days=1)
+        step = timedelta(days=window_days or (7 if is_intraday(interval) else 365))
+
+        def _windows() -> Iterator[pd.DataFrame]:
+            cursor = start
+            while cursor < end:
+                w_end = min(cursor + step, end)
+                s, e = cursor.strftime("%Y-%m-%d"), w_end.strftime("%Y-%m-%d")
+                yield self._fetch(None, symbol, s, e, clean, interval)
+                cursor = w_end
+
+        return rechunk(_windows(), chunk_size)
+
+    def _request_key(self, symbol: str, start_date: str, end_date: Optional[str], clean: bool,
+                     interval: str) -> tuple:
+        data_dir = str(self.local.data_dir) if self.local is not None else None
+        # Output dtypes depend on compact: the shared memo / single-flight must not mix them
+        compact = self.compact_rtol if self.compact else None
+        return (self.source, data_dir, symbol, str(start_date), str(end_date), interval, clean, compact)
+
+    def _fetch(self, key: Optional[tuple], symbol: str, start_date: str, end_date: Optional[str], clean: bool,
+               interval: str) -> pd.DataFrame:
+        """One fetch through cache / source, then cleaning and memoization (skipped when key is None)."""
         try:
             self.logger.info(f"Fetching data for {symbol} from {start_date} to {end_date}, interval={interval}")
-            data = yf.download(symbol, start=start_date, end=end_date, interval=interval, progress=False)
-            if isinstance(data.columns, pd.MultiIndex) and data.columns.nlevels > 1:
-                data = data.droplevel(level=1, axis=1)
+            if self.cache is not None:
+                data = self.cache.get(symbol, start_date, end_date, interval, downloader=self._download)
+            else:
+                data = self._download(symbol, start_date, end_date, interval)
             if clean:
                 self._ensure_cleaner()
                 data = self.cleaner.dropna(data)
-            return data
+            if self.compact:
+                data = compact_frame(data, rtol=self.compact_rtol)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch data for {symbol}: {str(e)}") from e
+        if self.memo is not None and key is not None and not data.empty:
+            self.memo.put(key, data, ttl=self.memo.ttl_for(interval, end_date))
+        return data
+
+    def _download(self, symbol: str, start_date: str, end_date: Optional[str], interval: str) -> pd.DataFrame:
+        """Download one symbol from Yahoo Finance with single-level columns (or read local files)."""
+        if self.local is not None:
+            return self.local.fetch(symbol, start_date, end_date, interval)
+        # yf.download logs failures and returns an empty frame; raise them so PriceCache does not
+        # record the range as covered
+        errors = _YahooErrors(symbol)
+        yf_logger = logging.getLogger("yfinance")
+        yf_logger.addHandler(errors)
+        try:
+            data = yf.download(symbol, start=start_date, end=end_date, interval=interval, progress=False)
+        finally:
+            yf_logger.removeHandler(errors)
+        if data is None or data.empty:
+            if errors.messages:
+                raise RuntimeError(f"Yahoo Finance download failed: {errors.messages[-1]}")
+            return pd.DataFrame()
+        if isinstance(data.columns, pd.MultiIndex) and data.columns.nlevels > 1:
+            data = data.droplevel(level=1, axis=1)
+        return data
 
     def fetch_data_multiple(self, symbols: List[str], start_date: str, end_date: Optional[str] = None, clean: bool = False,
-                            interval: str = "1d") -> Dict[str, pd.DataFrame]:
-        """Fetch data for multiple symbols."""
-        return {s: self.fetch_data(s, start_date, end_date, clean, interval) for s in symbols}
+                            interval: str = "1d", max_workers: int = 8, retries: int = 2,
+                            backoff: float = 1.0) -> FetchResult:
+        """
+        Fetch data for multiple symbols concurrently on a bounded thread pool.
+        Each symbol is retried with jittered exponential backoff (backoff * 2**attempt seconds, up to 25%
+        longer); a symbol that still fails or returns no data is reported in result.failed instead of raising.
+        """
+        unique = list(dict.fromkeys(symbols))
+        result = FetchResult()
+        if self.local is not None:
+            retries = 0  # a missing local file does not appear by retrying
+        if not unique:
+            return result
+        frames: Dict[str, pd.DataFrame] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as pool:
+            futures = {
+                pool.submit(self._fetch_with_retry, s, start_date, end_date, clean, interval, retries, backoff): s
+                for s in unique
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    frames[symbol] = future.result()
+                except Exception as e:
+                    result.failed[symbol] = str(e)
+        for s in unique:  # keep the requested order
+            if s in frames:
+                result[s] = frames[s]
+        if result.failed:
+            self.logger.warning(f"Failed to fetch {len(result.failed)}/{len(unique)} symbols: {', '.join(result.failed)}")
+        return result
+
+    def _fetch_with_retry(self, symbol: str, start_date: str, end_date: Optional[str], clean: bool,
+                          interval: str, retries: int, backoff: float) -> pd.DataFrame:
+        """fetch_data with retries; an empty frame counts as a failure (yfinance reports most errors that way)."""
+        for attempt in range(retries + 1):
+            try:
+                data = self.fetch_data(symbol, start_date, end_date, clean, interval)
+                if data is None or data.empty:
+                    raise ValueError(f"No data returned for {symbol}")
+                return data
+            except Exception as e:
+                if attempt >= retries:
+                    raise
+                delay = _backoff_delay(backoff, attempt)
+                self.logger.warning(f"Retry {attempt + 1}/{retries} for {symbol} in {delay:.1f}s: {e}")
+                time.sleep(delay)
     
-    def fetch_fund_data(self, code: str, page: Optional[int] = None) -> pd.DataFrame:
-        """Fetch fund net value data from East Money API."""
-        base_url = "https://fundf10.eastmoney.com/F10DataApi.aspx"
-        base_params = {"type": "lsjz", "per": 20, "code": code}
-        
-        # Internal function to fetch a single page
-        def _get_page(p: int) -> pd.DataFrame:
-            params = {**base_params, "page": p}
-            resp = requests.get(base_url, params=params)
-            self.logger.info(f"Fetching page {p} for fund {code}")
-            match = re.search(r'content:"([^"]+)"', resp.text, re.DOTALL)
-            if not match:
-                raise ValueError(f"Unable to parse API response (page={p})")
-            html_content = match.group(1).replace('\\r\\n', '\n').replace('\\"', '"')
-            dfs = pd.read_html(html_content)
-            return dfs[0] if dfs else pd.DataFrame()
-        
+    def fetch_fund_data(self, code: str, page: Optional[int] = None, since: Optional[str] = None,
+                        max_workers: int = 4, timeout: float = 10.0, retries: int = 2,
+                        backoff: float = 0.5) -> pd.DataFrame:
+        """
+        Fetch fund net value data from East Money API.
+
+        page: fetch one page only; None fetches every page (pages 2..N concurrently over a shared
+            keep-alive session, at most max_workers at a time, results in page order).
+        since: incremental mode. Pages are newest first, so fetching stops at the first page that
+            reaches this NAV date and only rows with 净值日期 > since are returned.
+        timeout/retries/backoff: per-request timeout in seconds and per-page retries with
+            jittered exponential backoff on network or parse errors.
+
+        With a cache (DataFetcher(cache=...)) and neither page nor since given, the NAV history is
+        kept in DataStorage: since is taken from the stored series' last date, only newer pages are
+        downloaded, and the whole merged history is returned (newest first) and saved back.
+        """
+        storage = self.cache.storage if self.cache is not None and page is None and since is None else None
+        stored = storage.load_fund_nav(code) if storage is not None else None
+        if stored is not None and not stored.empty:
+            last = self._fund_dates(stored).max()
+            since = None if pd.isna(last) else last.strftime("%Y-%m-%d")
         try:
-            # If page is None, fetch all pages
-            if page is None:
-                # First, get page 1 to determine total pages
-                params = {**base_params, "page": 1}
-                resp = requests.get(base_url, params=params)
-                match = re.search(r'pages:(\d+)', resp.text)
-                max_pages = int(match.group(1)) if match else 1
-                
-                self.logger.info(f"Fetching all pages for fund {code} (total pages: {max_pages})")
-                
-                # Fetch all pages
-                all_dfs = [_get_page(p) for p in range(1, max_pages + 1)]
-                result = pd.concat(all_dfs, ignore_index=True)
-                self.logger.info(f"Fetched {len(result)} records from {max_pages} pages")
+            if page is not None:
+                return self._fetch_fund_page(code, page, timeout, retries, backoff)[0]
+
+            self._http_session(max(1, max_workers))  # size the connection pool before the first request
+            first, max_pages = self._fetch_fund_page(code, 1, timeout, retries, backoff)
+            frames = {1: first}
+            cutoff = pd.Timestamp(since) if since is not None else None
+            self.logger.info(f"Fetching all pages for fund {code} (total pages: {max_pages})")
+
+            def _reached(df: pd.DataFrame) -> bool:
+                dates = self._fund_dates(df)
+                return cutoff is not None and bool((dates <= cutoff).any())
+
+            remaining = list(range(2, max_pages + 1))
+            if _reached(first):
+                remaining = []
+            workers = max(1, min(max_workers, len(remaining) or 1))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # Full fetch: one wave with every page; incremental: waves of `workers` pages
+                wave_size = len(remaining) if cutoff is None else workers
+                while remaining:
+                    wave, remaining = remaining[:wave_size], remaining[wave_size:]
+                    futures = {pool.submit(self._fetch_fund_page, code, p, timeout, retries, backoff): p
+                               for p in wave}
+                    for future in as_completed(futures):
+                        frames[futures[future]] = future.result()[0]
+                    if any(_reached(frames[p]) for p in wave):
+                        break
+
+            result = pd.concat([frames[p] for p in sorted(frames)], ignore_index=True)
+            if cutoff is not None:
+                result = result[(self._fund_dates(result) > cutoff).to_numpy()].reset_index(drop=True)
+            self.logger.info(f"Fetched {len(result)} records from {len(frames)} of {max_pages} pages")
+            if storage is None:
                 return result
-            
-            # Fetch specified page
-            self.logger.info(f"Fetching page {page} for fund {code}")
-            return _get_page(page)
+            if stored is not None and not stored.empty:
+                if result.empty:
+                    return stored
+                result = pd.concat([result, stored], ignore_index=True)
+                dates = self._fund_dates(result)
+                result = result[~dates.duplicated(keep="first") | dates.isna()].reset_index(drop=True)
+            storage.save_fund_nav(result, code)
+            return result
         except Exception as e:
             raise RuntimeError(f"Failed to fetch fund data for {code}: {str(e)}") from e
 
+    def _http_session(self, pool_size: int = 4) -> requests.Session:
+        """Shared keep-alive session, created on first use with a connection pool of pool_size."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def _fetch_fund_page(self, code: str, page: int, timeout: float, retries: int,
+                         backoff: float) -> Tuple[pd.DataFrame, int]:
+        """Fetch and parse one page: (table, total pages reported by the API)."""
+        params = {"type": "lsjz", "per": 20, "code": code, "page": page}
+        for attempt in range(retries + 1):
+            try:
+                self.logger.info(f"Fetching page {page} for fund {code}")
+                resp = self._http_session().get(self.fund_api_url, params=params, timeout=timeout)
+                resp.raise_for_status()
+                match = re.search(r'content:"([^"]+)"', resp.text, re.DOTALL)
+                if not match:
+                    raise ValueError(f"Unable to parse API response (page={page})")
+                html_content = match.group(1).replace('\\r\\n', '\n').replace('\\"', '"')
+                dfs = pd.read_html(StringIO(html_content))
+                pages = re.search(r'pages:(\d+)', resp.text)
+                return (dfs[0] if dfs else pd.DataFrame()), (int(pages.group(1)) if pages else 1)
+            except (requests.RequestException, ValueError) as e:
+                if attempt >= retries:
+                    raise
+                delay = _backoff_delay(backoff, attempt)
+                self.logger.warning(f"Retry {attempt + 1}/{retries} for fund {code} page {page} in {delay:.1f}s: {e}")
+                time.sleep(delay)
+
+    @staticmethod
+    def _fund_dates(df: pd.DataFrame) -> pd.Series:
+        if "净值日期" not in df:
+            return pd.Series(pd.NaT, index=df.index)
+        return pd.to_datetime(df["净值日期"], errors="coerce")
+
@@ -0,0 +1,239 @@
+"""
+File formats for DataStorage.
+
+Parquet keeps dtypes and timezones, compresses by column and pushes column
+projection and date-range filters down to the reader (row groups outside the
+range are skipped). Feather (Arrow IPC) is the fastest format to load. Both need
+pyarrow; CSV (utf-8-sig) is the dependency-free fallback and stays readable, so
+existing caches keep working after switching formats.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.dataset as pa_ds
+    import pyarrow.feather as pa_feather
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+def _filter_frame(data: pd.DataFrame, start, end, date_column: Optional[str]) -> pd.DataFrame:
+    """Keep rows with start <= date < end (on the index, or date_column if given)."""
+    if start is None and end is None:
+        return data
+    values = data[date_column] if date_column else data.index
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        # CSV with mixed UTC offsets (DST) stays as strings: compare on the wall-clock part
+        values = pd.Index(values.astype(str).str.slice(0, 19))
+    dates = pd.DatetimeIndex(pd.to_datetime(values))
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    mask = np.ones(len(dates), dtype=bool)
+    if start is not None:
+        mask &= np.asarray(dates >= pd.Timestamp(start))
+    if end is not None:
+        mask &= np.asarray(dates < pd.Timestamp(end))
+    return data[mask]
+
+
+def rechunk(frames: Iterable[pd.DataFrame], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Regroup a stream of frames into chunks of exactly chunk_size rows (the last may be shorter)."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    pending: List[pd.DataFrame] = []
+    rows = 0
+    for frame in frames:
+        if frame is None or frame.empty:
+            continue
+        pending.append(frame)
+        rows += len(frame)
+        if rows < chunk_size:
+            continue
+        buf = pd.concat(pending) if len(pending) > 1 else pending[0]
+        cut = rows - rows % chunk_size
+        for i in range(0, cut, chunk_size):
+            yield buf.iloc[i: i + chunk_size]
+        pending = [buf.iloc[cut:]] if cut < rows else []
+        rows -= cut
+    if rows:
+        yield pd.concat(pending) if len(pending) > 1 else pending[0]
+
+
+class StorageFormat:
+    """Read/write one file format. Date filters are half-open: start <= date < end."""
+
+    name = ""
+    suffix = ""
+
+    def write(self, data: pd.DataFrame, path: Path, index: bool = True,
+              compression: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    def read(self, path: Path, index: bool = True, columns: Optional[Sequence[str]] = None,
+             start=None, end=None, date_column: Optional[str] = None) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def iter_chunks(self, path: Path, chunk_size: int, index: bool = True,
+                    columns: Optional[Sequence[str]] = None, start=None, end=None,
+                    date_column: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """Stream read() in chunks of chunk_size rows without loading the whole file."""
+        raise NotImplementedError
+
+
+class CsvFormat(StorageFormat):
+    """UTF-8-BOM CSV; projection and date filters are applied after parsing."""
+
+    name = "csv"
+    suffix = ".csv"
+
+    def write(self, data, path, index=True, compression=None):
+        data.to_csv(path, encoding="utf-8-sig", index=index)
+
+    def read(self, path, index=True, columns=None, start=None, end=None, date_column=None):
+        usecols = None
+        if columns is not None:
+            header = pd.read_csv(path, nrows=0, encoding="utf-8-sig").columns
+            wanted = set(columns) | ({header[0]} if index else set()) | ({date_column} if date_column else set())
+            usecols = [c for c in header if c in wanted]
+        if index:
+            data = pd.read_csv(path, index_col=0, parse_dates=True, encoding="utf-8-sig", usecols=usecols)
+        else:
+            data = pd.read_csv(path, encoding="utf-8-sig", usecols=usecols)
+        data = _filter_frame(data, start, end, date_column)
+        if columns is not None and date_column and date_column not in columns:
+            data = data.drop(columns=date_column)
+        return data
+
+    def iter_chunks(self, path, chunk_size, index=True, columns=None, start=None, end=None, date_column=None):
+        usecols = None
+        if columns is not None:
+            header = pd.read_csv(path, nrows=0, encoding="utf-8-sig").columns
+            wanted = set(columns) | ({header[0]} if index else set()) | ({date_column} if date_column else set())
+            usecols = [c for c in header if c in wanted]
+        reader = pd.read_csv(path, index_col=0 if index else None, parse_dates=index, encoding="utf-8-sig",
+                             usecols=usecols, chunksize=chunk_size)
+
+        def _parts() -> Iterator[pd.DataFrame]:
+            with reader:
+                for part in reader:
+                    part = _filter_frame(part, start, end, date_column)
+                    if columns is not None and date_column and date_column not in columns:
+                        part = part.drop(columns=date_column)
+                    yield part
+
+        return rechunk(_parts(), chunk_size)
+
+
+class _ArrowFormat(StorageFormat):
+    """Shared pyarrow.dataset reader: projection and filters run inside Arrow before pandas conversion."""
+
+    dataset_format = ""
+    default_compression = ""
+
+    def read(self, path, index=True, columns=None, start=None, end=None, date_column=None):
+        dataset, read_cols, expr = self._plan(path, columns, start, end, date_column)
+        data = dataset.to_table(columns=read_cols, filter=expr).to_pandas()
+        return self._finish(data, columns, start, end, date_column, expr)
+
+    def iter_chunks(self, path, chunk_size, index=True, columns=None, start=None, end=None, date_column=None):
+        dataset, read_cols, expr = self._plan(path, columns, start, end, date_column)
+        scanner = dataset.scanner(columns=read_cols, filter=expr, batch_size=chunk_size)
+        metadata = dataset.schema.metadata
+
+        def _parts() -> Iterator[pd.DataFrame]:
+            for batch in scanner.to_batches():
+                if batch.num_rows:
+                    # Keep the pandas metadata so the index and dtypes are restored per batch
+                    table = pa.Table.from_batches([batch]).replace_schema_metadata(metadata)
+                    yield self._finish(table.to_pandas(), columns, start, end, date_column, expr)
+
+        return rechunk(_parts(), chunk_size)
+
+    @staticmethod
+    def _finish(data, columns, start, end, date_column, expr):
+        if (start is not None or end is not None) and expr is None:
+            data = _filter_frame(data, start, end, date_column)
+        if columns is not None and date_column and date_column not in columns:
+            data = data.drop(columns=date_column)
+        return data
+
+    def _plan(self, path, columns, start, end, date_column):
+        """Dataset, projected columns and pushed-down filter expression for a read."""
+        dataset = pa_ds.dataset(str(path), format=self.dataset_format)
+        schema = dataset.schema
+        meta = schema.pandas_metadata or {}
+        index_cols = [c for c in meta.get("index_columns", []) if isinstance(c, str)]
+        field = date_column or (index_cols[0] if index_cols else None)
+
+        expr = None
+        if field is not None and field in schema.names and (start is not None or end is not None):
+            ftype = schema.field(field).type
+            if pa.types.is_timestamp(ftype):
+                for bound, op in ((start, "ge"), (end, "lt")):
+                    if bound is None:
+                        continue
+                    ts = pd.Timestamp(bound)
+                    if ftype.tz is not None:  # naive bounds are wall-clock times in the column's timezone
+                        ts = ts.tz_localize(ftype.tz) if ts.tzinfo is None else ts.tz_convert(ftype.tz)
+                    cond = getattr(pa_ds.field(field), f"__{op}__")(pa.scalar(ts, type=ftype))
+                    expr = cond if expr is None else expr & cond
+            else:
+                field = None  # not a timestamp: fall back to filtering in pandas
+
+        read_cols: Optional[List[str]] = None
+        if columns is not None:
+            extra = index_cols + ([date_column] if date_column else [])
+            read_cols = [c for c in schema.names if c in set(columns) | set(extra)]
+        return dataset, read_cols, expr
+
+
+class ParquetFormat(_ArrowFormat):
+    name = "parquet"
+    suffix = ".parquet"
+    dataset_format = "parquet"
+    default_compression = "snappy"
+
+    def write(self, data, path, index=True, compression=None):
+        data.to_parquet(path, engine="pyarrow", index=index, compression=compression or self.default_compression)
+
+
+class FeatherFormat(_ArrowFormat):
+    name = "feather"
+    suffix = ".feather"
+    dataset_format = "ipc"
+    default_compression = "lz4"
+
+    def write(self, data, path, index=True, compression=None):
+        table = pa.Table.from_pandas(data, preserve_index=index)
+        pa_feather.write_feather(table, str(path), compression=compression or self.default_compression)
+
+
+FORMATS: Dict[str, StorageFormat] = {f.name: f for f in (ParquetFormat(), FeatherFormat(), CsvFormat())}
+SUFFIXES: Dict[str, StorageFormat] = {f.suffix: f for f in FORMATS.values()}
+
+
+def arrow_available() -> bool:
+    """True when pyarrow is installed (Parquet / Feather supported)."""
+    return pa is not None
+
+
+def get_format(name: str = "auto") -> StorageFormat:
+    """Resolve a format name; "auto" is Parquet when pyarrow is installed, else CSV."""
+    name = (name or "auto").lower().lstrip(".")
+    if name == "auto":
+        return FORMATS["parquet"] if arrow_available() else FORMATS["csv"]
+    if name not in FORMATS:
+        raise ValueError(f"Unknown storage format: {name}. Must be one of {', '.join(FORMATS)} or 'auto'")
+    if name != "csv" and not arrow_available():
+        raise ImportError(f"Storage format '{name}' requires pyarrow (pip install pyarrow)")
+    return FORMATS[name]
+
+
+def format_for(path: Path) -> Optional[StorageFormat]:
+    """Format of an existing file by suffix, None if unsupported."""
+    return SUFFIXES.get(Path(path).suffix.lower())
@@ -0,0 +1,210 @@
+"""
+Offline local-file data source for DataFetcher.
+
+`LocalDataSource` serves OHLCV bars from a directory of CSV / Parquet / Feather
+files, e.g. the `price/` tree written by DataStorage (saved price files and the
+PriceCache histories under `{symbol}/_cache`, one file per year) or any folder of `{symbol}.csv`.
+A file belongs to a symbol when its name is exactly `{symbol}`, `{symbol}_{interval}`,
+`{symbol}_{start}_{end}` or `{symbol}_{YYYYMMDD}` (plus the suffix), so AAPL never picks
+up AAPL_X files. The first time a file is needed only its index and close column
+are read to record its interval and date range; that in-memory index decides
+which files a request touches, and later reads push the date range down to
+the reader.
+
+Output follows the yfinance conventions used elsewhere: Open/High/Low/Close/Volume
+columns, a DatetimeIndex named "Date" (daily and longer) or "Datetime" (intraday)
+and half-open [start_date, end_date) selection on exchange wall-clock time.
+"""
+
+import json
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..core.base import BaseComponent
+from ..core.config import Config
+from .formats import SUFFIXES, format_for
+
+_COLUMNS = {"open": "Open", "high": "High", "low": "Low", "close": "Close",
+            "adj close": "Adj Close", "adj_close": "Adj Close", "volume": "Volume"}
+_ALIASES = {"60m": "1h", "1w": "1wk"}
+_INTERVALS = {
+    "1m": pd.Timedelta(minutes=1), "2m": pd.Timedelta(minutes=2), "5m": pd.Timedelta(minutes=5),
+    "15m": pd.Timedelta(minutes=15), "30m": pd.Timedelta(minutes=30), "1h": pd.Timedelta(hours=1),
+    "90m": pd.Timedelta(minutes=90), "1d": pd.Timedelta(days=1), "1wk": pd.Timedelta(days=7),
+    "1mo": pd.Timedelta(days=30), "3mo": pd.Timedelta(days=91),
+}
+
+# What may follow `{symbol}_` in a file name: an interval, a saved date range or a save date
+_STEM_SUFFIX = r"\d+(?:m|h|d|wk|w|mo)|\d{4}-?\d{2}-?\d{2}_\d{4}-?\d{2}-?\d{2}|\d{8}"
+
+
+def _interval_key(interval: str) -> str:
+    return _ALIASES.get(interval, interval)
+
+
+def infer_interval(index: pd.DatetimeIndex) -> str:
+    """Nearest yfinance interval code for the median bar spacing (daily if fewer than two bars)."""
+    if len(index) < 2:
+        return "1d"
+    step = pd.Series(index[:1000]).diff().dropna().median()
+    if step <= pd.Timedelta(0):
+        return "1d"
+    codes = list(_INTERVALS)
+    dist = np.abs(np.log([step / td for td in _INTERVALS.values()]))
+    return codes[int(np.argmin(dist))]
+
+
+def _to_index(index: pd.Index, tz: Optional[str]) -> pd.DatetimeIndex:
+    """Parse an index read from disk; mixed UTC offsets (DST) are unified through UTC."""
+    if not isinstance(index, pd.DatetimeIndex):
+        try:
+            index = pd.DatetimeIndex(pd.to_datetime(index))
+        except (ValueError, TypeError):
+            index = pd.DatetimeIndex(pd.to_datetime(index, utc=True))
+    if tz:
+        index = index.tz_localize("UTC") if index.tz is None else index
+        index = index.tz_convert(tz)
+    return index
+
+
+@dataclass
+class _LocalFile:
+    path: Path
+    mtime: float
+    interval: str
+    tz: Optional[str]
+    start: pd.Timestamp  # wall-clock, inclusive
+    end: pd.Timestamp    # wall-clock, last bar
+    rows: int
+
+
+class LocalDataSource(BaseComponent):
+    """Serve fetch_data requests from local price files, indexed by symbol, interval and date range."""
+
+    def __init__(self, data_dir: Optional[Union[str, Path]] = None, **kwargs: Any) -> None:
+        """data_dir: directory searched recursively (default: DataStorage price directory)."""
+        super().__init__(**kwargs)
+        self.data_dir = Path(data_dir) if data_dir is not None else Config().get_cache_dir() / "price"
+        self._lock = threading.Lock()
+        self._files: Dict[str, List[Path]] = {}
+        self._entries: Dict[Path, Tuple[float, Optional[_LocalFile]]] = {}  # path -> (mtime, entry)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Rescan data_dir for files (e.g. after new data was saved)."""
+        files: Dict[str, List[Path]] = {}
+        if self.data_dir.exists():
+            for suffix in SUFFIXES:
+                for path in self.data_dir.rglob("*" + suffix):
+                    if path.is_file():
+                        files.setdefault(self._stem(path), []).append(path)
+        with self._lock:
+            self._files = files
+            self._entries = {p: v for p, v in self._entries.items() if p.exists() and p.stat().st_mtime == v[0]}
+        self.logger.info(f"Indexed {sum(len(v) for v in files.values())} local files in: {self.data_dir}")
+
+    def available(self, symbol: str) -> List[Dict[str, Any]]:
+        """Local files of a symbol with their interval, first/last bar and row count."""
+        return [{"path": str(e.path), "interval": e.interval, "start": e.start, "end": e.end, "rows": e.rows}
+                for e in self._entries_for(symbol)]
+
+    def fetch(self, symbol: str, start_date: str, end_date: Optional[str] = None,
+              interval: str = "1d") -> pd.DataFrame:
+        """Bars of one symbol/interval with start_date <= date < end_date, merged across files (newest file wins)."""
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date) if end_date else pd.Timestamp(datetime.now().date()) + timedelta(days=1)
+        key = _interval_key(interval)
+        entries = [e for e in self._entries_for(symbol)
+                   if e.interval == key and e.start < end and e.end >= start]
+        if not entries:
+            self.logger.warning(f"No local {interval} data for {symbol} in {start.date()} -> {end.date()}")
+            return pd.DataFrame()
+
+        frames = []
+        for entry in sorted(entries, key=lambda e: e.mtime):
+            # Widen the pushed-down bounds by a day: files may store UTC while bounds are wall-clock
+            data = format_for(entry.path).read(entry.path, index=True,
+                                               start=start - timedelta(days=1), end=end + timedelta(days=1))
+            data.index = _to_index(data.index, entry.tz)
+            frames.append(data.rename(columns=lambda c: _COLUMNS.get(str(c).lower(), c)))
+        data = pd.concat(frames) if len(frames) > 1 else frames[0]
+        data = data[~data.index.duplicated(keep="last")].sort_index()
+        local = data.index.tz_localize(None) if data.index.tz is not None else data.index
+        data = data[(local >= start) & (local < end)]
+        data.index.name = "Datetime" if _INTERVALS.get(key, _INTERVALS["1d"]) < _INTERVALS["1d"] else "Date"
+        return data
+
+    # ------------------------------------------------------------------ index
+
+    def _entries_for(self, symbol: str) -> List[_LocalFile]:
+        names = "|".join(re.escape(n) for n in {symbol, symbol.replace(".", "_")})
+        pattern = re.compile(f"(?:{names})(?:_(?:{_STEM_SUFFIX}))?")
+        with self._lock:
+            paths = [p for stem, ps in self._files.items() if pattern.fullmatch(stem) for p in ps]
+        entries = []
+        for path in paths:
+            entry = self._entry(path)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def _entry(self, path: Path) -> Optional[_LocalFile]:
+        """Index entry of a file, scanned once (only index and close are read); None if not price data."""
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        entry = self._scan(path, mtime)
+        with self._lock:
+            self._entries[path] = (mtime, entry)
+        return entry
+
+    def _scan(self, path: Path, mtime: float) -> Optional[_LocalFile]:
+        meta = self._cache_meta(path)
+        try:
+            data = format_for(path).read(path, index=True, columns=["Close", "close"])
+            if data.empty or not len(data.columns):
+                return None
+            index = _to_index(data.index, meta.get("tz"))
+        except Exception as e:
+            self.logger.debug(f"Skipping {path}: {e}")
+            return None
+        if not index.is_monotonic_increasing:
+            index = index.sort_values()
+        local = index.tz_localize(None) if index.tz is not None else index
+        interval = _interval_key(meta["interval"]) if meta.get("interval") else infer_interval(local)
+        return _LocalFile(path, mtime, interval, meta.get("tz"), local[0], local[-1], len(index))
+
+    @staticmethod
+    def _stem(path: Path) -> str:
+        """File name without suffix; yearly PriceCache files (`_cache/{symbol}_{interval}/{year}`) use their folder."""
+        if path.parent.parent.name == "_cache":
+            return path.parent.name
+        return path.name[: -len(path.suffix)]
+
+    @staticmethod
+    def _cache_meta(path: Path) -> Dict[str, Any]:
+        """PriceCache sidecar (interval and timezone) of a cached history, {} for other files."""
+        if path.parent.parent.name == "_cache":
+            sidecar = path.parent.with_name(path.parent.name + ".json")
+        elif path.parent.name == "_cache":
+            sidecar = path.with_name(path.name[: -len(path.suffix)] + ".json")
+        else:
+            return {}
+        if not sidecar.exists():
+            return {}
+        try:
+            return json.loads(sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
@@ -0,0 +1,140 @@
+"""
+In-process memoization of fetched frames for DataFetcher.
+
+`FrameMemo` keeps recently fetched DataFrames keyed by request parameters in an
+LRU bounded by total memory (bytes, as reported by DataFrame.memory_usage).
+Requests whose data can still change (intraday intervals and ranges reaching
+today) expire after `live_ttl` seconds; closed historical ranges never expire.
+Callers get a private copy, so mutating a returned frame never alters the cache:
+with pandas Copy-on-Write (always on from pandas 3) that copy is shallow and
+costs microseconds, otherwise it is a deep copy.
+
+`FrameMemo.shared()` is one process-wide instance, so every DataFetcher created
+with `memo=True` (backtests, sweeps, notebooks) reuses the same entries.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from ..core.base import BaseComponent
+
+
+def _copy_on_write() -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return bool(pd.get_option("mode.copy_on_write"))
+    except Exception:  # pandas < 1.5 has no Copy-on-Write
+        return False
+
+
+def is_intraday(interval: str) -> bool:
+    """True for minute / hour intervals such as '1m', '90m', '1h'."""
+    return interval.endswith("h") or (interval.endswith("m") and not interval.endswith("mo"))
+
+
+class FrameMemo(BaseComponent):
+    """Thread-safe LRU of DataFrames with a byte budget, optional TTL and hit/miss counters."""
+
+    _shared: Optional["FrameMemo"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, live_ttl: float = 60.0, **kwargs: Any) -> None:
+        """
+        Args:
+            max_bytes: Memory budget; least recently used frames are evicted beyond it.
+            live_ttl: Seconds an entry for an intraday interval or a range reaching today stays valid.
+        """
+        super().__init__(**kwargs)
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[pd.DataFrame, int, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._deep_copy = not _copy_on_write()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @classmethod
+    def shared(cls) -> "FrameMemo":
+        """Process-wide instance used by DataFetcher(memo=True)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def ttl_for(self, interval: str, end_date: Any) -> Optional[float]:
+        """live_ttl for data that can still change (intraday, or a range open-ended or including today), else None."""
+        if is_intraday(interval) or end_date is None:
+            return self.live_ttl
+        return self.live_ttl if pd.Timestamp(end_date).date() > datetime.now().date() else None
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """Copy of the cached frame, None on a miss or an expired entry."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[2] is not None and time.monotonic() >= item[2]:
+                self._drop(key)
+                self.expirations += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            frame = item[0]
+        return frame.copy(deep=self._deep_copy)
+
+    def put(self, key: Hashable, frame: pd.DataFrame, ttl: Optional[float] = None) -> None:
+        """Store a copy of frame; frames larger than max_bytes are not cached."""
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        expires = time.monotonic() + ttl if ttl is not None else None
+        frame = frame.copy(deep=self._deep_copy)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (frame, size, expires)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop every entry, or only those whose key contains symbol."""
+        with self._lock:
+            for key in [k for k in self._entries if symbol is None or symbol in k]:
+                self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """entries, bytes, hits, misses, hit_rate, evictions, expirations."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
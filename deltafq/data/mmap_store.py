@@ -0,0 +1,222 @@
+"""
+Memory-mapped columnar price store for large universes.
+
+Each field (timestamp, open, high, low, close, volume) is one flat binary array
+holding the bars of every symbol back to back; `symbols.json` maps a symbol to
+its (offset, length) segment. Readers map the arrays read-only with np.memmap,
+so symbol/date slices are NumPy views and any number of worker processes share
+the OS page cache instead of holding private DataFrames.
+
+Layout:
+    {root}/timestamp.i8     int64 ns since epoch (UTC), ascending within a symbol
+    {root}/open.f8 ... volume.f8
+    {root}/symbols.json     {"symbols": {symbol: {"offset", "length", "tz"}}, "rows": N}
+
+Typical usage:
+    store = MmapPriceStore("data_cache/mmap/1m")
+    store.write({"AAPL": df_aapl, "MSFT": df_msft})      # or store.append(symbol, df)
+    bars = store.get("AAPL", "2024-01-01", "2024-02-01")  # dict of zero-copy arrays
+
+One writer at a time; readers in other processes call refresh() to see new symbols.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..core.base import BaseComponent
+
+FIELDS = {
+    "timestamp": np.dtype("<i8"),
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+_COLUMNS = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+_DIRECTORY = "symbols.json"
+
+
+def _file_name(field: str) -> str:
+    return f"{field}.{FIELDS[field].kind}{FIELDS[field].itemsize}"
+
+
+def _to_utc_ns(index: pd.Index) -> np.ndarray:
+    idx = pd.DatetimeIndex(index)
+    if idx.tz is not None:
+        idx = idx.tz_convert("UTC").tz_localize(None)
+    return idx.values.astype("datetime64[ns]").astype(np.int64)
+
+
+def _bound_ns(value: Any, tz: Optional[str]) -> int:
+    """Date bound -> UTC ns; naive bounds are read in the symbol's timezone."""
+    ts = pd.Timestamp(value)
+    if tz and ts.tzinfo is None:
+        ts = ts.tz_localize(tz)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return int(ts.value)
+
+
+class MmapPriceStore(BaseComponent):
+    """Per-field memory-mapped OHLCV arrays with a symbol directory; slices are zero-copy views."""
+
+    def __init__(self, root: Union[str, Path], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._directory: Dict[str, Dict[str, Any]] = {}
+        self._rows = 0
+        self._maps: Dict[str, np.ndarray] = {}
+        self._load_directory()
+
+    # ------------------------------------------------------------------ reading
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._directory)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._directory
+
+    def __len__(self) -> int:
+        return len(self._directory)
+
+    def info(self, symbol: str) -> Dict[str, Any]:
+        """Segment info of a symbol: offset, length, tz, first and last timestamp."""
+        entry = dict(self._entry(symbol))
+        ts = self._map("timestamp")[entry["offset"]: entry["offset"] + entry["length"]]
+        entry["first"] = pd.Timestamp(int(ts[0])) if len(ts) else None
+        entry["last"] = pd.Timestamp(int(ts[-1])) if len(ts) else None
+        return entry
+
+    def get(self, symbol: str, start: Any = None, end: Any = None,
+            fields: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Arrays of one symbol with start <= timestamp < end, as read-only views of the mapped files.
+
+        Naive bounds are wall-clock times in the symbol's timezone. Timestamps are int64 UTC ns.
+        """
+        entry = self._entry(symbol)
+        lo, hi = entry["offset"], entry["offset"] + entry["length"]
+        ts = self._map("timestamp")[lo:hi]
+        i = 0 if start is None else int(np.searchsorted(ts, _bound_ns(start, entry["tz"]), side="left"))
+        j = len(ts) if end is None else int(np.searchsorted(ts, _bound_ns(end, entry["tz"]), side="left"))
+        return {f: self._map(f)[lo + i: lo + j] for f in (fields or list(FIELDS))}
+
+    def frame(self, symbol: str, start: Any = None, end: Any = None) -> pd.DataFrame:
+        """get() as an OHLCV DataFrame (Open/High/Low/Close/Volume) indexed by timestamp."""
+        arrays = self.get(symbol, start, end)
+        index = pd.DatetimeIndex(arrays.pop("timestamp").view("datetime64[ns]"), name="Date")
+        tz = self._directory[symbol]["tz"]
+        if tz:
+            index = index.tz_localize("UTC").tz_convert(tz)
+        return pd.DataFrame({_COLUMNS[f]: a for f, a in arrays.items()}, index=index, copy=False)
+
+    # ------------------------------------------------------------------ writing
+
+    def write(self, data: Mapping[str, pd.DataFrame]) -> None:
+        """Build the store from {symbol: OHLCV DataFrame}, replacing any existing contents."""
+        with self._lock:
+            self._close_maps()
+            self.root.mkdir(parents=True, exist_ok=True)
+            directory: Dict[str, Dict[str, Any]] = {}
+            # Write new files and swap them in, so readers mapping the old files are never truncated
+            handles = {f: open(self.root / (_file_name(f) + ".tmp"), "wb") for f in FIELDS}
+            rows = 0
+            try:
+                for symbol, df in data.items():
+                    n = self._write_segment(handles, df)
+                    directory[symbol] = {"offset": rows, "length": n, "tz": self._tz(df)}
+                    rows += n
+            finally:
+                for fh in handles.values():
+                    fh.close()
+            for f in FIELDS:
+                os.replace(self.root / (_file_name(f) + ".tmp"), self.root / _file_name(f))
+            self._save_directory(directory, rows)
+        self.logger.info(f"Wrote {len(directory)} symbols ({rows} bars) to: {self.root}")
+
+    def append(self, symbol: str, df: pd.DataFrame) -> None:
+        """
+        Add one symbol at the end of the arrays without rewriting the others.
+        An existing symbol is re-pointed to the new segment; its old rows stay as dead space
+        until the next write().
+        """
+        with self._lock:
+            self._close_maps()
+            self.root.mkdir(parents=True, exist_ok=True)
+            ts_path = self.root / _file_name("timestamp")
+            offset = ts_path.stat().st_size // FIELDS["timestamp"].itemsize if ts_path.exists() else 0
+            handles = {f: open(self.root / _file_name(f), "ab") for f in FIELDS}
+            try:
+                n = self._write_segment(handles, df)
+            finally:
+                for fh in handles.values():
+                    fh.close()
+            directory = dict(self._directory)
+            directory[symbol] = {"offset": offset, "length": n, "tz": self._tz(df)}
+            self._save_directory(directory, offset + n)
+
+    def refresh(self) -> None:
+        """Re-read the directory (e.g. after another process wrote the store)."""
+        with self._lock:
+            self._close_maps()
+            self._load_directory()
+
+    # ------------------------------------------------------------------ internals
+
+    @staticmethod
+    def _tz(df: pd.DataFrame) -> Optional[str]:
+        tz = getattr(df.index, "tz", None)
+        return str(tz) if tz is not None else None
+
+    @staticmethod
+    def _write_segment(handles: Dict[str, Any], df: pd.DataFrame) -> int:
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        handles["timestamp"].write(_to_utc_ns(df.index).tobytes())
+        for field, col in _COLUMNS.items():
+            values = df[col].to_numpy(dtype=FIELDS[field], na_value=np.nan) if col in df else np.full(len(df), np.nan)
+            handles[field].write(np.ascontiguousarray(values, dtype=FIELDS[field]).tobytes())
+        return len(df)
+
+    def _entry(self, symbol: str) -> Dict[str, Any]:
+        entry = self._directory.get(symbol)
+        if entry is None:
+            raise KeyError(f"Symbol not in price store: {symbol}")
+        return entry
+
+    def _map(self, field: str) -> np.ndarray:
+        arr = self._maps.get(field)
+        if arr is None:
+            if self._rows == 0:
+                arr = np.empty(0, dtype=FIELDS[field])
+            else:
+                arr = np.memmap(self.root / _file_name(field), dtype=FIELDS[field], mode="r", shape=(self._rows,))
+            self._maps[field] = arr
+        return arr
+
+    def _close_maps(self) -> None:
+        self._maps = {}  # mappings are released when the last view goes away
+
+    def _load_directory(self) -> None:
+        path = self.root / _DIRECTORY
+        if not path.exists():
+            self._directory, self._rows = {}, 0
+            return
+        meta = json.loads(path.read_text(encoding="utf-8"))
+        self._directory, self._rows = meta["symbols"], int(meta["rows"])
+
+    def _save_directory(self, directory: Dict[str, Dict[str, Any]], rows: int) -> None:
+        path = self.root / _DIRECTORY
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({"rows": rows, "fields": list(FIELDS), "symbols": directory}), encoding="utf-8")
+        os.replace(tmp, path)
+        self._directory, self._rows = directory, rows
@@ -0,0 +1,210 @@
+"""
+Local OHLCV resampling for derived intervals.
+
+`BarResampler` turns stored lower-interval bars (e.g. cached 1m data) into
+higher intervals ("5m", "15m", "1h", "1d", "1wk", "1mo") so one download serves
+every interval. Aggregation is Open=first, High=max, Low=min, Close=last,
+Volume=sum (other columns: last), computed with NumPy reduceat over contiguous
+buckets, no per-bar Python.
+
+Intraday buckets are anchored at the session open (given, or the most common
+first-bar time of day) and never cross days, so 1h bars start at 09:30 like
+yfinance and the last bucket of a session is simply shorter. Labels follow each
+bar's own UTC offset, so DST changes need no special casing. Only the newest
+bucket can be incomplete (source data ends before its end or the session close);
+`partial=False` drops it.
+
+Outputs are kept in a small LRU keyed by interval and a fingerprint of the
+source frame, so repeated requests on unchanged data are served from memory.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from datetime import time as dtime
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..core.base import BaseComponent
+from .memo import _copy_on_write
+
+_DAY_NS = 86_400 * 10**9
+_INTRADAY = re.compile(r"^(\d+)(m|h)$")
+
+
+def _offset_ns(value: Any) -> int:
+    """'09:30' / datetime.time -> ns after midnight."""
+    t = value if isinstance(value, dtime) else pd.Timestamp(f"2000-01-01 {value}").time()
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 10**9
+
+
+def _ns(index: pd.DatetimeIndex) -> np.ndarray:
+    return index.values.astype("datetime64[ns]").astype(np.int64)
+
+
+def _mode(values: np.ndarray) -> int:
+    uniq, counts = np.unique(values, return_counts=True)
+    return int(uniq[np.argmax(counts)])
+
+
+def interval_ns(interval: str) -> Optional[int]:
+    """Length of an intraday or daily interval in ns; None for calendar intervals (1wk, 1mo)."""
+    m = _INTRADAY.match(interval)
+    if m:
+        return int(m.group(1)) * (60 if m.group(2) == "m" else 3600) * 10**9
+    if interval == "1d":
+        return _DAY_NS
+    if interval in ("1wk", "1mo"):
+        return None
+    raise ValueError(f"Unsupported interval: {interval}. Use Nm, Nh, 1d, 1wk or 1mo")
+
+
+class BarResampler(BaseComponent):
+    """Vectorized OHLCV resampler with session-aware intraday buckets and an output cache."""
+
+    def __init__(self, session_start: Optional[Any] = None, session_end: Optional[Any] = None,
+                 max_cache: int = 64, **kwargs: Any) -> None:
+        """
+        Args:
+            session_start: Session open ("09:30"); None infers it from the data.
+            session_end: Session close ("16:00"); None infers it from the data. Used to tell
+                whether the newest bucket is complete.
+            max_cache: Number of resampled frames kept in memory.
+        """
+        super().__init__(**kwargs)
+        self.session_start = session_start
+        self.session_end = session_end
+        self.max_cache = max_cache
+        self._cache: "OrderedDict[Hashable, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._deep_copy = not _copy_on_write()
+        self.hits = self.misses = 0
+
+    def resample(self, bars: pd.DataFrame, interval: str, partial: bool = True) -> pd.DataFrame:
+        """
+        Aggregate bars (DatetimeIndex, ascending, OHLCV columns) to interval.
+
+        partial: keep the newest bucket even if the source data does not cover it fully.
+        Intraday results keep the source timezone and are indexed "Datetime"; daily and
+        longer results are indexed by naive dates named "Date".
+        """
+        if bars is None or bars.empty:
+            return pd.DataFrame()
+        key = (interval, partial, self._fingerprint(bars))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached.copy(deep=self._deep_copy)
+            self.misses += 1
+        result = self._resample(bars, interval, partial)
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.max_cache:
+                self._cache.popitem(last=False)
+        return result.copy(deep=self._deep_copy)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # ------------------------------------------------------------------ internals
+
+    @staticmethod
+    def _fingerprint(bars: pd.DataFrame) -> Tuple:
+        """Cache key of a source frame: shape, bounds, Close sum and every value of the last row,
+        so a forming bar whose High/Low/Volume moved without a Close change is not served stale."""
+        idx = bars.index
+        close = bars["Close"].to_numpy(dtype=np.float64, na_value=np.nan) if "Close" in bars else np.zeros(1)
+        last = tuple(None if pd.isna(v) else v for v in bars.iloc[-1].tolist())  # NaN != NaN would never hit
+        return (len(bars), idx[0], idx[-1], float(np.nansum(close)), last, tuple(bars.columns))
+
+    def _resample(self, bars: pd.DataFrame, interval: str, partial: bool) -> pd.DataFrame:
+        if not bars.index.is_monotonic_increasing:
+            bars = bars.sort_index()
+        index = pd.DatetimeIndex(bars.index)
+        tz = index.tz
+        local = _ns(index.tz_localize(None) if tz is not None else index)
+        utc = _ns(index)  # UTC when tz-aware, wall clock otherwise
+        day = local - local % _DAY_NS
+        src_step = int(np.median(np.diff(local))) if len(local) > 1 else _DAY_NS
+        step = interval_ns(interval)
+        intraday = step is not None and step < _DAY_NS
+
+        if intraday:
+            if step < src_step:
+                raise ValueError(f"Cannot resample {pd.Timedelta(src_step)} bars to shorter interval {interval}")
+            open_ns = _offset_ns(self.session_start) if self.session_start is not None else self._session_open(local, day)
+            anchor = day + open_ns
+            label = anchor + np.floor_divide(local - anchor, step) * step
+        elif interval == "1d":
+            label = day
+        elif interval == "1wk":
+            weekday = (day // _DAY_NS + 3) % 7  # 1970-01-01 was a Thursday; Monday = 0
+            label = day - weekday * _DAY_NS
+        else:  # 1mo
+            label = day.astype("datetime64[ns]").astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+
+        starts = np.flatnonzero(np.r_[True, label[1:] != label[:-1]])
+        ends = np.r_[starts[1:], len(label)]
+        data = self._aggregate(bars, starts, ends)
+
+        if intraday:
+            # Label in each bucket's own UTC offset: first bar's UTC + (label - first bar's wall clock)
+            first_utc = utc[starts] + (label[starts] - local[starts])
+            out_index = pd.DatetimeIndex(first_utc.astype("datetime64[ns]"), name="Datetime")
+            if tz is not None:
+                out_index = out_index.tz_localize("UTC").tz_convert(tz)
+        else:
+            out_index = pd.DatetimeIndex(label[starts].astype("datetime64[ns]"), name="Date")
+        result = pd.DataFrame(data, index=out_index)
+
+        if not partial and self._last_is_partial(interval, step, local, day, label[starts[-1]], src_step):
+            result = result.iloc[:-1]
+        return result
+
+    @staticmethod
+    def _aggregate(bars: pd.DataFrame, starts: np.ndarray, ends: np.ndarray) -> dict:
+        data = {}
+        for col in bars.columns:
+            if col in ("Open", "High", "Low", "Close", "Adj Close", "Volume"):
+                values = bars[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                values = bars[col].to_numpy()
+            if col == "Open":
+                data[col] = values[starts]
+            elif col == "High":
+                data[col] = np.fmax.reduceat(values, starts)
+            elif col == "Low":
+                data[col] = np.fmin.reduceat(values, starts)
+            elif col == "Volume":
+                data[col] = np.add.reduceat(np.nan_to_num(values), starts)
+            else:  # Close, Adj Close and any other column: last value of the bucket
+                data[col] = values[ends - 1]
+        return data
+
+    def _session_open(self, local: np.ndarray, day: np.ndarray) -> int:
+        first = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+        return _mode(local[first] - day[first])
+
+    def _session_close(self, local: np.ndarray, day: np.ndarray, src_step: int) -> int:
+        if self.session_end is not None:
+            return _offset_ns(self.session_end)
+        last = np.r_[np.flatnonzero(day[1:] != day[:-1]), len(day) - 1]
+        return _mode(local[last] - day[last]) + src_step
+
+    def _last_is_partial(self, interval: str, step: Optional[int], local: np.ndarray, day: np.ndarray,
+                         last_label: int, src_step: int) -> bool:
+        covered_until = int(local[-1]) + src_step
+        if step is not None and step <= _DAY_NS:
+            close = int(day[-1]) + self._session_close(local, day, src_step)
+            bucket_end = min(last_label + step, close) if step < _DAY_NS else close
+            return covered_until < bucket_end
+        # Weekly / monthly: incomplete while trading days remain in the period
+        last_day = np.datetime64(int(day[-1]), "ns").astype("datetime64[D]")
+        start = np.datetime64(int(last_label), "ns").astype("datetime64[D]")
+        period_end = start + 7 if interval == "1wk" else (start.astype("datetime64[M]") + 1).astype("datetime64[D]")
+        return bool(np.busday_count(last_day + 1, period_end) > 0)
@@ -0,0 +1,95 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+When several threads or asyncio tasks ask for the same key at the same time,
+`SingleFlight` runs the loader once (in the first caller, or on the default
+executor for async callers) and hands its result, or its exception, to every
+waiter. Nothing is cached: once the call finishes the key is free again, so this
+complements FrameMemo / PriceCache rather than replacing them.
+
+`SingleFlight.shared()` is one process-wide group, so separate DataFetcher
+instances (e.g. several LiveEngine objects or sweep workers) coalesce as well.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    __slots__ = ("future", "waiters")
+
+    def __init__(self) -> None:
+        self.future: Future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run one loader per key at a time; concurrent callers of the same key share its outcome."""
+
+    _shared: Optional["SingleFlight"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    @classmethod
+    def shared(cls) -> "SingleFlight":
+        """Process-wide group used by DataFetcher."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Return (result, shared). The first caller of a key runs fn; callers arriving while it runs
+        block and receive the same result. shared is True when more than one caller received it
+        (callers must then treat the result as read-only or copy it).
+        """
+        call, leader = self._join(key)
+        if leader:
+            self._run(key, call, fn)
+        result = call.future.result()  # re-raises the loader's exception for every caller
+        return result, call.waiters > 0
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """do() for asyncio: a leading task runs the blocking fn on the default executor; waiting tasks
+        (and threads) never block the event loop."""
+        call, leader = self._join(key)
+        if leader:
+            asyncio.get_running_loop().run_in_executor(None, self._run, key, call, fn)
+        result = await asyncio.wrap_future(call.future)
+        return result, call.waiters > 0
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def _join(self, key: Hashable) -> Tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                return call, False
+            call = self._calls[key] = _Call()
+            self.calls += 1
+            return call, True
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            call.future.set_exception(e)
+            return
+        # Release the key before publishing: later callers start a fresh call, current waiters are fixed
+        with self._lock:
+            del self._calls[key]
+        call.future.set_result(result)
@@ -5,10 +5,13 @@ Data storage management for DeltaFQ.
 import pandas as pd
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple
 from datetime import datetime
 from ..core.base import BaseComponent
 from ..core.config import Config
+from .catalog import StorageCatalog
+from .compact import compact_frame
+from .formats import SUFFIXES, StorageFormat, format_for, get_format
 
 
 class DataStorage(BaseComponent):
@@ -21,11 +24,25 @@ class DataStorage(BaseComponent):
         │   └── {symbol}/
         ├── backtest/       # Backtest results
         │   └── {symbol}/
+        ├── fund/           # Fund NAV histories ({code}_nav)
         └── indicators/     # Technical indicators
+
+    Files are written in `file_format` ("parquet" by default when pyarrow is installed,
+    else "csv"; also "feather"). Files of any supported format are read back, so
+    existing CSV data stays usable after switching formats.
+
+    With `catalog=True` (default) every saved file is recorded in a SQLite catalog
+    (`catalog.sqlite3`, see StorageCatalog); latest-file lookups, listings and size
+    stats query it instead of scanning the tree. Call rebuild_catalog() after adding or
+    removing files by hand (a new top-level folder is noticed on open).
     """
     
-    def __init__(self, base_path: str = None, **kwargs):
-        """Initialize data storage."""
+    def __init__(self, base_path: str = None, file_format: str = "auto",
+                 compression: Optional[str] = None, catalog: bool = True, compact: bool = False, **kwargs):
+        """
+        Initialize data storage. compression: codec for parquet/feather (e.g. 'snappy', 'zstd', 'lz4').
+        compact: load price and generic data with compact dtypes (see compact_frame).
+        """
         super().__init__(**kwargs)
         
         # Use Config to get cache directory if base_path not provided
@@ -34,8 +51,12 @@ class DataStorage(BaseComponent):
             base_path = config.get_cache_dir()
         
         self.base_path = Path(base_path)
-        self.logger.info(f"Initializing data storage at: {self.base_path}")
+        self.format: StorageFormat = get_format(file_format)
+        self.compression = compression
+        self.compact = compact
+        self.logger.info(f"Initializing data storage at: {self.base_path} (format: {self.format.name})")
         self._init_directories()
+        self.catalog: Optional[StorageCatalog] = StorageCatalog(self.base_path) if catalog else None
     
     def _init_directories(self):
         """Initialize directory structure."""
@@ -49,6 +70,49 @@ class DataStorage(BaseComponent):
             dir_path.mkdir(parents=True, exist_ok=True)
     
     
+    # ============================================================================
+    # File Format Helpers
+    # ============================================================================
+
+    def _write(self, data: pd.DataFrame, path_stem: Path, index: bool) -> Path:
+        """Write data as path_stem + format suffix, removing copies of the same stem in other formats."""
+        filepath = path_stem.with_name(path_stem.name + self.format.suffix)
+        self.format.write(data, filepath, index=index, compression=self.compression)
+        for suffix in SUFFIXES:
+            stale = path_stem.with_name(path_stem.name + suffix)
+            if suffix != self.format.suffix and stale.exists():
+                stale.unlink()
+                if self.catalog is not None:
+                    self.catalog.remove(stale)
+        if self.catalog is not None:
+            self.catalog.record(filepath)
+        return filepath
+
+    def _read(self, filepath: Path, index: bool, columns: Optional[Sequence[str]] = None,
+              from_date=None, to_date=None, date_column: Optional[str] = None,
+              compact: bool = False) -> pd.DataFrame:
+        data = format_for(filepath).read(filepath, index=index, columns=columns,
+                                         start=from_date, end=to_date, date_column=date_column)
+        return compact_frame(data) if compact else data
+
+    def _find(self, path_stem: Path) -> Optional[Path]:
+        """Existing file for path_stem in any supported format, preferring the configured one."""
+        for suffix in [self.format.suffix] + [s for s in SUFFIXES if s != self.format.suffix]:
+            filepath = path_stem.with_name(path_stem.name + suffix)
+            if filepath.exists():
+                return filepath
+        return None
+
+    def _glob(self, directory: Path, pattern: str, recursive: bool = False, verify: bool = False) -> List[Path]:
+        """Files matching pattern (without suffix) in any supported format, sorted by name."""
+        if self.catalog is not None:
+            return self.catalog.find(directory, pattern, recursive, prefer_suffix=self.format.suffix, verify=verify)
+        if not directory.exists():
+            return []
+        globber = directory.rglob if recursive else directory.glob
+        files = [f for suffix in SUFFIXES for f in globber(pattern + suffix) if f.is_file()]
+        return sorted(files, key=lambda f: (f.name[: -len(f.suffix)], f.suffix == self.format.suffix))
+
     # ============================================================================
     # Price Data Storage
     # ============================================================================
@@ -62,37 +126,157 @@ class DataStorage(BaseComponent):
         
         # Generate filename
         if start_date and end_date:
-            filename = f"{symbol}_{start_date}_{end_date}.csv"
+            filename = f"{symbol}_{start_date}_{end_date}"
         else:
-            filename = f"{symbol}_{datetime.now().strftime('%Y%m%d')}.csv"
+            filename = f"{symbol}_{datetime.now().strftime('%Y%m%d')}"
         
-        filepath = symbol_dir / filename
-        data.to_csv(filepath, encoding='utf-8-sig', index=True)
+        filepath = self._write(data, symbol_dir / filename, index=True)
         self.logger.info(f"Saved price data to: {filepath}")
         return filepath
     
     def load_price_data(self, symbol: str, start_date: Optional[str] = None,
-                       end_date: Optional[str] = None) -> Optional[pd.DataFrame]:
-        """Load price data from storage."""
-        symbol_dir = self.price_dir / symbol.replace('.', '_')
-        
-        if start_date and end_date:
-            filename = f"{symbol}_{start_date}_{end_date}.csv"
-        else:
-            # Try to find the latest file
-            files = list(symbol_dir.glob(f"{symbol}_*.csv"))
-            if not files:
-                self.logger.warning(f"No price data found for {symbol}")
-                return None
-            filename = sorted(files)[-1].name
-        
-        filepath = symbol_dir / filename
-        if filepath.exists():
-            data = pd.read_csv(filepath, index_col=0, parse_dates=True)
+                       end_date: Optional[str] = None, columns: Optional[Sequence[str]] = None,
+                       from_date: Optional[str] = None, to_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Load price data from storage.
+
+        start_date/end_date select the file saved with those dates (latest file if omitted).
+        columns projects columns; from_date <= index < to_date filters rows (pushed down
+        to the reader for parquet/feather).
+        """
+        filepath = self._price_file(symbol, start_date, end_date)
+        if filepath is not None and filepath.exists():
+            data = self._read(filepath, index=True, columns=columns, from_date=from_date, to_date=to_date,
+                              compact=self.compact)
             self.logger.info(f"Loaded price data from: {filepath}")
             return data
         return None
+
+    def iter_price_chunks(self, symbol: str, chunk_size: int = 100_000, start_date: Optional[str] = None,
+                          end_date: Optional[str] = None, columns: Optional[Sequence[str]] = None,
+                          from_date: Optional[str] = None, to_date: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a price file (same selection and filters as load_price_data) in chunks of chunk_size bars,
+        so histories larger than memory can be processed. Yields nothing if no file is found.
+        """
+        filepath = self._price_file(symbol, start_date, end_date)
+        if filepath is None or not filepath.exists():
+            return
+        self.logger.info(f"Streaming price data from: {filepath} ({chunk_size} bars per chunk)")
+        for chunk in format_for(filepath).iter_chunks(filepath, chunk_size, index=True, columns=columns,
+                                                      start=from_date, end=to_date):
+            yield compact_frame(chunk) if self.compact else chunk
+
+    def _price_file(self, symbol: str, start_date: Optional[str], end_date: Optional[str]) -> Optional[Path]:
+        """File saved with start_date/end_date, or the latest price file of the symbol."""
+        symbol_dir = self.price_dir / symbol.replace('.', '_')
+        if start_date and end_date:
+            return self._find(symbol_dir / f"{symbol}_{start_date}_{end_date}")
+        files = self._glob(symbol_dir, f"{symbol}_*", verify=True)
+        if not files:
+            self.logger.warning(f"No price data found for {symbol}")
+            return None
+        return files[-1]
     
+    def price_cache_dir(self, symbol: str) -> Path:
+        """Directory holding the read-through price cache of a symbol (see PriceCache)."""
+        return self.price_dir / symbol.replace('.', '_') / "_cache"
+
+    def price_cache_path(self, symbol: str, interval: str) -> Path:
+        """Directory of the yearly files of one cached symbol/interval history."""
+        return self.price_cache_dir(symbol) / f"{symbol}_{interval}"
+
+    def save_price_cache(self, data: pd.DataFrame, symbol: str, interval: str) -> Path:
+        """
+        Save cached OHLCV bars of one symbol/interval (used by PriceCache), one file per index year.
+        Only the years present in data are replaced, so extending a history never rewrites older years.
+        """
+        part_dir = self.price_cache_path(symbol, interval)
+        self._migrate_price_cache(part_dir)
+        part_dir.mkdir(parents=True, exist_ok=True)
+        for path in self._write_partitions(data, part_dir):
+            self.logger.info(f"Saved price cache to: {path}")
+        return part_dir
+
+    def load_price_cache(self, symbol: str, interval: str, from_date=None, to_date=None) -> Optional[pd.DataFrame]:
+        """Load the cached OHLCV history of one symbol/interval (optionally from_date <= index < to_date),
+        reading only the yearly files in range; None if not cached yet."""
+        part_dir = self.price_cache_path(symbol, interval)
+        if not part_dir.is_dir():
+            legacy = self._find(part_dir)  # single-file layout of older caches
+            return None if legacy is None else self._read(legacy, index=True, from_date=from_date, to_date=to_date)
+        first = pd.Timestamp(from_date).year if from_date is not None else None
+        last = pd.Timestamp(to_date).year if to_date is not None else None
+        frames = [self._read(path, index=True, from_date=from_date, to_date=to_date)
+                  for year, path in self._partitions(part_dir)
+                  if (first is None or year >= first) and (last is None or year <= last)]
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+    def delete_price_cache(self, symbol: str, interval: str) -> None:
+        """Delete the cached history of one symbol/interval."""
+        part_dir = self.price_cache_path(symbol, interval)
+        paths = [path for _, path in self._partitions(part_dir)] if part_dir.is_dir() else []
+        legacy = self._find(part_dir)
+        if legacy is not None:
+            paths.append(legacy)
+        for path in paths:
+            path.unlink()
+        if part_dir.is_dir() and not any(part_dir.iterdir()):
+            part_dir.rmdir()
+        # Catalog last: its sync stamp must be newer than the directory changes above
+        if self.catalog is not None:
+            for path in paths:
+                self.catalog.remove(path)
+
+    def _write_partitions(self, data: Optional[pd.DataFrame], part_dir: Path) -> List[Path]:
+        if data is None or data.empty:
+            return []
+        years = pd.DatetimeIndex(data.index).year
+        return [self._write(data[years == year], part_dir / str(year), index=True) for year in years.unique()]
+
+    @staticmethod
+    def _partitions(part_dir: Path) -> List[Tuple[int, Path]]:
+        """(year, file) of the yearly price cache files in part_dir, oldest first."""
+        files = [p for p in part_dir.iterdir() if p.suffix in SUFFIXES and p.stem.isdigit()]
+        return sorted((int(p.stem), p) for p in files)
+
+    def _migrate_price_cache(self, part_dir: Path) -> None:
+        """Split a single-file cache (older layout) into yearly files."""
+        legacy = self._find(part_dir)
+        if legacy is None or part_dir.is_dir():
+            return
+        data = self._read(legacy, index=True)
+        part_dir.mkdir(parents=True, exist_ok=True)
+        if not data.empty:
+            data.index = pd.to_datetime(data.index)  # stored in UTC: one offset
+        self._write_partitions(data, part_dir)
+        legacy.unlink()
+        if self.catalog is not None:
+            self.catalog.remove(legacy)
+        self.logger.info(f"Split price cache into yearly files: {part_dir}")
+
+    # ============================================================================
+    # Fund NAV Storage
+    # ============================================================================
+
+    def save_fund_nav(self, data: pd.DataFrame, code: str) -> Path:
+        """Save the NAV history of a fund (rows as returned by DataFetcher.fetch_fund_data)."""
+        fund_dir = self.base_path / "fund"
+        fund_dir.mkdir(parents=True, exist_ok=True)
+        filepath = self._write(data, fund_dir / f"{code}_nav", index=False)
+        self.logger.info(f"Saved fund NAV to: {filepath}")
+        return filepath
+
+    def load_fund_nav(self, code: str) -> Optional[pd.DataFrame]:
+        """Load the stored NAV history of a fund; None if not stored yet."""
+        filepath = self._find(self.base_path / "fund" / f"{code}_nav")
+        if filepath is None:
+            return None
+        return self._read(filepath, index=False)
+
     # ============================================================================
     # Backtest Data Storage
     # ============================================================================
@@ -107,11 +291,8 @@ class DataStorage(BaseComponent):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         strategy_suffix = f"_{strategy_name}" if strategy_name else ""
         
-        trades_path = symbol_dir / f"{symbol}_trades{strategy_suffix}_{timestamp}.csv"
-        values_path = symbol_dir / f"{symbol}_values{strategy_suffix}_{timestamp}.csv"
-        
-        trades_df.to_csv(trades_path, encoding='utf-8-sig', index=False)
-        values_df.to_csv(values_path, encoding='utf-8-sig', index=False)
+        trades_path = self._write(trades_df, symbol_dir / f"{symbol}_trades{strategy_suffix}_{timestamp}", index=False)
+        values_path = self._write(values_df, symbol_dir / f"{symbol}_values{strategy_suffix}_{timestamp}", index=False)
         
         self.logger.info(f"Saved backtest results to: {symbol_dir}")
         return {'trades': trades_path, 'values': values_path}
@@ -127,28 +308,28 @@ class DataStorage(BaseComponent):
         
         # Find trades and values files
         if strategy_name:
-            trades_files = list(symbol_dir.glob(f"{symbol}_trades_{strategy_name}_*.csv"))
-            values_files = list(symbol_dir.glob(f"{symbol}_values_{strategy_name}_*.csv"))
+            trades_files = self._glob(symbol_dir, f"{symbol}_trades_{strategy_name}_*", verify=True)
+            values_files = self._glob(symbol_dir, f"{symbol}_values_{strategy_name}_*", verify=True)
         else:
-            trades_files = list(symbol_dir.glob(f"{symbol}_trades*.csv"))
-            values_files = list(symbol_dir.glob(f"{symbol}_values*.csv"))
+            trades_files = self._glob(symbol_dir, f"{symbol}_trades*", verify=True)
+            values_files = self._glob(symbol_dir, f"{symbol}_values*", verify=True)
         
         if not trades_files or not values_files:
             self.logger.warning(f"No backtest results found for {symbol}")
             return None
         
         if latest:
-            trades_file = sorted(trades_files)[-1]
-            values_file = sorted(values_files)[-1]
+            trades_file = trades_files[-1]
+            values_file = values_files[-1]
             return {
-                'trades': pd.read_csv(trades_file, encoding='utf-8-sig'),
-                'values': pd.read_csv(values_file, encoding='utf-8-sig')
+                'trades': self._read(trades_file, index=False),
+                'values': self._read(values_file, index=False)
             }
         else:
             # Return all files
             return {
-                'trades': [pd.read_csv(f, encoding='utf-8-sig') for f in trades_files],
-                'values': [pd.read_csv(f, encoding='utf-8-sig') for f in values_files]
+                'trades': [self._read(f, index=False) for f in trades_files],
+                'values': [self._read(f, index=False) for f in values_files]
             }
     
     # ============================================================================
@@ -157,7 +338,7 @@ class DataStorage(BaseComponent):
     
     def save_data(self, data: pd.DataFrame, filename: str, 
                  category: str = "indicators", subdir: Optional[str] = None) -> Path:
-        """Save data to storage with category."""
+        """Save data to storage with category. A filename without a known suffix gets the storage format's."""
         if category == "price":
             target_dir = self.price_dir
         elif category == "backtest":
@@ -172,13 +353,21 @@ class DataStorage(BaseComponent):
             target_dir.mkdir(parents=True, exist_ok=True)
         
         filepath = target_dir / filename
-        data.to_csv(filepath, encoding='utf-8-sig', index=False)
+        fmt = format_for(filepath)
+        if fmt is None:
+            filepath = self._write(data, filepath, index=False)
+        else:
+            fmt.write(data, filepath, index=False, compression=self.compression)
+            if self.catalog is not None:
+                self.catalog.record(filepath)
         self.logger.info(f"Saved data to: {filepath}")
         return filepath
     
     def load_data(self, filename: str, category: str = "indicators", 
-                 subdir: Optional[str] = None) -> Optional[pd.DataFrame]:
-        """Load data from storage."""
+                 subdir: Optional[str] = None, columns: Optional[Sequence[str]] = None,
+                 from_date: Optional[str] = None, to_date: Optional[str] = None,
+                 date_column: str = "date") -> Optional[pd.DataFrame]:
+        """Load data from storage. Optional column projection and from_date <= date_column < to_date filter."""
         if category == "price":
             target_dir = self.price_dir
         elif category == "backtest":
@@ -192,8 +381,12 @@ class DataStorage(BaseComponent):
             target_dir = target_dir / subdir
         
         filepath = target_dir / filename
+        if format_for(filepath) is None:
+            filepath = self._find(filepath) or filepath
         if filepath.exists():
-            data = pd.read_csv(filepath, encoding='utf-8-sig')
+            dated = from_date is not None or to_date is not None
+            data = self._read(filepath, index=False, columns=columns, from_date=from_date, to_date=to_date,
+                              date_column=date_column if dated else None, compact=self.compact)
             self.logger.info(f"Loaded data from: {filepath}")
             return data
         else:
@@ -219,27 +412,39 @@ class DataStorage(BaseComponent):
         if subdir:
             target_dir = target_dir / subdir
         
-        if not target_dir.exists():
-            return []
-        
-        files = []
-        for item in target_dir.rglob('*.csv'):
-            if item.is_file():
-                files.append(str(item.relative_to(self.base_path)))
-        return files
+        return [str(item.relative_to(self.base_path)) for item in self._glob(target_dir, '*', recursive=True)]
     
     def get_storage_info(self) -> Dict[str, Any]:
         """Get storage information."""
         return {
             'base_path': str(self.base_path),
-            'price_files': len(list(self.price_dir.rglob('*.csv'))),
-            'backtest_files': len(list(self.backtest_dir.rglob('*.csv'))),
-            'indicators_files': len(list(self.indicators_dir.rglob('*.csv'))),
+            'format': self.format.name,
+            'price_files': len(self._glob(self.price_dir, '*', recursive=True)),
+            'backtest_files': len(self._glob(self.backtest_dir, '*', recursive=True)),
+            'indicators_files': len(self._glob(self.indicators_dir, '*', recursive=True)),
             'total_size_mb': self._calculate_size()
         }
     
+    def rebuild_catalog(self) -> int:
+        """Re-index every file under base_path (after files were added or deleted by hand)."""
+        if self.catalog is None:
+            return 0
+        count = self.catalog.rebuild()
+        self.logger.info(f"Rebuilt storage catalog: {count} files")
+        return count
+
+    def query_catalog(self, **filters: Any) -> pd.DataFrame:
+        """Catalog entries as a DataFrame; filters: category, kind, symbol, strategy, interval."""
+        if self.catalog is None:
+            raise RuntimeError("Storage catalog is disabled (DataStorage(catalog=False))")
+        return pd.DataFrame(self.catalog.query(**filters))
+
     def _calculate_size(self) -> float:
         """Calculate total storage size in MB."""
+        if self.catalog is not None:
+            # The catalog indexes data files only; add the PriceCache .json sidecars
+            sidecars = sum(p.stat().st_size for p in self.price_dir.glob("*/_cache/*.json"))
+            return round((self.catalog.stats()["total_size"] + sidecars) / (1024 * 1024), 2)
         total_size = 0
         for file_path in self.base_path.rglob('*'):
             if file_path.is_file():
@@ -5,10 +5,27 @@ Technical indicators module for DeltaFQ.
 from .technical import TechnicalIndicators
 from .talib_indicators import TalibIndicators
 from .fundamental import FundamentalIndicators
+from .streaming import (
+    StreamingATR,
+    StreamingBOLL,
+    StreamingEMA,
+    StreamingIndicator,
+    StreamingKDJ,
+    StreamingOBV,
+    StreamingRSI,
+    StreamingSMA,
+)
 
 __all__ = [
     "TechnicalIndicators",
     "TalibIndicators",
-    "FundamentalIndicators"
+    "FundamentalIndicators",
+    "StreamingIndicator",
+    "StreamingSMA",
+    "StreamingEMA",
+    "StreamingRSI",
+    "StreamingKDJ",
+    "StreamingBOLL",
+    "StreamingATR",
+    "StreamingOBV",
 ]
-
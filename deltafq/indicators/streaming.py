@@ -0,0 +1,468 @@
+"""
+Streaming (incremental) technical indicators for DeltaFQ.
+
+Each class mirrors one `TechnicalIndicators` method and updates in O(1) per
+new value, so live strategies do not recompute the whole lookback window on
+every tick. Outputs match the batch versions (same warm-up NaNs, same
+smoothing variants) up to floating point rounding. Non-finite inputs (NaN,
++-inf) are treated as missing values, the way NaN is in the batch versions, so a
+bad tick never poisons later outputs.
+
+Typical usage:
+    sma = StreamingSMA(20)
+    for price in prices:
+        value = sma.update(price)
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, Optional
+
+_NAN = float("nan")
+
+
+def _div(num: float, den: float) -> float:
+    """Divide with NumPy semantics (x/0 -> +-inf, 0/0 -> nan) instead of raising."""
+    if den == 0:
+        if num == 0 or math.isnan(num):
+            return _NAN
+        return math.copysign(math.inf, num) * math.copysign(1.0, den)
+    return num / den
+
+
+def _clean(x: float) -> float:
+    """Float input with non-finite values mapped to NaN (a missing observation)."""
+    x = float(x)
+    return x if math.isfinite(x) else _NAN
+
+
+def _rsi_from(avg_gain: float, avg_loss: float) -> float:
+    """RSI from average gain/loss, matching `100 - 100 / (1 + rs)` on Series."""
+    rs = _div(avg_gain, avg_loss)
+    if math.isnan(rs):
+        return _NAN
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+class _RollingSum:
+    """Fixed-window sum with Kahan compensation and NaN tracking (rolling(window) semantics)."""
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._values: deque = deque()
+        self._sum = 0.0
+        self._comp = 0.0
+        self._nan_count = 0
+
+    def _add(self, x: float) -> None:
+        y = x - self._comp
+        t = self._sum + y
+        self._comp = (t - self._sum) - y
+        self._sum = t
+
+    def push(self, x: float) -> None:
+        """Append a value, evicting the oldest one once the window is full."""
+        if len(self._values) == self.window:
+            old = self._values.popleft()
+            if math.isnan(old):
+                self._nan_count -= 1
+            else:
+                self._add(-old)
+        self._values.append(x)
+        if math.isnan(x):
+            self._nan_count += 1
+        else:
+            self._add(x)
+
+    @property
+    def full(self) -> bool:
+        """True when the window holds `window` values and none of them is NaN."""
+        return len(self._values) == self.window and self._nan_count == 0
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def mean(self) -> float:
+        """Window mean, NaN until the window is full (min_periods=window)."""
+        return self._sum / self.window if self.full else _NAN
+
+
+class _MonotonicExtreme:
+    """Sliding-window min or max using a monotonic deque (amortized O(1))."""
+
+    def __init__(self, window: int, mode: str = "min") -> None:
+        self.window = window
+        self._is_min = mode == "min"
+        self._deque: deque = deque()
+        self._count = 0
+
+    def push(self, x: float) -> float:
+        """Append a value and return the current window extreme (NaN during warm-up)."""
+        i = self._count
+        self._count += 1
+        dq = self._deque
+        if self._is_min:
+            while dq and dq[-1][1] >= x:
+                dq.pop()
+        else:
+            while dq and dq[-1][1] <= x:
+                dq.pop()
+        dq.append((i, x))
+        while dq[0][0] <= i - self.window:
+            dq.popleft()
+        return dq[0][1] if self._count >= self.window else _NAN
+
+
+class StreamingIndicator(ABC):
+    """Base class: `update()` consumes one new observation and returns the latest output."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.value: Any = _NAN
+
+    @abstractmethod
+    def update(self, *args: float) -> Any:
+        """Consume one new observation and return the latest indicator value."""
+        raise NotImplementedError
+
+    @property
+    def ready(self) -> bool:
+        """True once warm-up is over and the latest output is not NaN."""
+        v = self.value
+        if isinstance(v, dict):
+            return not any(math.isnan(x) for x in v.values())
+        return not math.isnan(v)
+
+    def reset(self) -> None:
+        """Drop all state; the next update starts a fresh series."""
+        self.__init__(**self._params())
+
+    def _params(self) -> Dict[str, Any]:
+        return {}
+
+
+class StreamingSMA(StreamingIndicator):
+    """Incremental `TechnicalIndicators.sma`."""
+
+    def __init__(self, period: int) -> None:
+        super().__init__()
+        self.period = period
+        self._sum = _RollingSum(period)
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        self._sum.push(_clean(x))
+        self.value = self._sum.mean()
+        return self.value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self.period}
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Incremental `TechnicalIndicators.ema`.
+    Args:
+        period: Period for EMA calculation
+        method: 'pandas' matches ewm(span, adjust=False) (default),
+               'talib' seeds with the SMA of the first full window like TA-Lib.
+    """
+
+    def __init__(self, period: int, method: str = "pandas") -> None:
+        super().__init__()
+        self.period = period
+        self.method = method
+        self.alpha = 2.0 / (period + 1.0)
+        self._seed_sum = 0.0
+        self._seed_len = 0
+        self._old_wt = 1.0
+        self._prev = _NAN
+
+    def update(self, x: float) -> float:
+        """Missing inputs return NaN ('talib') or the previous value ('pandas'), leaving the state usable."""
+        x = _clean(x)
+        self.count += 1
+        if self.method == "talib":
+            if math.isnan(self._prev):
+                # Seed with the first run of `period` consecutive valid values
+                if math.isnan(x):
+                    self._seed_sum, self._seed_len = 0.0, 0
+                else:
+                    self._seed_sum += x
+                    self._seed_len += 1
+                    if self._seed_len == self.period:
+                        self._prev = self._seed_sum / self.period
+                        self.value = self._prev
+                        return self.value
+                self.value = _NAN
+                return self.value
+            if math.isnan(x):
+                self.value = _NAN
+                return self.value
+            self._prev = self.alpha * x + (1.0 - self.alpha) * self._prev
+            self.value = self._prev
+            return self.value
+
+        # ewm(adjust=False, ignore_na=False): a gap decays the old weight for every missing bar
+        if math.isnan(self._prev):
+            self._prev = x
+        else:
+            self._old_wt *= 1.0 - self.alpha
+            if not math.isnan(x):
+                if x != self._prev:
+                    self._prev = (self._old_wt * self._prev + self.alpha * x) / (self._old_wt + self.alpha)
+                self._old_wt = 1.0
+        self.value = self._prev
+        return self.value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self.period, "method": self.method}
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Incremental `TechnicalIndicators.rsi`.
+    Args:
+        period: Period for RSI calculation. Default is 14.
+        method: 'sma' uses rolling means of gains/losses (default),
+               'rma' uses Wilder's smoothing matching TA-Lib.
+    """
+
+    def __init__(self, period: int = 14, method: str = "sma") -> None:
+        super().__init__()
+        self.period = period
+        self.method = method
+        self._prev_price = _NAN
+        self._gains = _RollingSum(period)
+        self._losses = _RollingSum(period)
+        self._avg_gain = _NAN
+        self._avg_loss = _NAN
+        self._seed_gain = 0.0
+        self._seed_loss = 0.0
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.count += 1
+        delta = x - self._prev_price
+        self._prev_price = x
+        # Batch version: first diff is NaN and `where` turns it into 0 gain / 0 loss
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if self.method == "rma":
+            n = self.count - 1  # number of real deltas seen so far
+            if n == 0:
+                self.value = _NAN
+                return self.value
+            if n <= self.period:
+                self._seed_gain += gain
+                self._seed_loss += loss
+                if n < self.period:
+                    self.value = _NAN
+                    return self.value
+                self._avg_gain = self._seed_gain / self.period
+                self._avg_loss = self._seed_loss / self.period
+            else:
+                self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+                self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+            self.value = _rsi_from(self._avg_gain, self._avg_loss)
+            return self.value
+
+        self._gains.push(gain)
+        self._losses.push(loss)
+        self.value = _rsi_from(self._gains.mean(), self._losses.mean())
+        return self.value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self.period, "method": self.method}
+
+
+class StreamingKDJ(StreamingIndicator):
+    """
+    Incremental `TechnicalIndicators.kdj` using monotonic deques for the rolling high/low.
+    Args:
+        n: Period for RSV calculation. Default is 9.
+        m1: Period for K line smoothing. Default is 3.
+        m2: Period for D line smoothing. Default is 3.
+        method: 'ema' (default) or 'sma' matching TA-Lib STOCH.
+    """
+
+    def __init__(self, n: int = 9, m1: int = 3, m2: int = 3, method: str = "ema") -> None:
+        super().__init__()
+        self.n = n
+        self.m1 = m1
+        self.m2 = m2
+        self.method = method
+        self._lowest = _MonotonicExtreme(n, "min")
+        self._highest = _MonotonicExtreme(n, "max")
+        if method == "sma":
+            self._k: StreamingIndicator = StreamingSMA(m1)
+            self._d: StreamingIndicator = StreamingSMA(m2)
+        else:
+            self._k = StreamingEMA(m1)
+            self._d = StreamingEMA(m2)
+        self.value = {"k": _NAN, "d": _NAN, "j": _NAN}
+
+    def update(self, high: float, low: float, close: float) -> Dict[str, float]:
+        self.count += 1
+        ll = self._lowest.push(float(low))
+        hh = self._highest.push(float(high))
+        rsv = 100.0 * _div(float(close) - ll, hh - ll)
+        if math.isnan(rsv):
+            rsv = 50.0  # Fill NaN with neutral value
+        k = self._k.update(rsv)
+        d = self._d.update(k)
+        self.value = {"k": k, "d": d, "j": 3 * k - 2 * d}
+        return self.value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"n": self.n, "m1": self.m1, "m2": self.m2, "method": self.method}
+
+
+class StreamingBOLL(StreamingIndicator):
+    """
+    Incremental `TechnicalIndicators.boll` using a sliding-window Welford variance.
+    Args:
+        period: Period for Bollinger Bands calculation. Default is 20.
+        std_dev: Number of standard deviations. Default is 2.
+        method: 'sample' (ddof=1, default) or 'population' (ddof=0) matching TA-Lib.
+    """
+
+    def __init__(self, period: int = 20, std_dev: float = 2, method: str = "sample") -> None:
+        super().__init__()
+        self.period = period
+        self.std_dev = std_dev
+        self.method = method
+        self.ddof = 0 if method == "population" else 1
+        self._window: deque = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._nan_count = 0
+        self._sma = StreamingSMA(period)
+        self.value = {"upper": _NAN, "middle": _NAN, "lower": _NAN}
+
+    def update(self, x: float) -> Dict[str, float]:
+        """Missing inputs give NaN bands until they leave the window, as in rolling(period)."""
+        x = _clean(x)
+        self.count += 1
+        if len(self._window) == self.period:
+            old = self._window.popleft()
+            if math.isnan(old):
+                self._nan_count -= 1
+            else:
+                n = len(self._window) - self._nan_count
+                if n == 0:
+                    self._mean, self._m2 = 0.0, 0.0
+                else:
+                    delta = old - self._mean
+                    self._mean -= delta / n
+                    self._m2 -= delta * (old - self._mean)
+        self._window.append(x)
+        if math.isnan(x):
+            self._nan_count += 1
+        else:
+            n = len(self._window) - self._nan_count
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+        n = len(self._window)
+
+        middle = self._sma.update(x)
+        if n < self.period or self._nan_count or n - self.ddof <= 0:
+            std = _NAN
+        else:
+            std = math.sqrt(max(self._m2, 0.0) / (n - self.ddof))
+        self.value = {
+            "upper": middle + std * self.std_dev,
+            "middle": middle,
+            "lower": middle - std * self.std_dev,
+        }
+        return self.value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self.period, "std_dev": self.std_dev, "method": self.method}
+
+
+class StreamingATR(StreamingIndicator):
+    """
+    Incremental `TechnicalIndicators.atr`.
+    Args:
+        period: Period for ATR calculation. Default is 14.
+        method: 'sma' (default) or 'rma' (Wilder's smoothing) matching TA-Lib.
+    """
+
+    def __init__(self, period: int = 14, method: str = "sma") -> None:
+        super().__init__()
+        self.period = period
+        self.method = method
+        self._prev_close: Optional[float] = None
+        self._tr = _RollingSum(period)
+        self._seed_sum = 0.0
+        self._atr = _NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, close = float(high), float(low), float(close)
+        self.count += 1
+        if self._prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+
+        if self.method == "rma":
+            i = self.count - 1  # position in the batch series
+            if i == 0:
+                self.value = _NAN
+                return self.value
+            if i <= self.period:
+                self._seed_sum += tr
+                if i < self.period:
+                    self.value = _NAN
+                    return self.value
+                self._atr = self._seed_sum / self.period
+            else:
+                self._atr = (self._atr * (self.period - 1) + tr) / self.period
+            self.value = self._atr
+            return self.value
+
+        self._tr.push(tr)
+        self.value = self._tr.mean()
+        return self.value
+
+    def _params(self) -> Dict[str, Any]:
+        return {"period": self.period, "method": self.method}
+
+
+class StreamingOBV(StreamingIndicator):
+    """Incremental `TechnicalIndicators.obv`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._prev_close: Optional[float] = None
+        self.value = 0.0
+
+    def update(self, close: float, volume: float) -> float:
+        close = float(close)
+        self.count += 1
+        if self._prev_close is None:
+            self.value = volume  # First value is first volume
+        elif close > self._prev_close:
+            self.value += volume
+        elif close < self._prev_close:
+            self.value -= volume
+        self._prev_close = close
+        return self.value
+
+
+__all__ = [
+    "StreamingIndicator",
+    "StreamingSMA",
+    "StreamingEMA",
+    "StreamingRSI",
+    "StreamingKDJ",
+    "StreamingBOLL",
+    "StreamingATR",
+    "StreamingOBV",
+]
@@ -5,9 +5,14 @@ Live trading module for DeltaFQ.
 from .event_engine import EventEngine
 from .models import TickData, OrderRequest
 from .gateways import DataGateway, TradeGateway
-from ..adapters.data import YFinanceDataGateway
+from ..adapters.data import YFinanceDataGateway, SharedMemoryDataGateway, ReplayDataGateway
 from ..adapters.trade import PaperTradeGateway
 from .gateway_registry import DATA_GATEWAYS, TRADE_GATEWAYS, create_data_gateway, create_trade_gateway
+from .ring_buffer import PriceRingBuffer
+from .data_hub import MarketDataHub, SharedDataGateway, get_market_data_hub
+from .shm_bus import SharedMemoryTickPublisher, SharedMemoryTickReader
+from .recorder import TickRecorder, read_tick_file
+from .conflator import TickConflator
 from .engine import LiveEngine
 
 __all__ = [
@@ -18,9 +23,20 @@ __all__ = [
     "DataGateway",
     "TradeGateway",
     "YFinanceDataGateway",
+    "SharedMemoryDataGateway",
+    "ReplayDataGateway",
     "PaperTradeGateway",
     "DATA_GATEWAYS",
     "TRADE_GATEWAYS",
     "create_data_gateway",
     "create_trade_gateway",
+    "PriceRingBuffer",
+    "MarketDataHub",
+    "SharedDataGateway",
+    "get_market_data_hub",
+    "SharedMemoryTickPublisher",
+    "SharedMemoryTickReader",
+    "TickRecorder",
+    "read_tick_file",
+    "TickConflator",
 ]
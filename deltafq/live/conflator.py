@@ -0,0 +1,81 @@
+"""
+Tick conflation for slow strategies.
+
+`TickConflator` runs a handler on its own worker thread and keeps at most one
+pending tick per symbol: while an evaluation is in flight, newer ticks replace
+older unprocessed ones instead of queueing behind them, so latency cannot compound.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from ..core.base import BaseComponent
+from .models import TickData
+
+
+class TickConflator(BaseComponent):
+    """Latest-tick-per-symbol mailbox drained by one worker thread."""
+
+    def __init__(self, handler: Callable[[TickData], None], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._handler = handler
+        self._pending: Dict[str, TickData] = {}
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.submitted = 0
+        self.processed = 0
+        self.conflated = 0
+
+    def submit(self, tick: TickData) -> None:
+        """Queue a tick, replacing any unprocessed tick of the same symbol. Never blocks on the handler."""
+        with self._cond:
+            self.submitted += 1
+            if tick.symbol in self._pending:
+                self.conflated += 1
+            # Replacing keeps the symbol's queue position, so busy symbols cannot starve others
+            self._pending[tick.symbol] = tick
+            self._cond.notify()
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker; pending ticks are dropped."""
+        with self._cond:
+            self._running = False
+            self._pending.clear()
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of submitted, processed and conflated (dropped) ticks, plus current backlog."""
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "processed": self.processed,
+                "conflated": self.conflated,
+                "pending": len(self._pending),
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                symbol = next(iter(self._pending))
+                tick = self._pending.pop(symbol)
+            try:
+                self._handler(tick)
+            except Exception as e:
+                self.logger.error(f"Conflated tick handler error for {symbol}: {e}")
+            with self._cond:
+                self.processed += 1
@@ -0,0 +1,196 @@
+"""
+Shared market-data hub: one data gateway per (name, params), fanned out to many consumers.
+
+Typical usage:
+    hub = get_market_data_hub()
+    gw = hub.acquire("yfinance", interval=10.0)   # behaves like a normal DataGateway
+    gw.set_tick_handler(on_tick)
+    gw.connect(); gw.subscribe(["AAPL"]); gw.start()
+    ...
+    gw.stop()   # releases the reference; the real gateway stops with the last consumer
+
+LiveEngine uses it via set_data_gateway(name, shared=True, ...).
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..core.base import BaseComponent
+from .gateway_registry import create_data_gateway
+from .gateways import DataGateway
+from .models import TickData
+
+
+def _hub_key(name: str, params: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Hashable key for gateway name + params (values compared by repr)."""
+    return name, tuple(sorted((k, repr(v)) for k, v in params.items()))
+
+
+class _HubEntry:
+    """One underlying gateway with its consumers and per-symbol subscriber sets."""
+
+    def __init__(self, key: Tuple, gateway: DataGateway) -> None:
+        self.key = key
+        self.gateway = gateway
+        self.consumers: Set["SharedDataGateway"] = set()
+        self.subscribers: Dict[str, Tuple["SharedDataGateway", ...]] = {}
+        self.connected: Optional[bool] = None
+        self.started = False
+
+    def dispatch(self, tick: TickData) -> None:
+        """Fan a tick out to every consumer subscribed to its symbol."""
+        for consumer in self.subscribers.get(tick.symbol, ()):
+            handler = consumer._tick_handler
+            if handler is not None:
+                handler(tick)
+
+
+class SharedDataGateway(DataGateway):
+    """Per-consumer view of a hub-managed gateway. Same interface as any DataGateway."""
+
+    def __init__(self, hub: "MarketDataHub", entry: _HubEntry, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._hub = hub
+        self._entry = entry
+        self._symbols: List[str] = []
+        self._released = False
+
+    @property
+    def gateway(self) -> DataGateway:
+        """Underlying shared gateway."""
+        return self._entry.gateway
+
+    def connect(self) -> bool:
+        return self._hub._connect(self._entry)
+
+    def subscribe(self, symbols: List[str]) -> bool:
+        return self._hub._subscribe(self, symbols)
+
+    def unsubscribe(self, symbols: List[str]) -> bool:
+        return self._hub._unsubscribe(self, symbols)
+
+    def start(self) -> None:
+        self._hub._start(self._entry)
+
+    def stop(self) -> None:
+        self._hub.release(self)
+
+    def __getattr__(self, item: str) -> Any:
+        # Gateway-specific helpers (e.g. get_today_ohlc) are served by the shared gateway
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(self._entry.gateway, item)
+
+
+class MarketDataHub(BaseComponent):
+    """Reference-counted registry of shared data gateways keyed by gateway name and params."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._lock = threading.RLock()
+        self._entries: Dict[Tuple, _HubEntry] = {}
+
+    def acquire(self, name: str, **params: Any) -> SharedDataGateway:
+        """Return a consumer handle on the shared gateway, creating it on first use."""
+        key = _hub_key(name, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                gateway = create_data_gateway(name, **params)
+                entry = _HubEntry(key, gateway)
+                gateway.set_tick_handler(entry.dispatch)
+                self._entries[key] = entry
+                self.logger.info(f"Created shared data gateway: {name} {params}")
+            consumer = SharedDataGateway(self, entry)
+            entry.consumers.add(consumer)
+            return consumer
+
+    def release(self, consumer: SharedDataGateway) -> None:
+        """Drop a consumer; the underlying gateway is stopped when its last consumer leaves."""
+        with self._lock:
+            if consumer._released:
+                return
+            consumer._released = True
+            entry = consumer._entry
+            self._unsubscribe(consumer, list(consumer._symbols))
+            entry.consumers.discard(consumer)
+            if entry.consumers:
+                return
+            self._entries.pop(entry.key, None)
+        if entry.started:
+            entry.gateway.stop()
+        self.logger.info(f"Released shared data gateway: {entry.key[0]}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Consumers and subscribed symbols per shared gateway."""
+        with self._lock:
+            return [
+                {
+                    "gateway": e.key[0],
+                    "params": dict(e.key[1]),
+                    "consumers": len(e.consumers),
+                    "symbols": {s: len(c) for s, c in e.subscribers.items()},
+                }
+                for e in self._entries.values()
+            ]
+
+    def _connect(self, entry: _HubEntry) -> bool:
+        with self._lock:
+            if entry.connected is None or not entry.connected:
+                entry.connected = entry.gateway.connect()
+            return entry.connected
+
+    def _start(self, entry: _HubEntry) -> None:
+        with self._lock:
+            if entry.started:
+                return
+            entry.started = True
+        entry.gateway.start()
+
+    def _subscribe(self, consumer: SharedDataGateway, symbols: List[str]) -> bool:
+        with self._lock:
+            entry = consumer._entry
+            new_symbols = []
+            for s in symbols:
+                if s in consumer._symbols:
+                    continue
+                consumer._symbols.append(s)
+                current = entry.subscribers.get(s, ())
+                if not current:
+                    new_symbols.append(s)
+                # Copy-on-write so dispatch can iterate without holding the lock
+                entry.subscribers[s] = current + (consumer,)
+            if new_symbols:
+                return entry.gateway.subscribe(new_symbols)
+            return True
+
+    def _unsubscribe(self, consumer: SharedDataGateway, symbols: List[str]) -> bool:
+        with self._lock:
+            entry = consumer._entry
+            orphaned = []
+            for s in symbols:
+                if s not in consumer._symbols:
+                    continue
+                consumer._symbols.remove(s)
+                remaining = tuple(c for c in entry.subscribers.get(s, ()) if c is not consumer)
+                if remaining:
+                    entry.subscribers[s] = remaining
+                else:
+                    entry.subscribers.pop(s, None)
+                    orphaned.append(s)
+            if orphaned:
+                return entry.gateway.unsubscribe(orphaned)
+            return True
+
+
+_default_hub: Optional[MarketDataHub] = None
+_default_hub_lock = threading.Lock()
+
+
+def get_market_data_hub() -> MarketDataHub:
+    """Process-wide default hub."""
+    global _default_hub
+    with _default_hub_lock:
+        if _default_hub is None:
+            _default_hub = MarketDataHub()
+        return _default_hub
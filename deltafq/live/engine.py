@@ -3,26 +3,40 @@ Live engine: runs strategy on real-time tick stream and sends orders via gateway
 
 Typical usage:
     engine = LiveEngine(symbol="BTC-USD", signal_interval="1m", lookback_bars=50)
+    # or many names on one data gateway: LiveEngine(symbols=["AAPL", "MSFT"], ...)
     engine.set_trade_gateway("paper", initial_capital=100000)
     engine.add_strategy(MyStrategy())
     engine.run_live()
     # ... on KeyboardInterrupt: engine.stop()
 """
 
+import bisect
+import copy
+import os
+import pickle
+import threading
 import time
 from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Any, Dict, List, Tuple
+from pathlib import Path
+from typing import Optional, Any, Dict, List, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from ..backtest.performance import PerformanceReporter
 from ..core.base import BaseComponent
 from ..data import DataFetcher
-from ..strategy.base import BaseStrategy
+from ..strategy.base import BaseStrategy, iter_bars
 from .event_engine import EventEngine, EVENT_TICK
+from .data_hub import get_market_data_hub
 from .gateway_registry import create_data_gateway, create_trade_gateway
+from .conflator import TickConflator
+from .equity import EquityRecorder
+from .latency import LatencyTracker
 from .models import OrderRequest
+from .ring_buffer import PriceRingBuffer
 
 
 # Calendar days per bar by interval (for sizing fetch range). 1d: ~252 trading days / 365 calendar days.
@@ -39,6 +53,11 @@ _REFETCH_SEC = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600, "1d": 86400}
 _FETCH_DAYS_PER_BAR = {"1d": 365 / 252, "1wk": 365 / 52, "1mo": 365 / 12}
 _SIG_ICON = {1: "↑", -1: "↓", 0: "-"}
 _ACTION_ICON = {"buy": "↑", "sell": "↓", "skip": "x", "no_change": "-"}
+_SNAPSHOT_FORMAT = 1
+_SNAPSHOT_FIELDS = (
+    "strategy", "buffer", "bar_signals", "last_signal", "last_pending_order_id",
+    "last_bar_time", "last_price", "cached_bars", "cached_signals",
+)
 
 
 def _vol_str(v: float) -> str:
@@ -52,6 +71,26 @@ def _vol_str(v: float) -> str:
     return str(int(v))
 
 
+@dataclass
+class _SymbolState:
+    """Per-symbol strategy, signal and buffer state of a LiveEngine."""
+
+    symbol: str
+    strategy: Optional[BaseStrategy]
+    buffer: PriceRingBuffer
+    bar_signals: deque
+    last_signal: int = 0
+    last_pending_order_id: Optional[str] = None
+    last_fetch_time: float = 0.0
+    last_bar_time: Optional[pd.Timestamp] = None
+    last_price: Optional[float] = None
+    cached_bars: Optional[pd.DataFrame] = None
+    cached_signals: Optional[pd.Series] = None
+    chart_version: int = 0  # bumped whenever cached_bars / cached_signals change
+    chart_cache: Optional[Dict[str, Any]] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)  # guards buffer across threads
+
+
 class LiveEngine(BaseComponent):
     """
     Runs strategy on live data and submits orders via gateways.
@@ -64,9 +103,23 @@ class LiveEngine(BaseComponent):
             "1m", "5m", "15m", "1h", "1d", "1wk", "1mo".
         data_gateway_name: Data source (default "yfinance").
         trade_gateway_name: Execution gateway (default "paper").
+        symbols: Trade several symbols on one data gateway (overrides symbol).
+        track_latency: Keep per-stage latency histograms (see get_latency_stats).
+        latency_log_interval: Seconds between latency summary log lines (0 disables).
+        conflate_ticks: Run the strategy on a worker thread and, while it is busy, keep only
+            the latest tick per symbol. Order matching and the tick-mode price history still
+            see every tick; only strategy evaluation and order sending are conflated.
+        max_value_records: Newest equity points kept in memory for get_values_df.
+        values_interval: Keep one equity point per bar: "bar" (the signal_interval bar) or a
+            size such as "1m" / "1h"; None keeps one point per distinct timestamp.
+        bar_base_interval: Derive signal_interval bars locally from this lower interval (e.g. "1m",
+            see BarResampler), so engines on 5m / 15m / 1h share one download per symbol.
 
     Use set_data_gateway/set_trade_gateway before run_live() to pass gateway params.
     Strategy can set self.order_amount for fixed $ per buy; else full cash.
+    Strategies implementing on_tick (tick mode) or on_bar (bar mode, closed bars only)
+    are driven incrementally instead of calling generate_signals on a DataFrame.
+    With several symbols every symbol gets its own strategy copy, signal state and buffers.
     """
 
     def __init__(
@@ -77,32 +130,57 @@ class LiveEngine(BaseComponent):
         signal_interval: str = "5m",
         data_gateway_name: str = "yfinance",
         trade_gateway_name: str = "paper",
+        symbols: Optional[List[str]] = None,
+        track_latency: bool = True,
+        latency_log_interval: float = 60.0,
+        conflate_ticks: bool = False,
+        max_value_records: int = 100_000,
+        values_interval: Optional[str] = None,
+        bar_base_interval: Optional[str] = None,
         **kwargs,
     ):
         """Initialize engine. Call set_data_gateway/set_trade_gateway before run_live() for gateway params."""
         super().__init__(**kwargs)
-        self.symbol = symbol
+        self.symbols: List[str] = list(symbols) if symbols else ([symbol] if symbol else [])
         self.interval = interval
         self.lookback_bars = lookback_bars
         self.signal_interval = (signal_interval or "5m").lower()
+        self.bar_base_interval = bar_base_interval.lower() if bar_base_interval else None
         self.data_gateway_name = data_gateway_name
         self.trade_gateway_name = trade_gateway_name
         self._data_gateway_params: dict = {}
         self._trade_gateway_params: dict = {}
+        self._share_data_gateway = False
 
         self._event_engine = EventEngine()
         self._data_gw = None
         self._trade_gw = None
         self._data_fetcher: Optional[DataFetcher] = None
         self._strategy: Optional[BaseStrategy] = None
-        self._prices: deque = deque(maxlen=lookback_bars + 100)
-        self._timestamps: deque = deque(maxlen=lookback_bars + 100)
-        self._last_signal = 0
-        self._last_pending_order_id: Optional[str] = None
-        self._last_fetch_time = 0.0
-        self._cached_bars: Optional[pd.DataFrame] = None
-        self._cached_signals: Optional[pd.Series] = None
-        self._values_records: List[Dict[str, Any]] = []
+        self._symbol_strategies: Dict[str, BaseStrategy] = {}
+        self._states: Dict[str, _SymbolState] = {}
+        if values_interval == "bar":
+            values_interval = None if self.signal_interval == "tick" else self.signal_interval
+        self._equity = EquityRecorder(capacity=max_value_records, bar_interval=values_interval)
+        self._latency: Optional[LatencyTracker] = (
+            LatencyTracker(["dispatch", "fetch_bars", "strategy", "order", "tick_to_order", "match"])
+            if track_latency else None
+        )
+        self.latency_log_interval = latency_log_interval
+        self._last_latency_log = time.time()
+        self.conflate_ticks = conflate_ticks
+        self._conflator: Optional[TickConflator] = None
+        # Matching (gateway thread) and order sending (strategy thread when conflating) share the trade engine
+        self._trade_lock = threading.RLock()
+
+    @property
+    def symbol(self) -> Optional[str]:
+        """First (or only) traded symbol; kept for single-symbol usage."""
+        return self.symbols[0] if self.symbols else None
+
+    @symbol.setter
+    def symbol(self, value: Optional[str]) -> None:
+        self.symbols = [value] if value else []
 
     def set_parameters(
         self,
@@ -110,23 +188,32 @@ class LiveEngine(BaseComponent):
         interval: Optional[float] = None,
         lookback_bars: Optional[int] = None,
         signal_interval: Optional[str] = None,
+        symbols: Optional[List[str]] = None,
     ) -> None:
-        """Update symbol, interval, lookback or signal_interval."""
+        """Update symbol(s), interval, lookback or signal_interval."""
         if symbol is not None:
             self.symbol = symbol
+        if symbols is not None:
+            self.symbols = list(symbols)
         if interval is not None:
             self.interval = interval
         if lookback_bars is not None:
             self.lookback_bars = lookback_bars
-            self._prices = deque(self._prices, maxlen=lookback_bars + 100)
-            self._timestamps = deque(self._timestamps, maxlen=lookback_bars + 100)
+            for st in self._states.values():
+                st.buffer = st.buffer.resized(lookback_bars + 100)
+                st.bar_signals = deque(st.bar_signals, maxlen=lookback_bars + 100)
         if signal_interval is not None:
             self.signal_interval = signal_interval.lower()
 
-    def set_data_gateway(self, name: str, **params: Any) -> None:
-        """Set data gateway by name; optional params (e.g. interval) passed to gateway. Clears cached gateway."""
+    def set_data_gateway(self, name: str, shared: bool = False, **params: Any) -> None:
+        """
+        Set data gateway by name; optional params (e.g. interval) passed to gateway. Clears cached gateway.
+        shared=True attaches to the process-wide MarketDataHub, so engines with the same
+        gateway name and params share one feed and each symbol is polled once per cycle.
+        """
         self.data_gateway_name = name
         self._data_gateway_params = dict(params)
+        self._share_data_gateway = shared
         self._data_gw = None
 
     def set_trade_gateway(self, name: str, **params: Any) -> None:
@@ -135,60 +222,154 @@ class LiveEngine(BaseComponent):
         self._trade_gateway_params = dict(params)
         self._trade_gw = None
 
-    def add_strategy(self, strategy: BaseStrategy) -> None:
-        """Set the strategy used for signal generation."""
-        self._strategy = strategy
+    def add_strategy(self, strategy: BaseStrategy, symbols: Optional[List[str]] = None) -> None:
+        """Set the strategy used for signal generation; with symbols, bind it to those only."""
+        if symbols is None:
+            self._strategy = strategy
+        else:
+            for s in symbols:
+                self._symbol_strategies[s] = strategy
+        for s in list(self._states):
+            if symbols is None or s in symbols:
+                del self._states[s]
 
     def run_live(self) -> None:
         """Connect gateways, register tick handlers, subscribe and start data stream."""
         self._ensure_gateways()
+        self._ensure_states()
         if not self._trade_gw.connect() or not self._data_gw.connect():
             raise RuntimeError("Gateway connect failed")
 
         self._event_engine.on(EVENT_TICK, self._on_tick_match)
-        self._event_engine.on(EVENT_TICK, self._on_tick_strategy)
-        self._data_gw.set_tick_handler(lambda t: self._event_engine.emit(EVENT_TICK, t))
+        self._event_engine.on(EVENT_TICK, self._on_tick_record)
+        if self.conflate_ticks:
+            self._conflator = TickConflator(self._on_tick_strategy, name=f"{self.name}.conflator")
+            self._conflator.start()
+            self._event_engine.on(EVENT_TICK, self._on_tick_conflate)
+        else:
+            self._event_engine.on(EVENT_TICK, self._on_tick_strategy)
+        self._data_gw.set_tick_handler(self._on_gateway_tick)
 
-        self._data_gw.subscribe([self.symbol])
+        self._data_gw.subscribe(list(self.symbols))
         self._data_gw.start()
-        self.logger.info(f"Running: {self.symbol} {self.signal_interval} lookback={self.lookback_bars}")
+        shown = self.symbol if len(self.symbols) == 1 else f"{len(self.symbols)} symbols"
+        self.logger.info(f"Running: {shown} {self.signal_interval} lookback={self.lookback_bars}")
 
     def stop(self) -> None:
         """Stop gateways and release resources."""
         if self._data_gw:
             self._data_gw.stop()
+        if self._conflator:
+            self._conflator.stop()
+            self.logger.info(f"Conflation: {self._conflator.stats()}")
         if self._trade_gw:
             self._trade_gw.stop()
 
-    def get_chart_data(self) -> Dict[str, Any]:
+    def snapshot(self, path: Union[str, Path]) -> Path:
         """
-        Return cached K-lines and signals for charting.
+        Save engine state to a file for a hot restart with restore().
 
-        Called without re-fetching or re-calculating. Empty if no cache yet
-        (e.g. before first tick cycle).
+        Covers per-symbol strategy objects, price buffers, signal / pending-order state and
+        cached bars, the equity curve and the execution engine (cash, positions, orders, trades).
+        Safe to call while running; a tick being evaluated concurrently may be missing.
+        The file is a pickle: keep it where only trusted processes can write it.
+        """
+        with self._trade_lock:
+            eng = getattr(self._trade_gw, "_engine", None)
+            payload = {
+                "format": _SNAPSHOT_FORMAT,
+                "saved_at": datetime.now(timezone.utc),
+                "symbols": list(self.symbols),
+                "signal_interval": self.signal_interval,
+                "states": {
+                    sym: {f: getattr(st, f) for f in _SNAPSHOT_FIELDS} for sym, st in self._states.items()
+                },
+                "equity": self._equity,
+                "execution": eng.get_state() if eng is not None else None,
+            }
+            data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)  # never leave a half-written snapshot behind
+        self.logger.info(f"Snapshot saved: {path} ({len(data)} bytes, {len(payload['states'])} symbols)")
+        return path
+
+    def restore(self, path: Union[str, Path]) -> None:
+        """
+        Load a snapshot() file before run_live() so trading resumes on the first tick.
 
-        Returns:
-            dict with keys: candles (list of {date, open, high, low, close}),
-            signals (list of int).
+        Call after add_strategy(): the snapshot's strategy objects (with their warmed-up state)
+        replace the configured ones. Symbols missing from the engine are ignored; with no
+        symbols configured the snapshot's symbols are used. Execution state (cash, positions,
+        orders, trades) is restored for paper trading only; a broker account is left as is.
+
+        Snapshots are pickles and loading one can run arbitrary code: only restore files
+        written by your own engines.
         """
-        if self._cached_bars is None or self._cached_signals is None or self._cached_bars.empty:
-            return {"candles": [], "signals": []}
+        payload = pickle.loads(Path(path).read_bytes())
+        if payload.get("format") != _SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format: {payload.get('format')}")
+        if payload["signal_interval"] != self.signal_interval:
+            raise ValueError(
+                f"Snapshot signal_interval {payload['signal_interval']} != engine {self.signal_interval}"
+            )
+        if not self.symbols:
+            self.symbols = list(payload["symbols"])
+        self._ensure_gateways()
+
+        capacity = self.lookback_bars + 100
+        for sym, fields in payload["states"].items():
+            if sym not in self.symbols:
+                self.logger.warning(f"Snapshot symbol not traded, skipped: {sym}")
+                continue
+            st = _SymbolState(symbol=sym, **fields)
+            if st.buffer.capacity != capacity:
+                st.buffer = st.buffer.resized(capacity)
+            if st.bar_signals.maxlen != capacity:
+                st.bar_signals = deque(st.bar_signals, maxlen=capacity)
+            st.chart_version += 1
+            self._states[sym] = st
+
+        self._equity = payload["equity"]
+        eng = getattr(self._trade_gw, "_engine", None)
+        if eng is not None and payload.get("execution") is not None:
+            with self._trade_lock:
+                eng.set_state(payload["execution"])
+        self.logger.info(f"Snapshot restored: {path} (saved {payload['saved_at']:%Y-%m-%d %H:%M:%S} UTC)")
 
-        date_fmt = "%Y-%m-%d" if self.signal_interval == "1d" else "%Y-%m-%d %H:%M:%S"
+    def get_chart_data(self, symbol: Optional[str] = None, since: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return cached K-lines and signals for charting.
 
-        candles: List[Dict[str, Any]] = []
-        for idx, row in self._cached_bars.iterrows():
-            c = float(row.get("Close", 0) or 0)
-            o = float(row.get("Open", c) or c)
-            h = float(row.get("High", c) or c)
-            l_ = float(row.get("Low", c) or c)
-            date_str = idx.strftime(date_fmt) if hasattr(idx, "strftime") else str(idx)[:16]
-            candles.append({"date": date_str, "open": o, "high": h, "low": l_, "close": c})
+        Called without re-fetching or re-calculating. The payload is built once per
+        bars/signals update and reused by later calls. Empty if no cache yet
+        (e.g. before first tick cycle). In tick mode with an on_tick strategy the
+        candles are the last lookback_bars ticks and signals the ones on_tick returned.
 
-        sigs = self._cached_signals.reindex(self._cached_bars.index, fill_value=0)
-        signals = [int(x) if pd.notna(x) else 0 for x in sigs]
+        Args:
+            symbol: Symbol to chart; defaults to the first symbol.
+            since: Cursor from a previous call. Only candles at or after it are returned
+                (the candle at the cursor may still be forming), so pollers transfer deltas.
 
-        return {"candles": candles, "signals": signals}
+        Returns:
+            dict with keys: candles (list of {date, open, high, low, close}),
+            signals (list of int), cursor (date of the last candle, pass back as since),
+            full (True when the whole window was returned, e.g. the cursor fell out of it).
+        """
+        st = self._states.get(symbol or self.symbol)
+        chart = self._chart_payload(st) if st is not None else None
+        if chart is None:
+            return {"candles": [], "signals": [], "cursor": since, "full": since is None}
+
+        dates = chart["dates"]
+        start = 0 if since is None else bisect.bisect_left(dates, since)
+        if start == 0:
+            candles, signals = list(chart["candles"]), list(chart["signals"])
+        else:
+            candles, signals = chart["candles"][start:], chart["signals"][start:]
+        return {"candles": candles, "signals": signals, "cursor": dates[-1], "full": start == 0}
 
     def get_trades_df(self) -> pd.DataFrame:
         """Return trades from the trade gateway's execution engine (same structure as backtest)."""
@@ -200,42 +381,127 @@ class LiveEngine(BaseComponent):
         return pd.DataFrame(eng.trades)
 
     def get_values_df(self) -> pd.DataFrame:
-        """Return recorded equity curve (same shape as backtest values_df) for metrics."""
-        if not self._values_records:
-            return pd.DataFrame()
-        df = pd.DataFrame(self._values_records)
-        if "date" not in df.columns:
-            return df
-        df = df.drop_duplicates(subset=["date"], keep="last")
-        df = df.sort_values("date").reset_index(drop=True)
-        return df
+        """Return recorded equity curve (same shape as backtest values_df) for metrics; newest max_value_records points."""
+        return self._equity.to_frame()
 
     def calculate_metrics(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Compute live metrics (return, drawdown, sharpe, etc.) from recorded trades and values.
         Same API as BacktestEngine.calculate_metrics(). Call during or after run_live().
+        With several symbols the metrics cover the whole portfolio.
         """
         trades_df = self.get_trades_df()
         values_df = self.get_values_df()
         if values_df.empty:
             return pd.DataFrame(), {}
         reporter = PerformanceReporter()
-        return reporter.compute(self.symbol, trades_df, values_df)
+        label = self.symbol if len(self.symbols) == 1 else ",".join(self.symbols)
+        return reporter.compute(label, trades_df, values_df)
+
+    def get_live_metrics(self) -> Dict[str, Any]:
+        """
+        O(1) running metrics over the whole run: total/annualized return, avg_daily_return,
+        return_std, volatility, sharpe_ratio, max_drawdown, start/end capital, points.
+        Same definitions as calculate_metrics(), without rebuilding the values DataFrame.
+        """
+        return self._equity.metrics()
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-stage latency percentiles in microseconds: {stage: {count, mean_us, p50_us, p99_us, max_us}}.
+
+        Stages:
+            dispatch: gateway receipt -> strategy handler start (event queueing, matching)
+            fetch_bars: DataFetcher round trip in bar mode
+            strategy: strategy handler start -> signal ready (includes fetch_bars)
+            order: signal ready -> send_order returned
+            tick_to_order: gateway receipt -> send_order returned
+            match: ExecutionEngine.on_tick per tick
+        """
+        return self._latency.stats() if self._latency else {}
+
+    def get_conflation_stats(self) -> Dict[str, Any]:
+        """Submitted / processed / conflated tick counts when conflate_ticks is on, else empty."""
+        return self._conflator.stats() if self._conflator else {}
+
+    def _chart_payload(self, st: _SymbolState) -> Optional[Dict[str, Any]]:
+        """Chart candles/signals for a symbol, rebuilt (vectorized) only when its cached bars changed."""
+        version = st.chart_version  # read first: a concurrent update can only make the cache stale
+        chart = st.chart_cache
+        if chart is not None and chart["version"] == version:
+            return chart
+        if self._charts_buffer(st):
+            # on_tick strategies never build a DataFrame: chart the recorded ticks and their signals
+            with st.lock:
+                bars = st.buffer.to_frame(self.lookback_bars).copy()
+                recorded = dict(st.bar_signals)  # last signal per timestamp
+            sigs = pd.Series(list(recorded.values()), index=pd.DatetimeIndex(list(recorded.keys())), dtype=int)
+        else:
+            bars, sigs = st.cached_bars, st.cached_signals
+        if bars is None or sigs is None or bars.empty:
+            return None
+
+        close = bars["Close"].astype(float).fillna(0.0) if "Close" in bars else pd.Series(0.0, index=bars.index)
+
+        def _col(name: str) -> pd.Series:
+            if name not in bars:
+                return close
+            col = bars[name].astype(float)
+            return col.where(col.notna() & (col != 0), close)
+
+        idx = bars.index
+        if isinstance(idx, pd.DatetimeIndex):
+            date_fmt = "%Y-%m-%d" if self.signal_interval == "1d" else "%Y-%m-%d %H:%M:%S"
+            dates = list(idx.strftime(date_fmt))
+        else:
+            dates = [str(x)[:16] for x in idx]
+        columns = zip(dates, _col("Open").tolist(), _col("High").tolist(), _col("Low").tolist(), close.tolist())
+        candles = [{"date": d, "open": o, "high": h, "low": l_, "close": c} for d, o, h, l_, c in columns]
+        signals = sigs.reindex(idx, fill_value=0).fillna(0).astype(int).tolist()
+
+        chart = {"version": version, "dates": dates, "candles": candles, "signals": signals}
+        st.chart_cache = chart
+        return chart
+
+    def _charts_buffer(self, st: _SymbolState) -> bool:
+        """True if the symbol's chart comes from the tick buffer (tick mode with an on_tick strategy)."""
+        return self.signal_interval == "tick" and st.strategy is not None and st.strategy.supports_on_tick
 
     def _ensure_gateways(self) -> None:
         """Lazy-create data gateway, trade gateway and (if not tick) DataFetcher."""
-        if self.symbol is None:
+        if not self.symbols:
             raise ValueError("symbol must be set (set_parameters or constructor)")
         if self._data_gw is None:
-            self._data_gw = create_data_gateway(
-                self.data_gateway_name, interval=self.interval, **self._data_gateway_params
-            )
+            params = {"interval": self.interval, **self._data_gateway_params}
+            if self._share_data_gateway:
+                self._data_gw = get_market_data_hub().acquire(self.data_gateway_name, **params)
+            else:
+                self._data_gw = create_data_gateway(self.data_gateway_name, **params)
         if self._trade_gw is None:
             self._trade_gw = create_trade_gateway(self.trade_gateway_name, **self._trade_gateway_params)
         if self._data_fetcher is None and self.signal_interval != "tick":
-            self._data_fetcher = DataFetcher(source="yahoo")
+            # Cached: earlier sessions are read from disk, only today's bars are downloaded
+            self._data_fetcher = DataFetcher(source="yahoo", cache=True)
+
+    def _ensure_states(self) -> None:
+        """Create per-symbol state; a strategy bound to several symbols is copied so state is never shared."""
+        used = {id(st.strategy) for st in self._states.values() if st.strategy is not None}
+        for sym in self.symbols:
+            if sym in self._states:
+                continue
+            strategy = self._symbol_strategies.get(sym, self._strategy)
+            if strategy is not None:
+                if id(strategy) in used:
+                    strategy = copy.deepcopy(strategy)
+                used.add(id(strategy))
+            self._states[sym] = _SymbolState(
+                symbol=sym,
+                strategy=strategy,
+                buffer=PriceRingBuffer(self.lookback_bars + 100),
+                bar_signals=deque(maxlen=self.lookback_bars + 100),
+            )
 
-    def _fetch_bars(self) -> Optional[pd.DataFrame]:
+    def _fetch_bars(self, symbol: str) -> Optional[pd.DataFrame]:
         """Fetch last lookback_bars of K-line data via DataFetcher for current signal_interval."""
         if self._data_fetcher is None or self.signal_interval == "tick":
             return None
@@ -253,9 +519,15 @@ class LiveEngine(BaseComponent):
         # yfinance end_date is exclusive; use next day to include today
         end = (now + timedelta(days=1)).strftime("%Y-%m-%d")
         try:
-            data = self._data_fetcher.fetch_data(
-                self.symbol, start, end, clean=True, interval=self.signal_interval
-            )
+            if self.bar_base_interval and self.bar_base_interval != self.signal_interval:
+                data = self._data_fetcher.fetch_resampled(
+                    symbol, start, end, interval=self.signal_interval,
+                    base_interval=self.bar_base_interval, clean=True,
+                )
+            else:
+                data = self._data_fetcher.fetch_data(
+                    symbol, start, end, clean=True, interval=self.signal_interval
+                )
         except Exception as e:
             self.logger.warning(f"DataFetcher failed: {e}")
             return None
@@ -268,6 +540,12 @@ class LiveEngine(BaseComponent):
             )
         return data.tail(n)
 
+    def _on_gateway_tick(self, tick: Any) -> None:
+        """Gateway tick handler: stamp receipt time (unless the gateway did) and dispatch."""
+        if self._latency and getattr(tick, "recv_ns", None) is None:
+            tick.recv_ns = time.perf_counter_ns()
+        self._event_engine.emit(EVENT_TICK, tick)
+
     def _on_tick_match(self, tick: Any) -> None:
         """Forward tick to execution engine for order matching."""
         if getattr(tick, "source", None) != "yf_warmup":
@@ -276,75 +554,186 @@ class LiveEngine(BaseComponent):
             v = tick.volume
             self.logger.info(f"Tick: [{tick.symbol}] {tick.price:.2f} vol={v}({_vol_str(v)}) @ {ts}")
         if self._trade_gw:
-            self._trade_gw._engine.on_tick(tick)
+            t0 = time.perf_counter_ns()
+            with self._trade_lock:
+                self._trade_gw._engine.on_tick(tick)
+            if self._latency:
+                self._latency.record("match", time.perf_counter_ns() - t0)
+
+    def _on_tick_record(self, tick: Any) -> None:
+        """Record every live tick (last price, tick-mode price history) on the gateway thread, before conflation."""
+        if getattr(tick, "source", None) == "yf_warmup":
+            return
+        st = self._states.get(tick.symbol)
+        if st is None:
+            return
+        st.last_price = float(tick.price)
+        if self.signal_interval == "tick":
+            with st.lock:
+                st.buffer.append(tick.timestamp, float(tick.price), tick.volume)
+                if self._charts_buffer(st):
+                    st.chart_version += 1
+
+    def _on_tick_conflate(self, tick: Any) -> None:
+        """Hand live ticks to the conflator; warm-up ticks never reach the strategy."""
+        if getattr(tick, "source", None) != "yf_warmup":
+            self._conflator.submit(tick)
 
     def _on_tick_strategy(self, tick: Any) -> None:
         """Build data (tick or fetched bars), run strategy, send order on signal change."""
         if getattr(tick, "source", None) == "yf_warmup":
             return
-        if tick.symbol != self.symbol or self._strategy is None:
+        st = self._states.get(tick.symbol)
+        if st is None or st.strategy is None:
             return
-
+        lat = self._latency
+        t_dispatch = time.perf_counter_ns()
+        recv_ns = getattr(tick, "recv_ns", None)
+        if lat and recv_ns is not None:
+            lat.record("dispatch", t_dispatch - recv_ns)
+
+        signal = self._evaluate_strategy(st, tick)
+        if signal is None:
+            return
+        if lat:
+            t_signal = time.perf_counter_ns()
+            lat.record("strategy", t_signal - t_dispatch)
+        with self._trade_lock:
+            order_id = self._handle_signal(st, tick, signal)
+        if lat:
+            if order_id is not None:
+                t_order = time.perf_counter_ns()
+                lat.record("order", t_order - t_signal)
+                if recv_ns is not None:
+                    lat.record("tick_to_order", t_order - recv_ns)
+            self._maybe_log_latency()
+
+    def _maybe_log_latency(self) -> None:
+        """Emit a latency summary line every latency_log_interval seconds."""
+        if self.latency_log_interval <= 0:
+            return
+        now = time.time()
+        if now - self._last_latency_log < self.latency_log_interval:
+            return
+        self._last_latency_log = now
+        line = self._latency.summary()
+        if line:
+            self.logger.info(f"Latency: {line}")
+
+    def _evaluate_strategy(self, st: _SymbolState, tick: Any) -> Optional[int]:
+        """Return the latest signal, preferring on_tick/on_bar over generate_signals. None = nothing new."""
+        strategy = st.strategy
         if self.signal_interval == "tick":
-            self._prices.append(float(tick.price))
-            self._timestamps.append(tick.timestamp)
-            if len(self._prices) < self.lookback_bars:
-                return
-            n = self.lookback_bars
-            df = pd.DataFrame(
-                {"Close": list(self._prices)[-n:]},
-                index=list(self._timestamps)[-n:],
-            )
+            if strategy.supports_on_tick:
+                # Incremental strategies keep their own state; skip the buffer entirely
+                try:
+                    sig = strategy.on_tick(tick)
+                except Exception as e:
+                    self.logger.warning(f"Strategy on_tick failed: {e}")
+                    return None
+                # Keep the signal for the chart, which is drawn from the tick buffer
+                with st.lock:
+                    st.bar_signals.append((np.datetime64(tick.timestamp, "ns"), int(sig) if sig is not None else 0))
+                    st.chart_version += 1
+                return int(sig) if sig is not None else None
+            # The buffer is filled by _on_tick_record; with conflation it keeps growing while the
+            # strategy runs, so work on a copy of the window
+            with st.lock:
+                if len(st.buffer) < self.lookback_bars:
+                    return None
+                df = st.buffer.to_frame(self.lookback_bars).copy()
         else:
             refetch_sec = _REFETCH_SEC.get(self.signal_interval, 60)
-            if time.time() - self._last_fetch_time < refetch_sec:
-                return
-            df = self._fetch_bars()
+            if time.time() - st.last_fetch_time < refetch_sec:
+                return None
+            t0 = time.perf_counter_ns()
+            df = self._fetch_bars(st.symbol)
+            if self._latency:
+                self._latency.record("fetch_bars", time.perf_counter_ns() - t0)
             if df is None:
-                return
-            self._last_fetch_time = time.time()
+                return None
+            st.last_fetch_time = time.time()
+            if strategy.supports_on_bar:
+                return self._feed_bars(st, df)
 
         try:
-            signals = self._strategy.generate_signals(df)
+            signals = strategy.generate_signals(df)
         except Exception as e:
             self.logger.warning(f"Strategy signal failed: {e}")
-            return
+            return None
 
         if signals.empty:
-            return
+            return None
 
         # Cache bars and signals for chart / application consumption
-        self._cached_bars = df
-        self._cached_signals = signals
-
-        signal = int(signals.iloc[-1])
+        st.cached_bars = df
+        st.cached_signals = signals
+        st.chart_version += 1
+        return int(signals.iloc[-1])
+
+    def _feed_bars(self, st: _SymbolState, df: pd.DataFrame) -> Optional[int]:
+        """Feed closed bars newer than the last one seen to on_bar; the last row is still forming."""
+        closed = df.iloc[:-1]
+        if st.last_bar_time is not None:
+            closed = closed[closed.index > st.last_bar_time]
+        st.cached_bars = df
+        if closed.empty:
+            st.chart_version += 1  # forming bar may have moved
+            return None
+        signal = None
+        try:
+            for bar in iter_bars(closed, st.symbol):
+                sig = st.strategy.on_bar(bar)
+                st.bar_signals.append((bar.timestamp, int(sig) if sig is not None else 0))
+                # Advance only past bars the strategy consumed; a failing bar is retried on the next fetch
+                st.last_bar_time = bar.timestamp
+                if sig is not None:
+                    signal = int(sig)
+        except Exception as e:
+            self.logger.warning(f"Strategy on_bar failed: {e}")
+            signal = None
+        if st.bar_signals:
+            ts, sigs = zip(*st.bar_signals)
+            st.cached_signals = pd.Series(sigs, index=list(ts), dtype=int)
+        st.chart_version += 1
+        return signal
+
+    def _portfolio_value(self, eng: Any) -> float:
+        """Mark all open positions at each symbol's last seen price (avg cost if none yet)."""
+        value = 0.0
+        for sym, pos in eng.position_manager.positions.items():
+            st = self._states.get(sym)
+            px = st.last_price if st is not None and st.last_price is not None else pos.get("avg_price", 0.0)
+            value += pos["quantity"] * px
+        return value
+
+    def _handle_signal(self, st: _SymbolState, tick: Any, signal: int) -> Optional[str]:
+        """Record equity, log the decision and send/cancel orders when the signal changes. Returns the sent order id."""
+        symbol = st.symbol
         eng = self._trade_gw._engine
         px = tick.price
-        position = eng.position_manager.get_position(self.symbol)
+        position = eng.position_manager.get_position(symbol)
         cash = eng.cash or 0.0
         commission = getattr(eng, "commission", 0.0) or 0.0
 
         # Record equity curve for live metrics (same shape as backtest values_records)
-        position_value = position * px
+        position_value = position * px if len(self._states) == 1 else self._portfolio_value(eng)
         total_value = cash + position_value
-        prev_total = self._values_records[-1]["total_value"] if self._values_records else total_value
-        daily_pnl = total_value - prev_total
-        self._values_records.append({
-            "date": tick.timestamp,
-            "signal": signal,
-            "price": px,
-            "cash": cash,
-            "position": position,
-            "position_value": position_value,
-            "total_value": total_value,
-            "daily_pnl": daily_pnl,
-        })
+        self._equity.record(
+            tick.timestamp,
+            signal=signal,
+            price=px,
+            cash=cash,
+            position=position,
+            position_value=position_value,
+            total_value=total_value,
+        )
 
         # One-line summary every time we have a signal
         action_key = "no_change"
         action = "no_change"
-        if signal == 1 and self._last_signal <= 0:
-            am = getattr(self._strategy, "order_amount", None)
+        if signal == 1 and st.last_signal <= 0:
+            am = getattr(st.strategy, "order_amount", None)
             max_qty = max(0, int(cash / (px * (1 + commission))))
             if am is not None and am > 0:
                 qty = min(max(0, int(am / (px * (1 + commission)))), max_qty)
@@ -354,7 +743,7 @@ class LiveEngine(BaseComponent):
                 action_key, action = "buy", f"BUY qty={qty}"
             else:
                 action_key, action = "skip", "BUY skip (qty=0)"
-        elif signal == -1 and self._last_signal >= 0:
+        elif signal == -1 and st.last_signal >= 0:
             if position > 0:
                 action_key, action = "sell", f"SELL qty={position}"
             else:
@@ -362,27 +751,29 @@ class LiveEngine(BaseComponent):
         icon = _SIG_ICON.get(signal, "?")
         act_icon = _ACTION_ICON.get(action_key, "?")
         self.logger.info(
-            f"Signal: {icon} {signal} [{self.symbol}] {px:.2f} cash={cash:.0f} pos={position} -> {act_icon} {action}"
+            f"Signal: {icon} {signal} [{symbol}] {px:.2f} cash={cash:.0f} pos={position} -> {act_icon} {action}"
         )
 
-        if signal == self._last_signal:
-            return
+        if signal == st.last_signal:
+            return None
 
         # Cancel pending order when signal flips to avoid contradictory fills
-        if self._last_pending_order_id:
-            cancelled = self._trade_gw.cancel_order(self._last_pending_order_id)
+        if st.last_pending_order_id:
+            cancelled = self._trade_gw.cancel_order(st.last_pending_order_id)
             if cancelled:
-                self.logger.info(f"Cancelled pending order: {self._last_pending_order_id}")
-            self._last_pending_order_id = None
+                self.logger.info(f"Cancelled pending order: {st.last_pending_order_id}")
+            st.last_pending_order_id = None
 
-        if signal == 1 and self._last_signal <= 0:
+        order_id = None
+        if signal == 1 and st.last_signal <= 0:
             if qty > 0:
-                req = OrderRequest(symbol=self.symbol, quantity=qty, price=px, order_type="limit")
+                req = OrderRequest(symbol=symbol, quantity=qty, price=px, order_type="limit")
                 order_id = self._trade_gw.send_order(req)
-                self._last_pending_order_id = order_id
-        elif signal == -1 and self._last_signal >= 0 and position > 0:
-            req = OrderRequest(symbol=self.symbol, quantity=-position, price=px, order_type="limit")
+                st.last_pending_order_id = order_id
+        elif signal == -1 and st.last_signal >= 0 and position > 0:
+            req = OrderRequest(symbol=symbol, quantity=-position, price=px, order_type="limit")
             order_id = self._trade_gw.send_order(req)
-            self._last_pending_order_id = order_id
+            st.last_pending_order_id = order_id
 
-        self._last_signal = signal
\ No newline at end of file
+        st.last_signal = signal
+        return order_id
@@ -0,0 +1,130 @@
+"""
+Bounded equity recording and streaming performance metrics for LiveEngine.
+
+`EquityRecorder` stores the live equity curve in preallocated columnar arrays
+(a ring keeping the newest `capacity` points), optionally collapsing samples to
+one point per bar. `StreamingPerformance` (deltafq.backtest.performance) folds every finished
+point into O(1) accumulators, so return / volatility / Sharpe / drawdown queries
+never rescan the history.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..backtest.performance import StreamingPerformance
+from .tick_format import to_ns
+
+_FIELDS = ("signal", "price", "cash", "position", "position_value", "total_value", "daily_pnl")
+_INPUT_FIELDS = _FIELDS[:-1]
+
+
+class EquityRecorder:
+    """Bounded columnar equity curve with optional per-bar downsampling and streaming metrics."""
+
+    def __init__(self, capacity: int = 100_000, bar_interval: Optional[str] = None,
+                 periods: int = 252) -> None:
+        """
+        Args:
+            capacity: Newest points kept for get_values_df (metrics still cover the whole run).
+            bar_interval: Keep one point per bar of this size (e.g. "1m", "5m", "1d"); None keeps one
+                point per distinct timestamp.
+            periods: Periods per year for annualized metrics.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.bar_interval = bar_interval
+        self._bucket_ns = int(pd.Timedelta(bar_interval).value) if bar_interval else 0
+        self._dates = np.zeros(capacity, dtype=np.int64)
+        self._cols = {name: np.zeros(capacity, dtype=np.float64) for name in _FIELDS}
+        self._start = 0
+        self._n = 0
+        self._last_key: Optional[int] = None
+        self.perf = StreamingPerformance(periods)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle only the retained points (oldest first), not the preallocated capacity
+        state = self.__dict__.copy()
+        del state["_lock"]
+        order = (self._start + np.arange(self._n)) % self.capacity
+        state["_dates"] = self._dates[order]
+        state["_cols"] = {name: col[order] for name, col in self._cols.items()}
+        state["_start"] = 0
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        pad = self.capacity - self._n
+        self._dates = np.concatenate([self._dates, np.zeros(pad, dtype=np.int64)])
+        self._cols = {name: np.concatenate([col, np.zeros(pad)]) for name, col in self._cols.items()}
+        self._lock = threading.Lock()
+
+    @property
+    def last_total_value(self) -> Optional[float]:
+        """total_value of the newest point (None before the first record)."""
+        if not self._n:
+            return None
+        return float(self._cols["total_value"][(self._start + self._n - 1) % self.capacity])
+
+    def record(self, date: Any, **values: float) -> None:
+        """Add a point (fields: signal, price, cash, position, position_value, total_value).
+
+        A point in the same bar (or with the same timestamp) as the previous one replaces it;
+        otherwise the previous point becomes final and is folded into the metrics.
+        daily_pnl is derived as the change in total_value since the previous final point.
+        """
+        ns = to_ns(date)
+        key = ns // self._bucket_ns if self._bucket_ns else ns
+        with self._lock:
+            if self._n and key == self._last_key:
+                i = (self._start + self._n - 1) % self.capacity
+            else:
+                if self._n:
+                    self.perf.update(self._cols["total_value"][(self._start + self._n - 1) % self.capacity])
+                if self._n == self.capacity:
+                    self._start = (self._start + 1) % self.capacity
+                else:
+                    self._n += 1
+                i = (self._start + self._n - 1) % self.capacity
+            self._last_key = key
+            self._dates[i] = ns
+            for name in _INPUT_FIELDS:
+                self._cols[name][i] = values.get(name, 0.0)
+            prev = self.perf.last_value
+            self._cols["daily_pnl"][i] = 0.0 if prev is None else self._cols["total_value"][i] - prev
+
+    def metrics(self) -> Dict[str, Any]:
+        """Streaming return / volatility / Sharpe / max drawdown over every recorded point, O(1)."""
+        with self._lock:
+            pending = self.last_total_value
+            return self.perf.metrics(pending)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Retained points as a values_df (date + fields), oldest first."""
+        with self._lock:
+            if not self._n:
+                return pd.DataFrame()
+            order = (self._start + np.arange(self._n)) % self.capacity
+            data = {"date": pd.to_datetime(self._dates[order])}
+            for name in _FIELDS:
+                data[name] = self._cols[name][order]
+        df = pd.DataFrame(data)
+        df["signal"] = df["signal"].astype(int)
+        df["position"] = df["position"].astype(int)
+        if not df["date"].is_monotonic_increasing:
+            df = df.sort_values("date", kind="stable").drop_duplicates(subset=["date"], keep="last")
+            df = df.reset_index(drop=True)
+        return df
+
+    def reset(self) -> None:
+        with self._lock:
+            self._start = self._n = 0
+            self._last_key = None
+            self.perf.reset()
@@ -1,11 +1,13 @@
 from typing import Any, Dict, Type
 
 from .gateways import DataGateway, TradeGateway
-from ..adapters.data import YFinanceDataGateway
+from ..adapters.data import ReplayDataGateway, SharedMemoryDataGateway, YFinanceDataGateway
 from ..adapters.trade import PaperTradeGateway
 
 DATA_GATEWAYS: Dict[str, Type[DataGateway]] = {
     "yfinance": YFinanceDataGateway,
+    "shm": SharedMemoryDataGateway,
+    "replay": ReplayDataGateway,
 }
 
 TRADE_GATEWAYS: Dict[str, Type[TradeGateway]] = {
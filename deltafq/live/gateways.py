@@ -21,6 +21,10 @@ class DataGateway(BaseComponent, ABC):
     def subscribe(self, symbols: List[str]) -> bool:
         raise NotImplementedError
 
+    def unsubscribe(self, symbols: List[str]) -> bool:
+        """Stop delivering ticks for symbols. Optional; returns False if unsupported."""
+        return False
+
     @abstractmethod
     def start(self) -> None:
         raise NotImplementedError
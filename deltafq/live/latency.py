@@ -0,0 +1,112 @@
+"""
+Latency histograms for the live tick-to-order path.
+
+`LatencyHistogram` is HDR-style: log-linear buckets over integer nanoseconds, so
+recording is O(1) with fixed memory and percentiles keep ~1.5% relative precision
+from nanoseconds up to minutes. `LatencyTracker` keeps one histogram per stage.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+_SUB_BITS = 7  # 2**7 linear buckets per power of two -> <= 1/64 relative bucket width
+_SUB_COUNT = 1 << _SUB_BITS
+_MAX_EXP = 40  # covers up to ~2**47 ns (~39 hours)
+
+
+def _bucket(ns: int) -> int:
+    e = ns.bit_length() - _SUB_BITS
+    if e <= 0:
+        return ns
+    e = min(e, _MAX_EXP)
+    return (e << _SUB_BITS) + min(ns >> e, _SUB_COUNT - 1)
+
+
+def _bucket_value(idx: int) -> float:
+    """Midpoint of a bucket in ns."""
+    e, m = idx >> _SUB_BITS, idx & (_SUB_COUNT - 1)
+    if e == 0:
+        return float(m)
+    return ((m << e) + ((m + 1) << e)) / 2.0
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear histogram of nanosecond latencies."""
+
+    def __init__(self) -> None:
+        self._counts = np.zeros((_MAX_EXP + 1) << _SUB_BITS, dtype=np.int64)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.min_ns: Optional[int] = None
+
+    def record(self, ns: int) -> None:
+        """Add one latency sample (negative values are clamped to 0)."""
+        ns = max(0, int(ns))
+        self._counts[_bucket(ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+
+    def percentile(self, q: float) -> float:
+        """Latency in ns at percentile q (0-100); exact for max, bucket midpoint otherwise."""
+        if self.count == 0:
+            return 0.0
+        if q >= 100:
+            return float(self.max_ns)
+        rank = max(1, int(np.ceil(self.count * q / 100.0)))
+        idx = int(np.searchsorted(np.cumsum(self._counts), rank))
+        return min(_bucket_value(idx), float(self.max_ns))
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+class LatencyTracker:
+    """Per-stage latency histograms with a thread-safe record() and summary helpers."""
+
+    def __init__(self, stages: Optional[List[str]] = None) -> None:
+        self._lock = threading.Lock()
+        self._hists: Dict[str, LatencyHistogram] = {s: LatencyHistogram() for s in (stages or [])}
+
+    def record(self, stage: str, ns: int) -> None:
+        """Record one sample for a stage (created on first use)."""
+        with self._lock:
+            hist = self._hists.get(stage)
+            if hist is None:
+                hist = self._hists[stage] = LatencyHistogram()
+            hist.record(ns)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """{stage: {count, mean_us, p50_us, p99_us, max_us}}."""
+        with self._lock:
+            out = {}
+            for stage, h in self._hists.items():
+                out[stage] = {
+                    "count": h.count,
+                    "mean_us": h.total_ns / h.count / 1e3 if h.count else 0.0,
+                    "p50_us": h.percentile(50) / 1e3,
+                    "p99_us": h.percentile(99) / 1e3,
+                    "max_us": h.max_ns / 1e3,
+                }
+            return out
+
+    def summary(self) -> str:
+        """One-line summary: stage p50/p99/max in microseconds."""
+        parts = []
+        for stage, s in self.stats().items():
+            if s["count"]:
+                parts.append(
+                    f"{stage} p50={s['p50_us']:.0f}us p99={s['p99_us']:.0f}us max={s['max_us']:.0f}us"
+                )
+        return " | ".join(parts)
+
+    def reset(self) -> None:
+        with self._lock:
+            for h in self._hists.values():
+                h.reset()
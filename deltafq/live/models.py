@@ -10,6 +10,7 @@ class TickData:
     timestamp: datetime
     volume: Optional[int] = None
     source: Optional[str] = None
+    recv_ns: Optional[int] = None  # time.perf_counter_ns() at gateway receipt (latency tracking)
 
 
 @dataclass
@@ -19,3 +20,14 @@ class OrderRequest:
     price: float
     order_type: str = "limit"
     timestamp: Optional[datetime] = None
+
+
+@dataclass
+class BarData:
+    symbol: str
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: Optional[float] = None
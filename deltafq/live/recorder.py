@@ -0,0 +1,104 @@
+"""
+Tick recorder: appends EVENT_TICK ticks to a compact binary file for offline replay.
+
+File layout: a 16-byte header (magic + record size) followed by raw TICK_DTYPE
+records, so files can be memory-mapped and replayed without parsing
+(see `read_tick_file` and ReplayDataGateway).
+
+Typical usage:
+    recorder = TickRecorder("ticks/btc_20260301.ticks")
+    recorder.attach(engine._event_engine)   # or data_gw.set_tick_handler(recorder.record)
+    ...
+    recorder.close()
+"""
+
+import threading
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+from ..core.base import BaseComponent
+from .event_engine import EventEngine, EVENT_TICK
+from .models import TickData
+from .tick_format import TICK_DTYPE, encode_tick
+
+_FILE_MAGIC = b"DFQTICK1"
+_HEADER_SIZE = 16
+
+
+def _write_header(fh) -> None:
+    fh.write(_FILE_MAGIC + np.int64(TICK_DTYPE.itemsize).tobytes())
+
+
+def read_tick_file(path: Union[str, Path]) -> np.ndarray:
+    """Memory-map a tick file as a read-only TICK_DTYPE array (no parsing, no copy)."""
+    path = Path(path)
+    with open(path, "rb") as fh:
+        header = fh.read(_HEADER_SIZE)
+    if len(header) < _HEADER_SIZE or header[:8] != _FILE_MAGIC:
+        raise ValueError(f"Not a DeltaFQ tick file: {path}")
+    if int(np.frombuffer(header[8:], dtype=np.int64)[0]) != TICK_DTYPE.itemsize:
+        raise ValueError(f"Tick record layout mismatch in {path}")
+    n = (path.stat().st_size - _HEADER_SIZE) // TICK_DTYPE.itemsize
+    if n == 0:
+        return np.empty(0, dtype=TICK_DTYPE)
+    return np.memmap(path, dtype=TICK_DTYPE, mode="r", offset=_HEADER_SIZE, shape=(n,))
+
+
+class TickRecorder(BaseComponent):
+    """Buffer ticks in a preallocated columnar block and append them to a tick file in batches."""
+
+    def __init__(self, path: Union[str, Path], flush_size: int = 4096,
+                 include_warmup: bool = False, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.flush_size = flush_size
+        self.include_warmup = include_warmup
+        self._block = np.zeros(flush_size, dtype=TICK_DTYPE)
+        self._n = 0
+        self.count = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        self._fh = open(self.path, "ab")
+        if new_file:
+            _write_header(self._fh)
+        self.logger.info(f"Recording ticks to: {self.path}")
+
+    def attach(self, event_engine: EventEngine) -> None:
+        """Record every EVENT_TICK emitted on the event engine."""
+        event_engine.on(EVENT_TICK, self.record)
+
+    def record(self, tick: TickData) -> None:
+        """Append one tick (flushed to disk every flush_size ticks)."""
+        if not self.include_warmup and tick.source == "yf_warmup":
+            return
+        with self._lock:
+            if self._fh is None:
+                return
+            encode_tick(tick, self._block, self._n)
+            self._n += 1
+            self.count += 1
+            if self._n == self.flush_size:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write buffered ticks to disk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._n and self._fh is not None:
+            self._fh.write(self._block[: self._n].tobytes())
+            self._fh.flush()
+            self._n = 0
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._flush()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+        self.logger.info(f"Recorded {self.count} ticks to: {self.path}")
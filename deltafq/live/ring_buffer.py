@@ -0,0 +1,73 @@
+"""
+Preallocated NumPy ring buffer for tick-mode price history.
+
+Every value is written twice (at i and i + capacity), so the last n entries are
+always one contiguous slice and `window(n)` returns views instead of copies.
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class PriceRingBuffer:
+    """Fixed-capacity ring of (timestamp, price, volume) with zero-copy last-n windows."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._prices = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self._volumes = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self._timestamps = np.full(2 * capacity, np.datetime64("NaT"), dtype="datetime64[ns]")
+        self._head = 0  # next write position in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: datetime, price: float, volume: Optional[float] = None) -> None:
+        """Append one observation, overwriting the oldest once full. O(1), no allocation of arrays."""
+        i = self._head
+        j = i + self.capacity
+        vol = np.nan if volume is None else volume
+        self._prices[i] = self._prices[j] = price
+        self._volumes[i] = self._volumes[j] = vol
+        self._timestamps[i] = self._timestamps[j] = np.datetime64(timestamp, "ns")
+        self._head = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def window(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return (timestamps, prices, volumes) views of the last n entries (oldest first).
+
+        Views share memory with the buffer and are only valid until the next append;
+        copy them if they must outlive the current tick.
+        """
+        n = self._size if n is None else min(n, self._size)
+        end = self._head + self.capacity
+        sl = slice(end - n, end)
+        return self._timestamps[sl], self._prices[sl], self._volumes[sl]
+
+    def to_frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        """Materialize the last n entries as a DataFrame (Close, Volume) indexed by timestamp."""
+        ts, prices, volumes = self.window(n)
+        return pd.DataFrame(
+            {"Close": prices, "Volume": volumes},
+            index=pd.DatetimeIndex(ts),
+            copy=False,
+        )
+
+    def resized(self, capacity: int) -> "PriceRingBuffer":
+        """Return a new buffer of the given capacity holding the most recent entries."""
+        buf = PriceRingBuffer(capacity)
+        ts, prices, volumes = self.window(capacity)
+        n = len(prices)
+        buf._prices[:n] = buf._prices[capacity:capacity + n] = prices
+        buf._volumes[:n] = buf._volumes[capacity:capacity + n] = volumes
+        buf._timestamps[:n] = buf._timestamps[capacity:capacity + n] = ts
+        buf._head = n % capacity
+        buf._size = n
+        return buf
@@ -0,0 +1,153 @@
+"""
+Cross-process shared-memory tick bus (single writer, many readers).
+
+One process owns the market-data feed and publishes every TickData into a
+`multiprocessing.shared_memory` ring; strategy processes attach with
+`SharedMemoryDataGateway` (registered as "shm") and receive ticks without
+pickling or sockets.
+
+Layout of the segment:
+    header   int64[8]              magic, capacity, write_seq
+    seqs     int64[capacity]       per-slot sequence number (0 while being written)
+    records  TICK_DTYPE[capacity]  tick payloads
+
+Typical usage:
+    # feed process
+    pub = SharedMemoryTickPublisher("deltafq_ticks", capacity=65536)
+    data_gw.set_tick_handler(pub.publish)
+
+    # strategy process
+    engine.set_data_gateway("shm", bus_name="deltafq_ticks", interval=0.0005)
+"""
+
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..core.base import BaseComponent
+from .models import TickData
+from .tick_format import TICK_DTYPE, decode_tick, encode_tick
+
+_MAGIC = 0x44465154494B  # "DFQTIK"
+_HEADER_SLOTS = 8
+_H_MAGIC, _H_CAPACITY, _H_WRITE_SEQ = 0, 1, 2
+_OWNED: set = set()  # segments created by publishers in this process
+
+
+def _segment_size(capacity: int) -> int:
+    return 8 * _HEADER_SLOTS + 8 * capacity + TICK_DTYPE.itemsize * capacity
+
+
+def _views(buf, capacity: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Header, seqs and records arrays backed by the shared segment."""
+    header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=buf, offset=0)
+    seqs = np.ndarray((capacity,), dtype=np.int64, buffer=buf, offset=8 * _HEADER_SLOTS)
+    records = np.ndarray(
+        (capacity,), dtype=TICK_DTYPE, buffer=buf, offset=8 * _HEADER_SLOTS + 8 * capacity
+    )
+    return header, seqs, records
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process' resource tracker unlink it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        if name in _OWNED:
+            return shm  # registration belongs to our own publisher
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+class SharedMemoryTickPublisher(BaseComponent):
+    """Single writer: owns the shared segment and appends ticks with sequence numbers."""
+
+    def __init__(self, bus_name: str = "deltafq_ticks", capacity: int = 65536, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.bus_name = bus_name
+        self.capacity = capacity
+        self._shm = shared_memory.SharedMemory(name=bus_name, create=True, size=_segment_size(capacity))
+        _OWNED.add(bus_name)
+        self._header, self._seqs, self._records = _views(self._shm.buf, capacity)
+        self._seqs[:] = 0
+        self._header[:] = 0
+        self._header[_H_CAPACITY] = capacity
+        self._header[_H_WRITE_SEQ] = 0
+        self._header[_H_MAGIC] = _MAGIC
+        self._seq = 0
+        self.logger.info(f"Created shared-memory tick bus '{bus_name}' (capacity={capacity})")
+
+    def publish(self, tick: TickData) -> int:
+        """Append one tick; returns its sequence number. Usable directly as a tick handler."""
+        seq = self._seq + 1
+        slot = (seq - 1) % self.capacity
+        self._seqs[slot] = 0  # readers treat 0 as "being written"
+        encode_tick(tick, self._records, slot)
+        self._seqs[slot] = seq
+        self._header[_H_WRITE_SEQ] = seq
+        self._seq = seq
+        return seq
+
+    def close(self, unlink: bool = True) -> None:
+        """Detach; by default also remove the segment (readers keep their mapping until they close)."""
+        self._header = self._seqs = self._records = None
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+            _OWNED.discard(self.bus_name)
+
+
+class SharedMemoryTickReader:
+    """One reader cursor over a published ring. Not thread-safe; use one per consumer thread."""
+
+    def __init__(self, bus_name: str = "deltafq_ticks", from_start: bool = False) -> None:
+        self.bus_name = bus_name
+        self._shm = _attach(bus_name)
+        header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=self._shm.buf, offset=0)
+        if int(header[_H_MAGIC]) != _MAGIC:
+            self._shm.close()
+            raise ValueError(f"Shared memory '{bus_name}' is not a DeltaFQ tick bus")
+        self.capacity = int(header[_H_CAPACITY])
+        self._header, self._seqs, self._records = _views(self._shm.buf, self.capacity)
+        write_seq = int(self._header[_H_WRITE_SEQ])
+        self._next = max(1, write_seq - self.capacity + 1) if from_start else write_seq + 1
+        self.lost = 0  # ticks overwritten before this reader got to them
+
+    def poll(self, max_items: Optional[int] = None) -> List[TickData]:
+        """Return ticks published since the last poll (oldest first)."""
+        out: List[TickData] = []
+        write_seq = int(self._header[_H_WRITE_SEQ])
+        if write_seq - self._next >= self.capacity:
+            skipped = write_seq - self.capacity + 1 - self._next
+            self.lost += skipped
+            self._next += skipped
+        while self._next <= write_seq:
+            if max_items is not None and len(out) >= max_items:
+                break
+            slot = (self._next - 1) % self.capacity
+            before = int(self._seqs[slot])
+            record = self._records[slot].copy()
+            after = int(self._seqs[slot])
+            if before != self._next or after != self._next:
+                if before > self._next or after > self._next:
+                    # Writer lapped us on this slot; resync to the oldest slot still intact
+                    resync = int(self._header[_H_WRITE_SEQ]) - self.capacity + 1
+                    self.lost += max(1, resync - self._next)
+                    self._next = max(self._next + 1, resync)
+                    continue
+                break  # slot still being written; pick it up next poll
+            out.append(decode_tick(record))
+            self._next += 1
+        return out
+
+    def close(self) -> None:
+        """Detach from the segment."""
+        self._header = self._seqs = self._records = None
+        self._shm.close()
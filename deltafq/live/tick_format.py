@@ -0,0 +1,63 @@
+"""
+Fixed-width binary layout for TickData, shared by the shared-memory bus and tick files.
+
+Timestamps are stored as int64 nanoseconds since the epoch (naive UTC, like the
+gateways), volume None as -1, symbol/source as fixed-width ASCII.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+
+from .models import TickData
+
+TICK_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("price", "<f8"),
+    ("volume", "<i8"),
+    ("symbol", "S32"),
+    ("source", "S16"),
+])
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_VOLUME = -1
+
+
+def to_ns(ts: Any) -> int:
+    """datetime / pd.Timestamp / np.datetime64 -> int64 ns since epoch (tz-aware values converted to UTC)."""
+    if getattr(ts, "tzinfo", None) is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return int(np.datetime64(ts, "ns").astype(np.int64))
+
+
+def from_ns(ns: int) -> datetime:
+    """int64 ns since epoch -> naive datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=int(ns) // 1000)
+
+
+def encode_tick(tick: TickData, out: np.ndarray, i: int) -> None:
+    """Write one tick into row i of a TICK_DTYPE array."""
+    symbol = tick.symbol.encode("ascii")
+    if len(symbol) > TICK_DTYPE["symbol"].itemsize:
+        raise ValueError(f"Symbol too long for tick record: {tick.symbol}")
+    out[i] = (
+        to_ns(tick.timestamp),
+        tick.price,
+        _NO_VOLUME if tick.volume is None else tick.volume,
+        symbol,
+        (tick.source or "").encode("ascii")[: TICK_DTYPE["source"].itemsize],
+    )
+
+
+def decode_tick(row: Any) -> TickData:
+    """Build a TickData from one TICK_DTYPE record."""
+    volume = int(row["volume"])
+    source = row["source"].decode("ascii")
+    return TickData(
+        symbol=row["symbol"].decode("ascii"),
+        price=float(row["price"]),
+        timestamp=from_ns(row["timestamp"]),
+        volume=None if volume == _NO_VOLUME else volume,
+        source=source or None,
+    )
@@ -1,31 +1,103 @@
 """Common utilities for simple trading strategies."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict
+from abc import ABC
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from ..core.base import BaseComponent
 
+if TYPE_CHECKING:
+    from ..live.models import BarData, TickData
+
 
 class BaseStrategy(BaseComponent, ABC):
-    """Minimal base class: fetch signals from `generate_signals` and return them."""
+    """
+    Minimal base class: fetch signals from `generate_signals` and return them.
+
+    Strategies may instead (or additionally) implement the incremental callbacks
+    `on_bar(bar)` / `on_tick(tick)`, each returning the latest {-1, 0, 1} signal.
+    LiveEngine prefers them when present (O(1) per event, no DataFrame build), and
+    the default `generate_signals` replays `on_bar` so BacktestEngine drives the
+    same code path. A subclass must implement at least one of `generate_signals`,
+    `on_bar` or `on_tick` (on the class or on the instance, e.g. after `super().__init__()`);
+    one that implements none raises TypeError when it is first run.
+    """
 
     def __init__(self, name: str = None, **kwargs: Any) -> None:
         super().__init__(name=name, **kwargs)
         self.signals: pd.Series = pd.Series(dtype=int)
         self.logger.info(f"Initializing strategy: {self.name}")
 
-    @abstractmethod
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """Return a `Series` containing {-1, 0, 1} strategy signals."""
+        if self.supports_on_bar:
+            return self.replay_bars(data)
+        self._check_hooks()
+        raise NotImplementedError(f"{self.name} must implement generate_signals() or on_bar()")
+
+    def on_bar(self, bar: "BarData") -> Optional[int]:
+        """Optional incremental hook: consume one closed bar, return the current signal (None while warming up)."""
+        raise NotImplementedError
+
+    def on_tick(self, tick: "TickData") -> Optional[int]:
+        """Optional incremental hook: consume one tick, return the current signal (None while warming up)."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Clear incremental state before a fresh replay. Override if on_bar/on_tick keep state."""
         pass
 
+    @property
+    def supports_on_bar(self) -> bool:
+        """True if the subclass (or the instance) implements `on_bar`."""
+        return getattr(self.on_bar, "__func__", None) is not BaseStrategy.on_bar
+
+    @property
+    def supports_on_tick(self) -> bool:
+        """True if the subclass (or the instance) implements `on_tick`."""
+        return getattr(self.on_tick, "__func__", None) is not BaseStrategy.on_tick
+
+    def _check_hooks(self) -> None:
+        """Raise TypeError if none of generate_signals / on_bar / on_tick is implemented."""
+        if (getattr(self.generate_signals, "__func__", None) is BaseStrategy.generate_signals
+                and not (self.supports_on_bar or self.supports_on_tick)):
+            raise TypeError(f"{type(self).__name__} must implement generate_signals(), on_bar() or on_tick()")
+
+    def replay_bars(self, data: pd.DataFrame, symbol: str = "", reset: bool = True) -> pd.Series:
+        """Feed every row of `data` to `on_bar` (after reset() unless reset=False, e.g. the next chunk
+        of a stream); returns signals aligned to data.index."""
+        self._check_hooks()
+        if reset:
+            self.reset()
+        out = np.zeros(len(data), dtype=int)
+        for i, bar in enumerate(iter_bars(data, symbol)):
+            sig = self.on_bar(bar)
+            out[i] = int(sig) if sig is not None else 0
+        return pd.Series(out, index=data.index, dtype=int)
+
     def run(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Run the strategy and return the signals."""
         self.logger.info(f"Running strategy: {self.name}")
+        self._check_hooks()
         try:
             self.signals = self.generate_signals(data)
             return {"strategy_name": self.name, "signals": self.signals.astype(int)}
         except Exception as exc:
             raise RuntimeError(f"Strategy execution failed: {exc}") from exc
+
+
+def iter_bars(data: pd.DataFrame, symbol: str = "") -> Iterator["BarData"]:
+    """Yield one `BarData` per row of an OHLCV frame (missing O/H/L fall back to Close)."""
+    # Imported here: live imports strategy, so a module-level import would be circular
+    from ..live.models import BarData
+
+    n = len(data)
+    close = data["Close"].to_numpy(dtype=float)
+    open_ = data["Open"].to_numpy(dtype=float) if "Open" in data else close
+    high = data["High"].to_numpy(dtype=float) if "High" in data else close
+    low = data["Low"].to_numpy(dtype=float) if "Low" in data else close
+    volume = data["Volume"].to_numpy(dtype=float) if "Volume" in data else np.zeros(n)
+    for i, ts in enumerate(data.index):
+        yield BarData(symbol, ts, open_[i], high[i], low[i], close[i], volume[i])
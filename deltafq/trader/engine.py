@@ -106,6 +106,36 @@ class ExecutionEngine(BaseComponent):
         except Exception as e:
             raise RuntimeError(f"Failed to execute order: {str(e)}") from e
 
+    def get_state(self) -> Dict[str, Any]:
+        """Picklable copy of cash, trades, orders and positions (for LiveEngine snapshots)."""
+        return {
+            "cash": self.cash,
+            "trades": [dict(t) for t in self.trades],
+            "orders": {oid: dict(o) for oid, o in self.order_manager.orders.items()},
+            "order_counter": self.order_manager.order_counter,
+            "positions": {sym: dict(p) for sym, p in self.position_manager.positions.items()},
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore state produced by get_state() on a paper engine.
+        A broker-backed engine keeps its account as it is (the broker is the source of truth);
+        positions that differ from the snapshot are logged instead of overwritten.
+        """
+        if not self.is_paper_trading:
+            saved = {sym: p.get("quantity", 0) for sym, p in state.get("positions", {}).items()}
+            current = {sym: p.get("quantity", 0) for sym, p in self.position_manager.positions.items()}
+            for sym in sorted(set(saved) | set(current)):
+                if saved.get(sym, 0) != current.get(sym, 0):
+                    self.logger.warning(f"Snapshot position differs from broker account, kept broker: "
+                                        f"{sym} snapshot={saved.get(sym, 0)} current={current.get(sym, 0)}")
+            return
+        self.cash = state["cash"]
+        self.trades = [dict(t) for t in state.get("trades", [])]
+        self.order_manager.orders = {oid: dict(o) for oid, o in state.get("orders", {}).items()}
+        self.order_manager.order_counter = state.get("order_counter", 0)
+        self.position_manager.positions = {sym: dict(p) for sym, p in state.get("positions", {}).items()}
+
     def on_tick(self, tick: "TickData") -> None:
         """Match pending orders against tick (for EventEngine-driven simulation)."""
         if not self.is_paper_trading:
@@ -0,0 +1,101 @@
+"""run_backtest_chunked parity with run_backtest and bounded values retention."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.backtest.engine import BacktestEngine
+from deltafq.core.config import Config
+from deltafq.indicators.streaming import StreamingSMA
+from deltafq.strategy.base import BaseStrategy
+
+
+class MovingAverageCross(BaseStrategy):
+    def __init__(self, fast=5, slow=50, **kwargs):
+        super().__init__(**kwargs)
+        self.fast, self.slow = fast, slow
+
+    def generate_signals(self, data):
+        f = data["Close"].rolling(self.fast).mean()
+        s = data["Close"].rolling(self.slow).mean()
+        return pd.Series(np.where(f > s, 1, np.where(f < s, -1, 0)), index=data.index)
+
+
+class IncrementalCross(BaseStrategy):
+    def reset(self):
+        self.f, self.s = StreamingSMA(5), StreamingSMA(50)
+
+    def on_bar(self, bar):
+        a, b = self.f.update(bar.close), self.s.update(bar.close)
+        if a is None or b is None or np.isnan(a) or np.isnan(b):
+            return 0
+        return 1 if a > b else (-1 if a < b else 0)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(1)
+    index = pd.date_range("2020-01-01", periods=3000, freq="min", name="Datetime")
+    close = 100 + rng.standard_normal(3000).cumsum() * 0.2
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1.0},
+                        index=index)
+
+
+@pytest.fixture(autouse=True)
+def _storage_in_tmp(tmp_path, monkeypatch):
+    # BacktestEngine builds DataStorage() under Config.get_cache_dir() (project root / data_cache)
+    monkeypatch.setattr(Config, "get_cache_dir", lambda self: tmp_path / "data_cache")
+
+
+def _full_run(data, strategy):
+    engine = BacktestEngine()
+    engine.symbol, engine.data = "X", data
+    engine.add_strategy(strategy)
+    return engine.run_backtest()
+
+
+def _chunks(data, size):
+    return (data.iloc[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("make", [IncrementalCross, MovingAverageCross])
+def test_matches_full_run_with_short_chunks(prices, make):
+    trades, values = _full_run(prices, make())
+    engine = BacktestEngine()
+    engine.symbol = "X"
+    # Chunks shorter than the 50-bar window: context is carried across several chunks
+    trades_c, values_c = engine.run_backtest_chunked(strategy=make(), chunks=_chunks(prices, 17), lookback=50)
+    pd.testing.assert_frame_equal(values_c, values)
+    assert len(trades_c) == len(trades)
+
+
+def test_short_lookback_changes_signals(prices):
+    _, values = _full_run(prices, MovingAverageCross())
+    engine = BacktestEngine()
+    engine.symbol = "X"
+    _, values_c = engine.run_backtest_chunked(strategy=MovingAverageCross(), chunks=_chunks(prices, 17), lookback=10)
+    assert not values_c["signal"].equals(values["signal"])
+
+
+def test_values_are_bounded_and_streamed(prices):
+    _, values = _full_run(prices, IncrementalCross())
+    engine = BacktestEngine()
+    engine.symbol = "X"
+    parts = []
+    _, tail = engine.run_backtest_chunked(strategy=IncrementalCross(), chunks=_chunks(prices, 100),
+                                          values_sink=parts.append, max_value_records=250)
+    assert len(tail) == 250
+    pd.testing.assert_frame_equal(tail, values.iloc[-250:].reset_index(drop=True))
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), values)
+    total = values["total_value"]
+    assert engine.run_metrics["points"] == len(values)
+    assert engine.run_metrics["total_return"] == pytest.approx(total.iloc[-1] / total.iloc[0] - 1)
+    drawdown = (total / total.cummax() - 1).min()
+    assert engine.run_metrics["max_drawdown"] == pytest.approx(drawdown)
+
+
+def test_negative_lookback_rejected(prices):
+    engine = BacktestEngine()
+    engine.symbol = "X"
+    with pytest.raises(ValueError):
+        engine.run_backtest_chunked(strategy=MovingAverageCross(), chunks=_chunks(prices, 100), lookback=-1)
@@ -0,0 +1,130 @@
+"""StorageCatalog staleness detection and DataStorage size totals."""
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from deltafq.data import DataStorage
+from deltafq.data.catalog import StorageCatalog
+
+
+def _bars(n=30):
+    index = pd.date_range("2024-01-01", periods=n, freq="D", name="Date")
+    close = np.linspace(100, 110, n)
+    return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close,
+                         "Volume": np.full(n, 1000.0)}, index=index)
+
+
+def _age(root, seconds=5):
+    """Backdate every directory so later changes are clearly newer than the catalog."""
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def test_default_storage_is_not_tracked_by_git():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(root, ".gitignore"), encoding="utf-8") as fh:
+        assert "data_cache/" in fh.read().split()
+
+
+def test_unchanged_tree_is_not_rebuilt(tmp_path, monkeypatch):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    storage.save_price_data(_bars(), "AAA", "2024-01-01", "2024-01-31")
+    storage.catalog.close()
+
+    calls = []
+    monkeypatch.setattr(StorageCatalog, "rebuild", lambda self: calls.append(1) or 0)
+    DataStorage(base_path=str(tmp_path), file_format="csv")
+    assert calls == []
+
+
+def test_files_added_by_hand_trigger_rebuild(tmp_path):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    path = storage.save_price_data(_bars(), "AAA", "2024-01-01", "2024-01-31")
+    storage.catalog.close()
+    _age(tmp_path)
+
+    copy_dir = tmp_path / "price" / "BBB"
+    copy_dir.mkdir()
+    shutil.copy(path, copy_dir / "BBB_2024-01-01_2024-01-31.csv")
+
+    reopened = DataStorage(base_path=str(tmp_path), file_format="csv")
+    assert "BBB" in set(reopened.query_catalog(kind="price")["symbol"])
+    assert reopened.load_price_data("BBB") is not None
+
+
+def test_files_deleted_by_hand_need_explicit_rebuild(tmp_path):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    path = storage.save_price_data(_bars(), "AAA", "2024-01-01", "2024-01-31")
+    storage.save_price_data(_bars(), "BBB", "2024-01-01", "2024-01-31")
+    storage.catalog.close()
+    _age(tmp_path)
+
+    path.unlink()  # inside price/AAA: not visible to the top-level check
+    reopened = DataStorage(base_path=str(tmp_path), file_format="csv")
+    assert reopened.rebuild_catalog() == 1
+    assert set(reopened.query_catalog(kind="price")["symbol"]) == {"BBB"}
+
+
+def test_open_does_not_walk_the_tree(tmp_path, monkeypatch):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    for i in range(5):
+        storage.save_price_data(_bars(), f"S{i}", "2024-01-01", "2024-01-31")
+    storage.catalog.close()
+
+    def _no_walk(*args, **kwargs):
+        raise AssertionError("tree walked on open")
+
+    monkeypatch.setattr("deltafq.data.catalog.os.walk", _no_walk)
+    monkeypatch.setattr(Path, "rglob", _no_walk)
+    DataStorage(base_path=str(tmp_path), file_format="csv")
+
+
+def test_invalidate_does_not_force_rebuild(tmp_path, monkeypatch):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    storage.save_price_data(_bars(), "AAA", "2024-01-01", "2024-01-31")
+    storage.save_price_cache(_bars(), "AAA", "1d")
+    _age(tmp_path)
+    storage.delete_price_cache("AAA", "1d")
+    assert not storage.price_cache_path("AAA", "1d").exists()
+    synced = storage.catalog._conn.execute("SELECT value FROM catalog_state").fetchone()[0]
+    assert storage.price_cache_dir("AAA").stat().st_mtime <= synced  # removed dir is older than the stamp
+    storage.catalog.close()
+
+    calls = []
+    monkeypatch.setattr(StorageCatalog, "rebuild", lambda self: calls.append(1) or 0)
+    DataStorage(base_path=str(tmp_path), file_format="csv")
+    assert calls == []
+
+
+def test_empty_catalog_over_existing_files_is_rebuilt(tmp_path):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv", catalog=False)
+    storage.save_price_data(_bars(), "AAA", "2024-01-01", "2024-01-31")
+    empty = tmp_path.parent / f"{tmp_path.name}_empty"
+    empty.mkdir()
+    StorageCatalog(empty).close()  # schema only, no rows
+    (empty / StorageCatalog.FILENAME).replace(tmp_path / StorageCatalog.FILENAME)
+    _age(tmp_path)
+
+    reopened = DataStorage(base_path=str(tmp_path), file_format="csv")
+    assert len(reopened.query_catalog(kind="price")) == 1
+
+
+def test_total_size_includes_cache_sidecars(tmp_path):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    storage.save_price_cache(_bars(), "AAA", "1d")
+    sidecar = storage.price_cache_dir("AAA") / "AAA_1d.json"
+    sidecar.write_text("x" * 3 * 1024 * 1024, encoding="utf-8")
+
+    uncatalogued = DataStorage(base_path=str(tmp_path), file_format="csv", catalog=False)
+    info = storage.get_storage_info()
+    assert info["total_size_mb"] >= 3.0
+    files = [p for p in tmp_path.rglob("*") if p.is_file() and "sqlite3" not in p.name]
+    expected = round(sum(p.stat().st_size for p in files) / (1024 * 1024), 2)
+    assert info["total_size_mb"] == expected
+    assert uncatalogued.get_storage_info()["total_size_mb"] >= expected
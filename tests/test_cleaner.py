@@ -0,0 +1,112 @@
+"""DataCleaner.clean data-quality pipeline tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.data import DataCleaner
+
+
+def _panel(n_sym=50, n=300, seed=0):
+    """Date-major long panel (rows ordered by date, then symbol), like a stacked download."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-01-01", periods=n)
+    frames = []
+    for s in range(n_sym):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        frames.append(pd.DataFrame({"symbol": f"S{s:02d}", "Open": close, "High": close * 1.01,
+                                    "Low": close * 0.99, "Close": close,
+                                    "Volume": rng.integers(1, 10_000, n).astype(float)}, index=dates))
+    panel = pd.concat(frames)
+    return panel.iloc[np.lexsort((panel["symbol"].to_numpy(), panel.index.values))]
+
+
+def _set(panel, symbol, i, column, value):
+    rows = np.flatnonzero(panel["symbol"].to_numpy() == symbol)
+    panel.iloc[rows[i], panel.columns.get_loc(column)] = value
+    return panel.index[rows[i]]
+
+
+@pytest.fixture
+def cleaner():
+    return DataCleaner()
+
+
+def test_spikes_found_with_and_without_other_checks(cleaner):
+    panel = _panel()
+    row = np.flatnonzero(panel["symbol"].to_numpy() == "S07")[100]
+    panel.iloc[row, panel.columns.get_loc("Close")] *= 1.6
+    for checks in (None, ["spikes"]):
+        out, report = cleaner.clean(panel, checks=checks)
+        assert report.loc["spikes", "removed"] == 1
+        assert len(out) == len(panel) - 1
+
+
+def test_stale_only_on_date_major_panel(cleaner):
+    panel = _panel()
+    price = panel.loc[panel["symbol"] == "S03", "Close"].iloc[50]
+    for i in range(50, 57):
+        _set(panel, "S03", i, "Close", price)
+    _, report = cleaner.clean(panel, checks=["stale"], stale_bars=5)
+    assert report.loc["stale", "flagged"] == 6
+    assert report.loc["stale", "symbols"] == 1
+
+
+def test_duplicates_and_order(cleaner):
+    panel = _panel(n_sym=3, n=20)
+    dup = panel.iloc[[5]].assign(Close=1.0)
+    data = pd.concat([panel.iloc[::-1], dup])
+    out, report = cleaner.clean(data, checks=["monotonic", "duplicates"])
+    assert report.loc["duplicates", "removed"] == 1
+    assert report.loc["monotonic", "modified"] > 0
+    sym = out["symbol"].to_numpy()
+    assert (sym[1:] != sym[:-1]).sum() == 2  # rows grouped by symbol
+    for _, group in out.groupby("symbol"):
+        assert group.index.is_monotonic_increasing and group.index.is_unique
+    assert (out.loc[dup.index[0]].set_index("symbol").loc[dup["symbol"].iloc[0], "Close"]) == 1.0
+
+
+def test_ohlc_fix_and_zero_volume(cleaner):
+    panel = _panel(n_sym=2, n=30)
+    when = _set(panel, "S01", 10, "High", 1.0)
+    _set(panel, "S00", 3, "Volume", 0.0)
+    out, report = cleaner.clean(panel, checks=["ohlc", "zero_volume"], add_flags=True)
+    assert report.loc["ohlc", "modified"] == 1 and report.loc["zero_volume", "flagged"] == 1
+    fixed = out[(out.index == when) & (out["symbol"] == "S01")].iloc[0]
+    assert fixed["High"] == max(fixed["Open"], fixed["Close"], fixed["Low"])
+    assert (out["dq_flags"] != 0).sum() == 2
+
+
+def test_split_adjustment_is_idempotent(cleaner):
+    panel = _panel(n_sym=2, n=40)
+    panel["Stock Splits"] = 0.0
+    panel["Dividends"] = 0.0
+    rows = np.flatnonzero(panel["symbol"].to_numpy() == "S01")
+    original = panel.iloc[rows, panel.columns.get_loc("Close")].to_numpy().copy()
+    for col in ("Open", "High", "Low", "Close"):
+        panel.iloc[rows[20:], panel.columns.get_loc(col)] /= 2
+    panel.iloc[rows[20], panel.columns.get_loc("Stock Splits")] = 2.0
+
+    once, report = cleaner.clean(panel, checks=["adjust"])
+    assert report.loc["adjust", "modified"] == 20
+    s01 = once[once["symbol"] == "S01"]
+    np.testing.assert_allclose(s01["Close"].to_numpy(), original / 2)
+    assert (s01["Stock Splits"] == 0).all()
+    twice, report = cleaner.clean(once, checks=["adjust"])
+    assert report.loc["adjust", "modified"] == 0
+    pd.testing.assert_frame_equal(twice, once)
+
+
+def test_multiindex_panel(cleaner):
+    panel = _panel(n_sym=4, n=50)
+    _set(panel, "S02", 7, "Open", np.nan)
+    data = panel.set_index("symbol", append=True).swaplevel()
+    out, report = cleaner.clean(data, by_symbol=True)
+    assert report.loc[("missing", "S02"), "removed"] == 1
+    assert len(out) == len(data) - 1
+
+
+def test_fillna(cleaner):
+    data = pd.DataFrame({"a": [1.0, None, 3.0, None]})
+    assert cleaner.fillna(data)["a"].tolist() == [1.0, 1.0, 3.0, 3.0]
+    assert cleaner.fillna(data, "backward")["a"].tolist()[:3] == [1.0, 3.0, 3.0]
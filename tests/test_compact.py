@@ -0,0 +1,53 @@
+"""compact_frame precision / memory tests and compact-aware request keys."""
+
+import numpy as np
+import pandas as pd
+
+from deltafq.data import DataFetcher
+from deltafq.data.compact import compact_frame, max_relative_error, memory_bytes
+
+
+def _ohlcv(n=50_000, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    index = pd.date_range("2020-01-01", periods=n, freq="min", name="Datetime")
+    return pd.DataFrame({"Open": close * (1 + rng.normal(0, 1e-3, n)), "High": close * 1.002,
+                         "Low": close * 0.998, "Close": close,
+                         "Volume": rng.integers(0, 1_000_000, n).astype(float),
+                         "symbol": np.where(rng.random(n) < 0.5, "AAA", "BBB")}, index=index)
+
+
+def test_round_trip_within_rtol():
+    data = _ohlcv()
+    for rtol in (1e-6, 1e-7):
+        compact = compact_frame(data, rtol=rtol)
+        errors = max_relative_error(data, compact)
+        assert all(err <= rtol for err in errors.values()), errors
+        assert errors["Volume"] == 0.0
+
+
+def test_too_strict_rtol_keeps_float64():
+    data = _ohlcv(1000)
+    compact = compact_frame(data, rtol=1e-12)
+    assert all(compact[c].dtype == np.float64 for c in ("Open", "High", "Low", "Close"))
+    assert max(max_relative_error(data, compact).values()) == 0.0
+
+
+def test_dtypes_and_memory_reduction():
+    data = _ohlcv()
+    compact = compact_frame(data)
+    assert compact["Close"].dtype == np.float32
+    assert compact["Volume"].dtype == np.uint32
+    assert isinstance(compact["symbol"].dtype, pd.CategoricalDtype)
+    assert memory_bytes(compact) <= 0.5 * memory_bytes(data)
+    pd.testing.assert_index_equal(compact.index, data.index)
+
+
+def test_compact_and_full_fetchers_do_not_share_memo(tmp_path):
+    _ohlcv(500)[["Open", "High", "Low", "Close", "Volume"]].to_csv(tmp_path / "AAA.csv")
+    args = ("AAA", "2020-01-01", "2020-01-02")
+    compact = DataFetcher(source="local", data_dir=tmp_path, memo=True, compact=True)
+    full = DataFetcher(source="local", data_dir=tmp_path, memo=True)
+    assert compact.fetch_data(*args, interval="1m")["Close"].dtype == np.float32
+    assert full.fetch_data(*args, interval="1m")["Close"].dtype == np.float64
+    assert compact.fetch_data(*args, interval="1m")["Close"].dtype == np.float32
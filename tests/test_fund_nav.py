@@ -0,0 +1,87 @@
+"""Incremental fund NAV fetching against a stored history (no network: pages are served locally)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from deltafq.data import DataFetcher, DataStorage
+
+PER_PAGE = 20
+
+
+def _nav(days):
+    """NAV table newest first, like the East Money API."""
+    dates = pd.bdate_range("2023-01-02", periods=days)[::-1]
+    nav = 1 + np.arange(days)[::-1] / 1000
+    return pd.DataFrame({"净值日期": dates.strftime("%Y-%m-%d"), "单位净值": nav, "累计净值": nav + 0.5})
+
+
+class FakeFundApi:
+    def __init__(self, table):
+        self.table = table
+        self.pages = []
+
+    def __call__(self, code, page, timeout, retries, backoff):
+        self.pages.append(page)
+        total = max(1, -(-len(self.table) // PER_PAGE))
+        rows = self.table.iloc[(page - 1) * PER_PAGE:page * PER_PAGE].reset_index(drop=True)
+        return rows, total
+
+
+def test_since_is_derived_from_stored_history(tmp_path, monkeypatch):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    api = FakeFundApi(_nav(100))
+    monkeypatch.setattr(DataFetcher, "_fetch_fund_page", lambda fetcher, *args: api(*args))
+
+    first = DataFetcher(cache=storage).fetch_fund_data("000001")
+    assert len(first) == 100 and sorted(api.pages) == [1, 2, 3, 4, 5]
+    assert storage.load_fund_nav("000001") is not None
+
+    api.table, api.pages = _nav(103), []
+    second = DataFetcher(cache=storage).fetch_fund_data("000001", max_workers=1)
+    assert api.pages == [1]  # the three new rows are all on the first page
+    pd.testing.assert_frame_equal(second, _nav(103), check_dtype=False)
+    pd.testing.assert_frame_equal(storage.load_fund_nav("000001"), _nav(103), check_dtype=False)
+
+
+def test_unchanged_history_downloads_one_page(tmp_path, monkeypatch):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    api = FakeFundApi(_nav(50))
+    monkeypatch.setattr(DataFetcher, "_fetch_fund_page", lambda fetcher, *args: api(*args))
+    fetcher = DataFetcher(cache=storage)
+    fetcher.fetch_fund_data("000001")
+
+    api.pages = []
+    again = fetcher.fetch_fund_data("000001")
+    assert api.pages == [1]
+    pd.testing.assert_frame_equal(again, _nav(50), check_dtype=False)
+
+
+def test_explicit_since_and_no_cache_are_unchanged(tmp_path, monkeypatch):
+    api = FakeFundApi(_nav(60))
+    monkeypatch.setattr(DataFetcher, "_fetch_fund_page", lambda fetcher, *args: api(*args))
+    since = _nav(60)["净值日期"].iloc[5]
+    newer = DataFetcher().fetch_fund_data("000001", since=since)
+    assert len(newer) == 5
+    assert len(DataFetcher().fetch_fund_data("000001")) == 60
+    assert not (tmp_path / "fund").exists()
+
+
+def test_page_retries_use_jittered_backoff(monkeypatch):
+    class FlakySession:
+        calls = 0
+
+        def get(self, url, params, timeout):
+            FlakySession.calls += 1
+            raise requests.ConnectionError("reset by peer")
+
+    sleeps = []
+    monkeypatch.setattr("deltafq.data.fetcher.time.sleep", sleeps.append)
+    monkeypatch.setattr("deltafq.data.fetcher.random.random", lambda: 0.5)
+    fetcher = DataFetcher()
+    monkeypatch.setattr(fetcher, "_http_session", lambda *a: FlakySession())
+    with pytest.raises(requests.ConnectionError):
+        fetcher._fetch_fund_page("000001", 1, timeout=1, retries=2, backoff=0.5)
+    assert FlakySession.calls == 3
+    assert sleeps == [0.5 * 1.125, 1.0 * 1.125]
@@ -0,0 +1,179 @@
+"""LiveEngine replay tests (offline: ReplayDataGateway + paper trading)."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.live import LiveEngine
+from deltafq.strategy.base import BaseStrategy
+
+
+class SlowMomentum(BaseStrategy):
+    """generate_signals strategy slow enough for conflation to drop ticks."""
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.Series:
+        time.sleep(0.002)
+        return np.sign(data["Close"].diff().fillna(0)).astype(int)
+
+
+def _write_prices(path, n=300):
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2024-01-02 09:30", periods=n, freq="s")
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    pd.DataFrame({"Close": close, "Volume": rng.integers(1, 1000, n)}, index=index).to_csv(path)
+    return close
+
+
+def _replay(path, strategy, conflate, lookback=20):
+    engine = LiveEngine(symbol="TEST", signal_interval="tick", lookback_bars=lookback,
+                        conflate_ticks=conflate, track_latency=False)
+    engine.set_data_gateway("replay", path=str(path))
+    engine.set_trade_gateway("paper", initial_capital=100_000)
+    engine.add_strategy(strategy)
+    engine.run_live()
+    assert engine._data_gw.wait(10)
+    if conflate:
+        deadline = time.time() + 10
+        while engine.get_conflation_stats()["pending"] and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+    engine.stop()
+    return engine
+
+
+def test_conflation_keeps_full_tick_history(tmp_path):
+    path = tmp_path / "TEST_ticks.csv"
+    close = _write_prices(path)
+    plain = _replay(path, SlowMomentum(), conflate=False)
+    conflated = _replay(path, SlowMomentum(), conflate=True)
+
+    assert conflated.get_conflation_stats()["conflated"] > 0
+    ts_a, px_a, vol_a = plain._states["TEST"].buffer.window()
+    ts_b, px_b, vol_b = conflated._states["TEST"].buffer.window()
+    np.testing.assert_array_equal(ts_a, ts_b)
+    np.testing.assert_array_equal(px_a, px_b)
+    np.testing.assert_array_equal(vol_a, vol_b)
+    np.testing.assert_allclose(px_b, close[-len(px_b):])
+    # The last evaluated window is the same contiguous tail of the stream
+    bars = conflated._states["TEST"].cached_bars
+    assert len(bars) == 20
+    np.testing.assert_allclose(bars["Close"].to_numpy(), close[-20:])
+
+
+class FlakyBars(BaseStrategy):
+    """on_bar strategy that fails once on a given bar."""
+
+    def __init__(self, fail_at):
+        super().__init__()
+        self.fail_at = fail_at
+        self.seen = []
+
+    def on_bar(self, bar):
+        if bar.timestamp == self.fail_at:
+            self.fail_at = None
+            raise ValueError("transient failure")
+        self.seen.append(bar.timestamp)
+        return 1
+
+
+def test_failed_bar_is_retried_on_next_fetch():
+    index = pd.date_range("2024-01-02 09:30", periods=10, freq="min")
+    bars = pd.DataFrame({"Close": np.arange(10.0) + 100}, index=index)
+    strategy = FlakyBars(fail_at=index[5])
+    engine = LiveEngine(symbol="TEST", signal_interval="1m", track_latency=False)
+    engine.add_strategy(strategy)
+    engine._ensure_states()
+    st = engine._states["TEST"]
+
+    assert engine._feed_bars(st, bars) is None
+    assert st.last_bar_time == index[4]
+    assert engine._feed_bars(st, bars) == 1
+    # Every closed bar reaches the strategy exactly once, in order; the last row is still forming
+    assert strategy.seen == list(index[:-1])
+    assert st.last_bar_time == index[-2]
+
+
+def test_strategy_without_signal_method_fails_at_first_run():
+    class Empty(BaseStrategy):
+        pass
+
+    class LateHook(BaseStrategy):
+        def __init__(self):
+            super().__init__()
+            self.on_bar = lambda bar: 1
+
+    empty = Empty()  # construction is allowed
+    with pytest.raises(TypeError, match="generate_signals"):
+        empty.run(pd.DataFrame({"Close": [1.0, 2.0]}))
+    late = LateHook()
+    assert late.supports_on_bar
+    assert late.run(pd.DataFrame({"Close": [1.0, 2.0]}))["signals"].tolist() == [1, 1]
+
+
+class TickSign(BaseStrategy):
+    """on_tick strategy: sign of the last price change."""
+
+    def __init__(self):
+        super().__init__()
+        self.prev = None
+
+    def on_tick(self, tick):
+        prev, self.prev = self.prev, tick.price
+        if prev is None:
+            return None
+        return int(np.sign(tick.price - prev))
+
+
+def test_chart_data_for_on_tick_strategy(tmp_path):
+    path = tmp_path / "TEST_ticks.csv"
+    close = _write_prices(path)
+    engine = _replay(path, TickSign(), conflate=False)
+
+    chart = engine.get_chart_data()
+    assert len(chart["candles"]) == 20
+    np.testing.assert_allclose([c["close"] for c in chart["candles"]], close[-20:])
+    expected = np.sign(np.diff(close))[-20:].astype(int).tolist()
+    assert chart["signals"] == expected
+    assert chart["cursor"] == chart["candles"][-1]["date"]
+
+
+def test_snapshot_restore_round_trip(tmp_path):
+    path = tmp_path / "TEST_ticks.csv"
+    _write_prices(path)
+    engine = _replay(path, TickSign(), conflate=False)
+    snap = engine.snapshot(tmp_path / "engine.snap")
+
+    restored = LiveEngine(symbol="TEST", signal_interval="tick", lookback_bars=20, track_latency=False)
+    restored.set_data_gateway("replay", path=str(path))
+    restored.set_trade_gateway("paper", initial_capital=100_000)
+    restored.add_strategy(TickSign())
+    restored.restore(snap)
+
+    a, b = engine._states["TEST"], restored._states["TEST"]
+    for x, y in zip(a.buffer.window(), b.buffer.window()):
+        np.testing.assert_array_equal(x, y)
+    assert (b.last_signal, b.last_price, b.strategy.prev) == (a.last_signal, a.last_price, a.strategy.prev)
+    assert list(b.bar_signals) == list(a.bar_signals)
+    assert restored._trade_gw._engine.get_state() == engine._trade_gw._engine.get_state()
+    pd.testing.assert_frame_equal(restored.get_values_df(), engine.get_values_df())
+    assert restored.get_chart_data() == engine.get_chart_data()
+
+
+def test_broker_engine_keeps_its_account_on_restore():
+    from deltafq.trader.engine import ExecutionEngine
+
+    paper = ExecutionEngine(initial_capital=1000)
+    paper.position_manager.add_position("AAA", 5, 10.0)
+    state = paper.get_state()
+
+    live = ExecutionEngine(broker=object())
+    live.position_manager.add_position("AAA", 2, 11.0)
+    before = live.get_state()
+    live.set_state(state)
+    assert live.get_state() == before
+
+    fresh = ExecutionEngine(initial_capital=50)
+    fresh.set_state(state)
+    assert fresh.get_state() == state
@@ -0,0 +1,46 @@
+"""LocalDataSource file-to-symbol matching."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from deltafq.data import DataStorage
+from deltafq.data.local_source import LocalDataSource
+
+
+def _bars(start, n, price):
+    index = pd.date_range(start, periods=n, freq="D", name="Date")
+    return pd.DataFrame({"Open": price, "High": price, "Low": price, "Close": np.full(n, float(price)),
+                         "Volume": np.full(n, 10.0)}, index=index)
+
+
+def test_symbol_matches_exact_stems_only(tmp_path):
+    price = tmp_path / "price"
+    (price / "AAPL").mkdir(parents=True)
+    (price / "AAPL_X").mkdir()
+    _bars("2024-01-01", 10, 1).to_csv(price / "AAPL" / "AAPL.csv")
+    _bars("2024-01-11", 10, 2).to_csv(price / "AAPL" / "AAPL_1d.csv")
+    _bars("2024-01-21", 10, 3).to_csv(price / "AAPL" / "AAPL_2024-01-21_2024-01-31.csv")
+    _bars("2024-01-31", 10, 4).to_csv(price / "AAPL" / "AAPL_20240210.csv")
+    _bars("2024-01-01", 40, 99).to_csv(price / "AAPL_X" / "AAPL_X.csv")
+    _bars("2024-01-01", 40, 98).to_csv(price / "AAPL_X" / "AAPL_X_1d.csv")
+
+    source = LocalDataSource(price)
+    assert sorted(Path(e["path"]).name for e in source.available("AAPL")) == \
+        sorted(p.name for p in (price / "AAPL").glob("*.csv"))
+    data = source.fetch("AAPL", "2024-01-01", "2024-02-10")
+    assert set(data["Close"]) == {1.0, 2.0, 3.0, 4.0}
+    assert len(source.available("AAPL_X")) == 2
+    assert set(source.fetch("AAPL_X", "2024-01-01", "2024-02-10")["Close"]) <= {98.0, 99.0}
+
+
+def test_price_cache_history_is_found(tmp_path):
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    storage.save_price_cache(_bars("2023-12-20", 30, 5), "MSFT", "1d")
+    storage.save_price_cache(_bars("2023-12-20", 30, 6), "MSFT_B", "1d")
+
+    source = LocalDataSource(storage.price_dir)
+    data = source.fetch("MSFT", "2023-12-20", "2024-01-19")
+    assert len(data) == 30
+    assert set(data["Close"]) == {5.0}
@@ -0,0 +1,69 @@
+"""MmapPriceStore append, reopen and window reads (zero-copy views over the mapped files)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.data import MmapPriceStore
+
+
+def _bars(start, n, tz="America/New_York", base=100.0):
+    index = pd.date_range(start, periods=n, freq="1min", tz=tz, name="Date").as_unit("ns")
+    close = base + np.arange(n, dtype=float)
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": np.full(n, 10.0)}, index=index)
+
+
+def test_append_reopen_window_read(tmp_path):
+    aaa, bbb = _bars("2024-01-02 09:30", 120), _bars("2024-01-02 09:30", 60, base=200.0)
+    store = MmapPriceStore(tmp_path)
+    store.append("AAA", aaa)
+    store.append("BBB", bbb)
+
+    reopened = MmapPriceStore(tmp_path)
+    assert reopened.symbols == ["AAA", "BBB"]
+    assert reopened.info("BBB")["offset"] == 120
+    window = reopened.frame("AAA", "2024-01-02 10:00", "2024-01-02 10:15")  # naive bounds in New York time
+    pd.testing.assert_frame_equal(window, aaa.loc["2024-01-02 10:00":"2024-01-02 10:14"], check_freq=False)
+    pd.testing.assert_frame_equal(reopened.frame("BBB"), bbb, check_freq=False)
+
+    close = reopened.get("AAA", "2024-01-02 10:00", "2024-01-02 10:15", fields=["close"])["close"]
+    assert isinstance(close, np.memmap)
+    assert not close.flags.writeable
+
+
+def test_reappend_repoints_symbol(tmp_path):
+    store = MmapPriceStore(tmp_path)
+    store.append("AAA", _bars("2024-01-02 09:30", 30))
+    store.append("BBB", _bars("2024-01-02 09:30", 30, base=200.0))
+    store.append("AAA", _bars("2024-01-03 09:30", 10, base=500.0))
+
+    reopened = MmapPriceStore(tmp_path)
+    assert reopened.info("AAA")["offset"] == 60 and reopened.info("AAA")["length"] == 10
+    assert reopened.frame("AAA")["Close"].tolist() == [500.0 + i for i in range(10)]
+    assert reopened.frame("BBB")["Close"].iloc[0] == 200.0
+
+
+def test_reader_sees_appends_after_refresh(tmp_path):
+    writer = MmapPriceStore(tmp_path)
+    writer.append("AAA", _bars("2024-01-02 09:30", 30))
+    reader = MmapPriceStore(tmp_path)
+    view = reader.get("AAA")["close"]
+
+    writer.append("BBB", _bars("2024-01-02 09:30", 30))
+    assert "BBB" not in reader
+    reader.refresh()
+    assert len(reader.frame("BBB")) == 30
+    assert view[0] == 100.0  # views taken before the append stay valid
+    with pytest.raises(KeyError):
+        reader.get("CCC")
+
+
+def test_write_replaces_contents(tmp_path):
+    store = MmapPriceStore(tmp_path)
+    store.append("OLD", _bars("2024-01-02 09:30", 30))
+    store.write({"AAA": _bars("2024-01-02 09:30", 5, tz=None)})
+    reopened = MmapPriceStore(tmp_path)
+    assert reopened.symbols == ["AAA"]
+    assert reopened.frame("AAA").index.tz is None
+    assert len(reopened.frame("AAA", "2024-01-02 09:31", "2024-01-02 09:33")) == 2
@@ -0,0 +1,154 @@
+"""PriceCache gap filling, retry and storage layout tests (no network: fake downloaders)."""
+
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.data import DataFetcher, DataStorage, PriceCache
+
+
+def _bars(start, end, tz="America/New_York"):
+    days = pd.bdate_range(start, end, inclusive="left")
+    index = (days + pd.Timedelta(hours=9, minutes=30)).tz_localize(tz)
+    close = 100 + np.arange(len(days), dtype=float)
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": np.full(len(days), 1000.0)}, index=pd.DatetimeIndex(index, name="Date"))
+
+
+class Downloader:
+    def __init__(self, empty=False, error=None):
+        self.calls = []
+        self.empty = empty
+        self.error = error
+
+    def __call__(self, symbol, start, end, interval):
+        self.calls.append((start, end))
+        if self.error is not None:
+            raise self.error
+        return pd.DataFrame() if self.empty else _bars(start, end)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PriceCache(DataStorage(base_path=str(tmp_path), file_format="csv"))
+
+
+def test_downloads_only_gaps(cache):
+    dl = Downloader()
+    first = cache.get("AAA", "2021-03-01", "2021-04-01", "1d", dl)
+    assert len(first) == len(pd.bdate_range("2021-03-01", "2021-03-31"))
+    cache.get("AAA", "2021-03-10", "2021-03-20", "1d", dl)
+    assert len(dl.calls) == 1
+    extended = cache.get("AAA", "2021-02-01", "2021-05-01", "1d", dl)
+    assert dl.calls[1:] == [("2021-02-01", "2021-03-01"), ("2021-04-01", "2021-05-01")]
+    assert extended.index.is_monotonic_increasing and not extended.index.duplicated().any()
+    assert str(extended.index.tz) == "America/New_York"
+    assert cache.covered_ranges("AAA", "1d") == [("2021-02-01", "2021-05-01")]
+
+
+def test_empty_closed_range_is_cached(cache):
+    dl = Downloader(empty=True)
+    assert cache.get("AAA", "2021-03-01", "2021-03-08", "1d", dl).empty  # weekdays, e.g. a halt
+    cache.get("AAA", "2021-03-01", "2021-03-08", "1d", dl)
+    assert len(dl.calls) == 1
+    assert cache.covered_ranges("AAA", "1d") == [("2021-03-01", "2021-03-08")]
+
+
+def test_empty_range_reaching_today_is_retried(cache):
+    dl = Downloader(empty=True)
+    today = pd.Timestamp.today().normalize()
+    start = (today - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    end = (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    cache.get("AAA", start, end, "1d", dl)
+    cache.get("AAA", start, end, "1d", dl)
+    assert len(dl.calls) == 2
+    assert all(pd.Timestamp(e) <= today for _, e in cache.covered_ranges("AAA", "1d"))
+
+
+def test_empty_weekend_is_cached(cache):
+    dl = Downloader(empty=True)
+    cache.get("AAA", "2021-03-06", "2021-03-08", "1d", dl)  # Saturday + Sunday
+    cache.get("AAA", "2021-03-06", "2021-03-08", "1d", dl)
+    assert len(dl.calls) == 1
+    assert cache.covered_ranges("AAA", "1d") == [("2021-03-06", "2021-03-08")]
+
+
+def test_download_error_propagates_without_meta(cache):
+    with pytest.raises(ConnectionError):
+        cache.get("AAA", "2021-03-01", "2021-04-01", "1d", Downloader(error=ConnectionError("rate limited")))
+    assert cache.covered_ranges("AAA", "1d") == []
+    assert len(cache.get("AAA", "2021-03-01", "2021-04-01", "1d", Downloader())) > 0
+
+
+def test_logged_yahoo_failure_is_not_cached(cache, monkeypatch):
+    def failing(symbol, **kwargs):
+        logging.getLogger("yfinance").error("['AAA']: YFRateLimitError('Too Many Requests')")
+        return pd.DataFrame()
+
+    monkeypatch.setattr("deltafq.data.fetcher.yf.download", failing)
+    with pytest.raises(RuntimeError, match="Too Many Requests"):
+        DataFetcher(cache=cache).fetch_data("AAA", "2021-03-01", "2021-03-08")
+    assert cache.covered_ranges("AAA", "1d") == []
+
+
+def test_extension_rewrites_only_touched_years(cache):
+    storage = cache.storage
+    cache.get("AAA", "2019-01-01", "2021-01-06", "1d", Downloader())
+    part_dir = storage.price_cache_path("AAA", "1d")
+    before = {p.name: p.stat().st_mtime_ns for p in part_dir.iterdir()}
+    assert sorted(before) == ["2019.csv", "2020.csv", "2021.csv"]
+
+    read = []
+    original = storage._read
+    storage._read = lambda path, *a, **k: read.append(path.name) or original(path, *a, **k)
+    cache.get("AAA", "2021-01-06", "2021-02-01", "1d", Downloader())
+    after = {p.name: p.stat().st_mtime_ns for p in part_dir.iterdir()}
+    assert after["2019.csv"] == before["2019.csv"] and after["2020.csv"] == before["2020.csv"]
+    assert after["2021.csv"] != before["2021.csv"]
+    assert "2019.csv" not in read and "2020.csv" not in read
+    full = cache.get("AAA", "2019-01-01", "2021-02-01", "1d", Downloader())
+    assert len(full) == len(pd.bdate_range("2019-01-01", "2021-01-31"))
+
+
+def test_legacy_single_file_is_migrated(cache):
+    storage = cache.storage
+    cache.get("AAA", "2020-06-01", "2020-07-01", "1d", Downloader())
+    part_dir = storage.price_cache_path("AAA", "1d")
+    legacy = pd.concat([storage._read(p, index=True) for p in sorted(part_dir.iterdir())])
+    for p in list(part_dir.iterdir()):
+        p.unlink()
+    part_dir.rmdir()
+    legacy.to_csv(part_dir.with_name(part_dir.name + ".csv"))
+
+    assert len(cache.get("AAA", "2020-06-01", "2020-07-01", "1d", Downloader())) == 22
+    cache.get("AAA", "2020-06-01", "2020-08-01", "1d", Downloader())
+    assert part_dir.is_dir() and not part_dir.with_name(part_dir.name + ".csv").exists()
+    assert len(cache.get("AAA", "2020-06-01", "2020-08-01", "1d", Downloader())) == len(
+        pd.bdate_range("2020-06-01", "2020-07-31"))
+
+
+def test_invalidate_all_intervals_waits_for_fill(cache):
+    cache.get("AAA", "2021-03-01", "2021-03-08", "1h", Downloader())
+    release, started = threading.Event(), threading.Event()
+
+    def slow(symbol, start, end, interval):
+        started.set()
+        release.wait(5)
+        return _bars(start, end)
+
+    filler = threading.Thread(target=cache.get, args=("AAA", "2021-03-01", "2021-04-01", "1d", slow))
+    filler.start()
+    assert started.wait(5)
+    done = threading.Event()
+    invalidator = threading.Thread(target=lambda: (cache.invalidate("AAA"), done.set()))
+    invalidator.start()
+    assert not done.wait(0.2)  # blocked on the 1d fill in flight
+    release.set()
+    filler.join(5)
+    invalidator.join(5)
+    assert done.is_set()
+    assert cache.covered_ranges("AAA", "1d") == [] and cache.covered_ranges("AAA", "1h") == []
+    assert cache.storage.load_price_cache("AAA", "1d") is None
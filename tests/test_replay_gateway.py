@@ -0,0 +1,77 @@
+"""ReplayDataGateway round trips: DataStorage price files in every format and recorded tick files."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.adapters.data import replay_gateway
+from deltafq.adapters.data.replay_gateway import ReplayDataGateway
+from deltafq.data import DataStorage
+from deltafq.live.models import TickData
+from deltafq.live.recorder import TickRecorder
+
+
+def _bars(n=25):
+    index = pd.date_range("2024-03-08 09:30", periods=n, freq="D", tz="America/New_York", name="Date")
+    close = 100 + np.arange(n, dtype=float)
+    return pd.DataFrame({"Open": close - 1, "High": close + 1, "Low": close - 2, "Close": close,
+                         "Volume": np.arange(n) * 10}, index=index)
+
+
+def _replay(path, symbol):
+    gateway = ReplayDataGateway(path)
+    ticks = []
+    gateway.set_tick_handler(ticks.append)
+    gateway.subscribe([symbol])
+    assert gateway.connect()
+    gateway.replay()
+    return ticks
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_price_file_round_trip(tmp_path, file_format):
+    bars = _bars()
+    storage = DataStorage(base_path=str(tmp_path), file_format=file_format)
+    path = storage.save_price_data(bars, "AAA", "2024-03-08", "2024-04-02")
+    ticks = _replay(path, "AAA")
+
+    expected = bars.index.tz_convert("UTC").tz_localize(None)  # DST change inside the range
+    assert [t.timestamp for t in ticks] == list(expected.to_pydatetime())
+    assert [t.price for t in ticks] == bars["Close"].tolist()
+    assert [t.volume for t in ticks] == bars["Volume"].tolist()
+    assert {t.source for t in ticks} == {"replay"}
+
+
+def test_tick_file_round_trip_in_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(replay_gateway, "_BLOCK", 4)  # several blocks, last one partial
+    path = tmp_path / "session.ticks"
+    recorder = TickRecorder(path, flush_size=3)
+    start = datetime(2024, 1, 2, 14, 30)
+    sent = [TickData(symbol="AAA" if i % 3 else "BBB", price=100 + i, timestamp=start + timedelta(seconds=i),
+                     volume=None if i == 5 else i, source="yfinance" if i % 2 else None) for i in range(11)]
+    for tick in sent:
+        recorder.record(tick)
+    recorder.close()
+
+    ticks = _replay(path, "AAA")
+    expected = [t for t in sent if t.symbol == "AAA"]
+    assert [(t.timestamp, t.price, t.volume) for t in ticks] == \
+        [(t.timestamp, t.price, t.volume) for t in expected]
+    assert [t.source for t in ticks] == [t.source or "replay" for t in expected]
+
+
+def test_stop_ends_replay_between_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(replay_gateway, "_BLOCK", 2)
+    storage = DataStorage(base_path=str(tmp_path), file_format="csv")
+    path = storage.save_price_data(_bars(), "AAA", "2024-03-08", "2024-04-02")
+    gateway = ReplayDataGateway(path)
+    gateway.subscribe(["AAA"])
+
+    def handler(tick):
+        if gateway.replayed == 4:  # fifth tick: stop in the middle of the third block
+            gateway.stop()
+
+    gateway.set_tick_handler(handler)
+    assert gateway.replay() == 5
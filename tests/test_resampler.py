@@ -0,0 +1,59 @@
+"""BarResampler aggregation and output cache tests."""
+
+import numpy as np
+import pandas as pd
+
+from deltafq.data.resampler import BarResampler
+
+
+def _minutes(n=120):
+    index = pd.date_range("2024-03-04 09:30", periods=n, freq="min", tz="America/New_York", name="Datetime")
+    close = 100 + np.arange(n) * 0.1
+    return pd.DataFrame({"Open": close - 0.05, "High": close + 0.2, "Low": close - 0.2, "Close": close,
+                         "Volume": np.full(n, 100.0)}, index=index)
+
+
+def test_aggregates_ohlcv_per_bucket():
+    bars = _minutes()
+    out = BarResampler(session_start="09:30").resample(bars, "5m")
+    assert len(out) == 24
+    first = bars.iloc[:5]
+    row = out.iloc[0]
+    assert out.index[0] == bars.index[0]
+    assert row["Open"] == first["Open"].iloc[0]
+    assert row["High"] == first["High"].max()
+    assert row["Low"] == first["Low"].min()
+    assert row["Close"] == first["Close"].iloc[-1]
+    assert row["Volume"] == first["Volume"].sum()
+
+
+def test_repeated_request_is_cached():
+    bars = _minutes()
+    resampler = BarResampler(session_start="09:30")
+    a = resampler.resample(bars, "15m")
+    b = resampler.resample(bars.copy(), "15m")
+    pd.testing.assert_frame_equal(a, b)
+    assert (resampler.hits, resampler.misses) == (1, 1)
+
+
+def test_forming_bar_update_without_close_change_is_not_stale():
+    bars = _minutes()
+    resampler = BarResampler(session_start="09:30")
+    before = resampler.resample(bars, "15m")
+
+    for column, value in (("High", 500.0), ("Low", 1.0), ("Volume", 9_999.0)):
+        moved = bars.copy()
+        moved.iloc[-1, moved.columns.get_loc(column)] = value
+        after = resampler.resample(moved, "15m")
+        expected = BarResampler(session_start="09:30").resample(moved, "15m")
+        pd.testing.assert_frame_equal(after, expected)
+        assert not after.equals(before)
+
+
+def test_nan_in_last_row_still_hits_cache():
+    bars = _minutes()
+    bars.iloc[-1, bars.columns.get_loc("Volume")] = np.nan
+    resampler = BarResampler(session_start="09:30")
+    resampler.resample(bars, "1h")
+    resampler.resample(bars.copy(), "1h")
+    assert resampler.hits == 1
@@ -0,0 +1,81 @@
+"""Shared-memory tick bus: ring wrap-around, lagging readers and reader start positions."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from deltafq.live.models import TickData
+from deltafq.live.shm_bus import SharedMemoryTickPublisher, SharedMemoryTickReader
+
+
+def _tick(i):
+    return TickData(symbol="AAA", price=100.0 + i, timestamp=datetime(2024, 1, 2, 9, 30) + timedelta(seconds=i),
+                    volume=i, source="test")
+
+
+@pytest.fixture
+def bus():
+    publisher = SharedMemoryTickPublisher(f"dfq_test_{uuid.uuid4().hex[:12]}", capacity=8)
+    readers = []
+
+    def attach(**kwargs):
+        reader = SharedMemoryTickReader(publisher.bus_name, **kwargs)
+        readers.append(reader)
+        return reader
+
+    yield publisher, attach
+    for reader in readers:
+        reader.close()
+    publisher.close()
+
+
+def test_reader_follows_writer_across_wrap_around(bus):
+    publisher, attach = bus
+    reader = attach()
+    received = []
+    for i in range(1, 31):  # almost four laps of the 8-slot ring
+        publisher.publish(_tick(i))
+        if i % 5 == 0:
+            received += reader.poll()
+    received += reader.poll()
+    assert [t.price for t in received] == [100.0 + i for i in range(1, 31)]
+    assert received[-1] == _tick(30)
+    assert reader.lost == 0
+
+
+def test_lagging_reader_skips_overwritten_ticks(bus):
+    publisher, attach = bus
+    reader = attach()
+    for i in range(1, 21):
+        publisher.publish(_tick(i))
+    received = reader.poll()
+    assert [t.volume for t in received] == list(range(13, 21))  # only the newest `capacity` survive
+    assert reader.lost == 12
+    publisher.publish(_tick(21))
+    assert [t.volume for t in reader.poll()] == [21]
+    assert reader.lost == 12
+
+
+def test_partial_poll_then_overrun(bus):
+    publisher, attach = bus
+    reader = attach()
+    for i in range(1, 6):
+        publisher.publish(_tick(i))
+    assert [t.volume for t in reader.poll(max_items=2)] == [1, 2]
+    for i in range(6, 16):
+        publisher.publish(_tick(i))
+    assert [t.volume for t in reader.poll()] == list(range(8, 16))
+    assert reader.lost == 5  # ticks 3..7 were overwritten unread
+
+
+def test_reader_positions(bus):
+    publisher, attach = bus
+    for i in range(1, 11):
+        publisher.publish(_tick(i))
+    assert [t.volume for t in attach(from_start=True).poll()] == list(range(3, 11))
+    late = attach()
+    assert late.poll() == []
+    publisher.publish(_tick(11))
+    assert [t.volume for t in late.poll()] == [11]
+
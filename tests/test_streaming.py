@@ -0,0 +1,69 @@
+"""Streaming indicators must match the batch TechnicalIndicators, including around missing values."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deltafq.indicators import StreamingBOLL, StreamingEMA, StreamingSMA, TechnicalIndicators
+
+
+def _prices(n=300, seed=5):
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, n))))
+
+
+def _with_gaps(series):
+    """Leading NaN, isolated NaNs and a run of NaNs longer than a typical window."""
+    data = series.copy()
+    data.iloc[[0, 1, 40, 41, 97, 150]] = np.nan
+    data.iloc[200:230] = np.nan
+    return data
+
+
+def _stream(indicator, data):
+    return [indicator.update(x) for x in data]
+
+
+@pytest.mark.parametrize("method", ["pandas", "talib"])
+@pytest.mark.parametrize("gaps", [False, True])
+def test_ema_matches_batch(method, gaps):
+    data = _prices()
+    if gaps:
+        data = _with_gaps(data)
+    expected = TechnicalIndicators().ema(data, 12, method=method)
+    result = pd.Series(_stream(StreamingEMA(12, method=method), data))
+    pd.testing.assert_series_equal(result, expected, check_names=False, rtol=1e-10)
+
+
+@pytest.mark.parametrize("method", ["sample", "population"])
+@pytest.mark.parametrize("gaps", [False, True])
+def test_boll_matches_batch(method, gaps):
+    data = _prices()
+    if gaps:
+        data = _with_gaps(data)
+    expected = TechnicalIndicators().boll(data, 20, method=method)
+    result = pd.DataFrame(_stream(StreamingBOLL(20, method=method), data))
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-8)
+
+
+def test_nan_does_not_poison_later_outputs():
+    data = _with_gaps(_prices())
+    ema, boll, sma = StreamingEMA(12), StreamingBOLL(20), StreamingSMA(20)
+    for x in data:
+        ema.update(x)
+        boll.update(x)
+        sma.update(x)
+    assert ema.ready and boll.ready and sma.ready
+
+
+def test_infinite_input_is_treated_as_missing():
+    data = _prices()
+    bad = data.copy()
+    bad.iloc[50] = np.inf
+    missing = data.copy()
+    missing.iloc[50] = np.nan
+    for make in (lambda: StreamingEMA(12), lambda: StreamingBOLL(20), lambda: StreamingSMA(20)):
+        assert _stream(make(), bad)[-1] == _stream(make(), missing)[-1]
+    assert math.isfinite(_stream(StreamingSMA(20), bad)[-1])